@@ -13,6 +13,19 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# --gc and --queue-status print a JSON report on stdout; everything else
+# (banners, dependency checks, logs) goes to stderr so the report parses
+REPORT_FD=1
+for arg in "$@"; do
+    case "$arg" in
+        --gc|--queue-status)
+            exec 3>&1 1>&2
+            REPORT_FD=3
+            break
+            ;;
+    esac
+done
+
 echo -e "${BLUE}════════════════════════════════════════════════════════════════${NC}"
 echo -e "${BLUE}  VIDEO PRODUCTION AGENT${NC}"
 echo -e "${BLUE}  Autonomous MP4 generation from repository scripts${NC}"
@@ -145,7 +158,7 @@ echo -e "${BLUE}═════════════════════
 echo
 
 cd "${SCRIPT_DIR}/video_production"
-python3 orchestrator.py
+python3 orchestrator.py "$@" >&"$REPORT_FD"
 
 EXIT_CODE=$?
 
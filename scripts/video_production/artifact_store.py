@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Artifact Store Module
+Tracks intermediate files under the output directory and keeps them within a quota.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_hash ON artifacts (hash);
+CREATE TABLE IF NOT EXISTS pins (
+    script TEXT NOT NULL,
+    path TEXT NOT NULL,
+    output INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (script, path)
+);
+"""
+
+# Directories (relative to the output directory) holding intermediates;
+# draft renders keep their visuals, still GOPs and shared clips under draft/
+MANAGED_DIRS = (
+    "audio", "visuals", ".still_gops", "scene_cache",
+    "draft/visuals", "draft/.still_gops", "draft/scene_cache",
+)
+
+# Scene clips kept next to the final videos
+SCENE_CLIP = re.compile(r".+_scene\d+\.mp4$")
+
+MB = 1024 * 1024
+
+# Index, list and in-progress files are bookkeeping, not artifacts
+BOOKKEEPING_SUFFIXES = (".json", ".csv", ".txt", ".tmp")
+
+
+class ArtifactStore:
+    """
+    Content-hashed inventory of the intermediates in an output directory.
+
+    Every narration, visual, demo capture, still GOP and kept scene clip is
+    recorded with its content hash and the last time a render used it.
+    Files with the same hash (e.g. narration hard-linked into the cache)
+    form one artifact: it is as recent as its most recently used copy,
+    its size counts once per inode, and it is evicted as a whole.
+
+    Artifacts used by each script's latest successful render are pinned
+    and never evicted. Untracked files found on disk count as last used
+    at their modification time.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        quota_bytes: Optional[int] = None,
+        grace_seconds: float = 60.0
+    ):
+        """
+        Open (and if needed create) the store's index.
+
+        Args:
+            root: Output directory (VIDEO_OUT_DIR)
+            quota_bytes: Size budget for unpinned and pinned artifacts
+                together (None for no limit)
+            grace_seconds: Files modified this recently are never evicted,
+                so a render running in another process keeps its inputs
+        """
+        self.root = Path(root).absolute()
+        self.quota_bytes = quota_bytes
+        self.grace_seconds = grace_seconds
+        self.path = self.root / "artifacts.db"
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), timeout=60, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock:
+            self._db.executescript(SCHEMA)
+
+    def touch(self, paths: Iterable[str]) -> None:
+        """Record that a render used these files (non-artifacts are ignored)."""
+        now = time.time()
+        with self._lock, self._db:
+            for path in paths:
+                relative = self._relative(path)
+                if relative is None:
+                    continue
+                try:
+                    stat = os.stat(self.root / relative)
+                except OSError:
+                    continue
+                self._record(relative, stat, now)
+
+    def pin(self, script_name: str, outputs: Iterable[str], artifacts: Iterable[str]) -> None:
+        """
+        Pin the artifacts behind a script's latest output, replacing its old pins.
+
+        Args:
+            script_name: Script whose render finished
+            outputs: Final video, renditions and playlists; once none of them
+                exists any more the script's pins lapse
+            artifacts: Intermediates the render used
+        """
+        rows = [(script_name, str(Path(p).absolute()), 1) for p in outputs if p]
+        rows += [(script_name, relative, 0) for relative in map(self._relative, artifacts) if relative]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM pins WHERE script = ?", (script_name,))
+            self._db.executemany("INSERT OR IGNORE INTO pins (script, path, output) VALUES (?, ?, ?)", rows)
+
+    def enforce_quota(self) -> Dict:
+        """Evict least recently used unpinned artifacts until the store fits its quota."""
+        return self.gc(max_age_seconds=None)
+
+    def gc(self, max_age_seconds: Optional[float] = None) -> Dict:
+        """
+        Reconcile the index with the disk and evict artifacts.
+
+        Unpinned artifacts unused for longer than max_age_seconds are
+        removed, then least recently used ones until the quota is met.
+
+        Args:
+            max_age_seconds: Age beyond which unpinned artifacts are garbage
+                (None keeps them unless the quota needs the space)
+
+        Returns:
+            Report with "artifacts", "files", "total_bytes", "pinned_bytes",
+            "evicted_files", "reclaimed_bytes" and "over_quota"
+        """
+        now = time.time()
+        with self._lock, self._db:
+            files = self._sync(now)
+            pinned = self._pinned_paths()
+
+        artifacts: Dict[str, Dict] = {}
+        for relative, info in files.items():
+            artifact = artifacts.setdefault(info["hash"], {
+                "paths": [], "inodes": {}, "last_access": 0.0, "modified": 0.0, "pinned": False
+            })
+            artifact["paths"].append(relative)
+            artifact["inodes"][(info["stat"].st_dev, info["stat"].st_ino)] = info["stat"].st_size
+            artifact["last_access"] = max(artifact["last_access"], info["last_access"])
+            artifact["modified"] = max(artifact["modified"], info["stat"].st_mtime)
+            artifact["pinned"] = artifact["pinned"] or relative in pinned
+
+        sizes = {digest: sum(a["inodes"].values()) for digest, a in artifacts.items()}
+        total = sum(sizes.values())
+        report = {
+            "artifacts": len(artifacts),
+            "files": len(files),
+            "total_bytes": total,
+            "pinned_bytes": sum(sizes[d] for d, a in artifacts.items() if a["pinned"]),
+            "quota_bytes": self.quota_bytes,
+            "evicted_files": 0,
+            "reclaimed_bytes": 0,
+        }
+
+        evicted: List[str] = []
+        for digest, artifact in sorted(artifacts.items(), key=lambda item: item[1]["last_access"]):
+            if artifact["pinned"] or now - artifact["modified"] < self.grace_seconds:
+                continue
+            expired = max_age_seconds is not None and now - artifact["last_access"] > max_age_seconds
+            over_quota = self.quota_bytes is not None and total > self.quota_bytes
+            if not (expired or over_quota):
+                continue
+            for relative in artifact["paths"]:
+                try:
+                    (self.root / relative).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not evict {relative}: {e}")
+                    continue
+                evicted.append(relative)
+            total -= sizes[digest]
+            report["reclaimed_bytes"] += sizes[digest]
+
+        if evicted:
+            with self._lock, self._db:
+                self._db.executemany("DELETE FROM artifacts WHERE path = ?", [(p,) for p in evicted])
+            logger.info(
+                f"Evicted {len(evicted)} artifact file(s), reclaimed {report['reclaimed_bytes'] / MB:.1f} MB"
+            )
+        report["evicted_files"] = len(evicted)
+        report["total_bytes"] = total
+        report["over_quota"] = self.quota_bytes is not None and total > self.quota_bytes
+        if report["over_quota"]:
+            logger.warning(
+                f"Artifacts use {total / MB:.1f} MB, over the {self.quota_bytes / MB:.1f} MB quota; "
+                f"the rest is pinned or in use"
+            )
+        return report
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._db.close()
+
+    def _sync(self, now: float) -> Dict[str, Dict]:
+        """
+        Bring the index in line with the managed files on disk (lock held).
+
+        Returns:
+            {relative path: {"stat", "hash", "last_access"}} of every artifact file
+        """
+        rows = {row["path"]: row for row in self._db.execute("SELECT * FROM artifacts")}
+        files = {}
+        for path in self._managed_files():
+            relative = path.relative_to(self.root).as_posix()
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            row = rows.get(relative)
+            if row is None or (row["size"], row["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                digest = self._record(relative, stat, None, row)
+                last_access = max(row["last_access"] if row else 0.0, stat.st_mtime)
+            else:
+                digest, last_access = row["hash"], row["last_access"]
+            files[relative] = {"stat": stat, "hash": digest, "last_access": last_access}
+
+        gone = [(path,) for path in rows if path not in files]
+        self._db.executemany("DELETE FROM artifacts WHERE path = ?", gone)
+
+        # Pins lapse once none of a script's outputs exists
+        for (script,) in self._db.execute("SELECT DISTINCT script FROM pins").fetchall():
+            outputs = [r["path"] for r in self._db.execute(
+                "SELECT path FROM pins WHERE script = ? AND output = 1", (script,)
+            )]
+            if outputs and not any(os.path.exists(p) for p in outputs):
+                logger.info(f"Outputs of {script} are gone, unpinning its artifacts")
+                self._db.execute("DELETE FROM pins WHERE script = ?", (script,))
+        return files
+
+    def _record(self, relative: str, stat: os.stat_result, accessed: Optional[float], row=None) -> str:
+        """Insert or refresh an artifact row, hashing the file if it changed (lock held)."""
+        if row is None:
+            row = self._db.execute("SELECT * FROM artifacts WHERE path = ?", (relative,)).fetchone()
+        if row is not None and (row["size"], row["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            digest = row["hash"]
+        else:
+            digest = self._hash(self.root / relative)
+        last_access = accessed or max(row["last_access"] if row else 0.0, stat.st_mtime)
+        self._db.execute(
+            "INSERT OR REPLACE INTO artifacts (path, hash, size, mtime_ns, last_access) VALUES (?, ?, ?, ?, ?)",
+            (relative, digest, stat.st_size, stat.st_mtime_ns, last_access)
+        )
+        return digest
+
+    def _pinned_paths(self) -> set:
+        """Relative paths of every pinned artifact (lock held)."""
+        return {row["path"] for row in self._db.execute("SELECT path FROM pins WHERE output = 0")}
+
+    def _managed_files(self) -> Iterator[Path]:
+        """Every artifact file currently on disk."""
+        for directory in MANAGED_DIRS:
+            for dirpath, _, names in os.walk(self.root / directory):
+                for name in names:
+                    if self._is_artifact_name(name):
+                        yield Path(dirpath) / name
+        for base in (self.root, self.root / "draft"):
+            if base.is_dir():
+                for entry in os.scandir(base):
+                    if entry.is_file() and SCENE_CLIP.match(entry.name):
+                        yield Path(entry.path)
+
+    def _relative(self, path: Optional[str]) -> Optional[str]:
+        """Path relative to the root if it names an artifact, else None."""
+        if not path:
+            return None
+        try:
+            relative = Path(path).absolute().relative_to(self.root)
+        except ValueError:
+            return None
+        parts = relative.parts
+        if not self._is_artifact_name(relative.name):
+            return None
+        if any(relative.as_posix().startswith(d + "/") for d in MANAGED_DIRS):
+            return relative.as_posix()
+        if SCENE_CLIP.match(relative.name) and (len(parts) == 1 or (len(parts) == 2 and parts[0] == "draft")):
+            return relative.as_posix()
+        return None
+
+    @staticmethod
+    def _is_artifact_name(name: str) -> bool:
+        """Whether a file name is an artifact rather than bookkeeping or a partial write."""
+        return not name.endswith(BOOKKEEPING_SUFFIXES) and ".tmp." not in name
+
+    @staticmethod
+    def _hash(path: Path) -> str:
+        """Content hash of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
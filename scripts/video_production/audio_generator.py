@@ -4,29 +4,53 @@ Audio Generator Module
 Generates narration audio from script text using local TTS.
 """
 
+import hashlib
 import os
+import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 import logging
 
+from ffmpeg_progress import ProgressTracker
+from log_routing import log_context
+from process_runner import command_available, run_process
+from run_journal import SceneCheckpoint, fingerprint
+from tracing import get_tracer
+
 logger = logging.getLogger(__name__)
 
 
 class AudioGenerator:
     """Generates narration audio using local text-to-speech."""
     
-    def __init__(self, output_dir: str, voice_mode: str = "local_tts"):
+    def __init__(
+        self,
+        output_dir: str,
+        voice_mode: str = "local_tts",
+        progress: Optional[ProgressTracker] = None,
+        checkpoint: Optional[SceneCheckpoint] = None
+    ):
         """
         Initialize the audio generator.
         
         Args:
             output_dir: Directory to save audio files
             voice_mode: TTS mode (local_tts, gtts, etc.)
+            progress: Tracker that runs FFmpeg jobs and collects their metrics
+            checkpoint: Run journal view that records (and on resume restores)
+                each scene's narration
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.voice_mode = voice_mode
+        self.progress = progress or ProgressTracker()
+        self.checkpoint = checkpoint or SceneCheckpoint()
+        # Narration cache shared by draft and full renders
+        self.cache_dir = self.output_dir / "cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_hits = 0
         
     def generate_from_scenes(self, scenes: list, script_name: str) -> list:
         """
@@ -42,39 +66,96 @@ class AudioGenerator:
         audio_files = []
         
         for scene in scenes:
-            scene_num = scene['scene_num']
-            content = scene['content']
-            
-            if not content.strip():
-                logger.warning(f"Scene {scene_num} has no narration, skipping")
-                continue
-                
-            output_file = self.output_dir / f"{script_name}_scene{scene_num:02d}.wav"
+            with get_tracer().span("narration", "scene", scene_num=scene['scene_num']), \
+                    log_context(scene=scene['scene_num']):
+                entry = self.checkpoint.unit(
+                    "audio", scene['scene_num'],
+                    fingerprint(self.voice_mode, scene['content']),
+                    lambda: self._generate_scene(scene, script_name)
+                )
+            if entry:
+                audio_files.append(entry)
+        
+        return audio_files
+    
+    def _generate_scene(self, scene: dict, script_name: str) -> Optional[dict]:
+        """
+        Generate (or reuse) the narration for one scene.
+        
+        Args:
+            scene: Scene dictionary from script parser
+            script_name: Base name for output files
             
-            logger.info(f"Generating audio for scene {scene_num}...")
-            success = self._generate_audio(content, str(output_file))
+        Returns:
+            Audio file info dict, or None if no audio was produced
+        """
+        scene_num = scene['scene_num']
+        content = scene['content']
+        
+        if not content.strip():
+            logger.warning(f"Scene {scene_num} has no narration, skipping")
+            return None
             
+        output_file = self.output_dir / f"{script_name}_scene{scene_num:02d}.wav"
+        cache_file = self._cache_path(content)
+        
+        if cache_file.exists() and self._link_or_copy(cache_file, output_file):
+            self.cache_hits += 1
+            logger.info(f"  ✓ Reused cached narration for scene {scene_num}")
+            return {
+                "scene_num": scene_num,
+                "path": str(output_file),
+                "duration": self._get_audio_duration(str(output_file))
+            }
+        
+        # Never write through a stale hard link into another cache entry
+        if output_file.exists():
+            output_file.unlink()
+        
+        logger.info(f"Generating audio for scene {scene_num}...")
+        success = self._generate_audio(content, str(output_file))
+        
+        if success:
+            self._link_or_copy(output_file, cache_file)
+            logger.info(f"  ✓ Created {output_file.name}")
+            return {
+                "scene_num": scene_num,
+                "path": str(output_file),
+                "duration": self._get_audio_duration(str(output_file))
+            }
+        else:
+            logger.error(f"  ✗ Failed to generate audio for scene {scene_num}")
+            # Retry with smaller chunks
+            logger.info(f"  Retrying with smaller chunks...")
+            success = self._generate_audio_chunked(content, str(output_file))
             if success:
-                audio_files.append({
+                self._link_or_copy(output_file, cache_file)
+                logger.info(f"  ✓ Created {output_file.name} (chunked)")
+                return {
                     "scene_num": scene_num,
                     "path": str(output_file),
                     "duration": self._get_audio_duration(str(output_file))
-                })
-                logger.info(f"  ✓ Created {output_file.name}")
-            else:
-                logger.error(f"  ✗ Failed to generate audio for scene {scene_num}")
-                # Retry with smaller chunks
-                logger.info(f"  Retrying with smaller chunks...")
-                success = self._generate_audio_chunked(content, str(output_file))
-                if success:
-                    audio_files.append({
-                        "scene_num": scene_num,
-                        "path": str(output_file),
-                        "duration": self._get_audio_duration(str(output_file))
-                    })
-                    logger.info(f"  ✓ Created {output_file.name} (chunked)")
-        
-        return audio_files
+                }
+        return None
+    
+    def _cache_path(self, text: str) -> Path:
+        """Return the cache location for narration of the given text."""
+        key = hashlib.sha256(f"{self.voice_mode}\n{text}".encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / f"{key}.wav"
+    
+    def _link_or_copy(self, source: Path, target: Path) -> bool:
+        """Hard-link source to target, copying if linking is not possible."""
+        try:
+            if target.exists():
+                target.unlink()
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not cache narration {source.name}: {e}")
+            return False
     
     def _generate_audio(self, text: str, output_path: str, retry: bool = True) -> bool:
         """
@@ -171,11 +252,11 @@ class AudioGenerator:
                 "-f", str(temp_text),
                 "-w", output_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            success = self._run_tts(cmd, text, output_path)
             
             temp_text.unlink()
             
-            return result.returncode == 0 and Path(output_path).exists()
+            return success
         except Exception as e:
             logger.error(f"espeak-ng error: {e}")
             return False
@@ -184,8 +265,7 @@ class AudioGenerator:
         """Generate audio using pico2wave."""
         try:
             cmd = ["pico2wave", "-w", output_path, text]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            return result.returncode == 0 and Path(output_path).exists()
+            return self._run_tts(cmd, text, output_path)
         except Exception as e:
             logger.error(f"pico2wave error: {e}")
             return False
@@ -208,21 +288,39 @@ class AudioGenerator:
                 "--batch",
                 f'(utt.save.wave (utt.synth (Utterance Text (load "{temp_text_str}" t))) "{output_path_str}" "riff")'
             ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            success = self._run_tts(cmd, text, output_path)
             
             if temp_text.exists():
                 temp_text.unlink()
             
-            return result.returncode == 0 and Path(output_path).exists()
+            return success
         except Exception as e:
             logger.error(f"festival error: {e}")
             return False
     
+    def _run_tts(self, cmd: list, text: str, output_path: str) -> bool:
+        """
+        Run a TTS engine with a deadline sized from the narration length.
+        
+        Successful runs feed the timeout policy's throughput history; a kill
+        is recorded as a timeout rather than an ordinary failure.
+        """
+        timeouts = self.progress.timeouts
+        timeout = timeouts.deadline("tts", len(text))
+        label = f"{cmd[0]} {Path(output_path).stem}"
+        start = time.perf_counter()
+        try:
+            with get_tracer().span(cmd[0], "subprocess", label=label, characters=len(text)):
+                result = run_process(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.progress.record_kill("tts", label, timeout, len(text))
+            return False
+        
+        success = result.returncode == 0 and Path(output_path).exists()
+        if success:
+            timeouts.observe("tts", len(text), time.perf_counter() - start)
+        return success
+    
     def _generate_with_gtts(self, text: str, output_path: str) -> bool:
         """Generate audio using Google Text-to-Speech (requires internet)."""
         try:
@@ -239,7 +337,7 @@ class AudioGenerator:
                     "-ar", "48000", "-ac", "2",
                     output_path
                 ]
-                result = subprocess.run(cmd, capture_output=True, timeout=60)
+                result = self.progress.run(cmd, label=f"convert {Path(output_path).stem}", kind="remux")
                 temp_mp3.unlink()
                 return result.returncode == 0
             else:
@@ -270,7 +368,7 @@ class AudioGenerator:
                 "-c", "copy",
                 output_path
             ]
-            result = subprocess.run(cmd, capture_output=True, timeout=120)
+            result = self.progress.run(cmd, label=f"concat {Path(output_path).stem}", kind="remux")
             
             concat_file.unlink()
             
@@ -291,7 +389,7 @@ class AudioGenerator:
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 audio_path
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = run_process(cmd, capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
                 return float(result.stdout.strip())
         except:
@@ -300,12 +398,4 @@ class AudioGenerator:
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available."""
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+        return command_available(command)
@@ -0,0 +1 @@
+"""Video Production Benchmarks"""
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Assembly Mode Benchmark
+Compares per-scene assembly against single-invocation filtergraph assembly.
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Add the video_production directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.common import add_common_arguments, finish, measure, use_stand_ins
+from video_assembler import VideoAssembler
+
+
+def make_card(work_dir: Path, resolution: str) -> Path:
+    """Create a single title-card image with an FFmpeg test source."""
+    image = work_dir / "card.png"
+    subprocess.run(
+        ["ffmpeg", "-y", "-f", "lavfi", "-i", f"color=c=0x1f2937:s={resolution}",
+         "-frames:v", "1", str(image)],
+        capture_output=True, check=True
+    )
+    return image
+
+
+def make_inputs(work_dir: Path, scene_count: int, scene_seconds: float, resolution: str) -> tuple:
+    """
+    Create synthetic scene inputs with FFmpeg test sources.
+
+    Args:
+        work_dir: Directory for the generated files
+        scene_count: Number of scenes
+        scene_seconds: Narration length of each scene
+        resolution: Image resolution
+
+    Returns:
+        Tuple of (scenes, audio_files, visual_files)
+    """
+    image = make_card(work_dir, resolution)
+
+    scenes, audio_files, visual_files = [], [], []
+    for n in range(1, scene_count + 1):
+        audio = work_dir / f"scene{n:03d}.wav"
+        subprocess.run(
+            ["ffmpeg", "-y", "-f", "lavfi",
+             "-i", f"sine=frequency={200 + n}:duration={scene_seconds}",
+             "-ar", "48000", "-ac", "2", str(audio)],
+            capture_output=True, check=True
+        )
+        scenes.append({"scene_num": n, "heading": f"Scene {n}"})
+        audio_files.append({"scene_num": n, "path": str(audio), "duration": scene_seconds})
+        visual_files.append({"scene_num": n, "path": str(image), "type": "title_card", "duration": None})
+
+    return scenes, audio_files, visual_files
+
+
+def run_benchmark(
+    scene_counts: List[int],
+    scene_seconds: float,
+    resolution: str,
+    fps: int,
+    repeat: int = 1
+) -> Dict[str, Dict]:
+    """
+    Time both assembly modes for each scene count.
+
+    Returns:
+        {"assembly/<mode>/<scenes>": timing statistics}
+    """
+    cases = {}
+    for scene_count in scene_counts:
+        work_dir = Path(tempfile.mkdtemp(prefix="assembly_bench_"))
+        try:
+            inputs = make_inputs(work_dir, scene_count, scene_seconds, resolution)
+            for mode in ("per_scene", "filtergraph"):
+                mode_dir = work_dir / mode
+
+                def assemble() -> bool:
+                    assembler = VideoAssembler(str(mode_dir), resolution, fps, mode=mode)
+                    return bool(assembler.assemble("bench", *inputs))
+
+                def reset() -> None:
+                    shutil.rmtree(mode_dir, ignore_errors=True)
+
+                case = f"assembly/{mode}/{scene_count}"
+                cases[case] = measure(assemble, repeat, reset)
+                print(f"{scene_count:>4} scenes  {mode:<12} {cases[case]['median']:8.2f}s"
+                      f"{'' if cases[case]['success'] else '  (failed)'}")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return cases
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenes", default="5,20,100", help="Comma-separated scene counts")
+    parser.add_argument("--scene-seconds", type=float, default=3.0, help="Narration length per scene")
+    parser.add_argument("--resolution", default="1920x1080")
+    parser.add_argument("--fps", type=int, default=30)
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.tools == "stand-in":
+        use_stand_ins()
+    scene_counts = [int(n) for n in args.scenes.split(",") if n.strip()]
+    cases = run_benchmark(scene_counts, args.scene_seconds, args.resolution, args.fps, args.repeat)
+    parameters = {
+        "scenes": scene_counts, "scene_seconds": args.scene_seconds,
+        "resolution": args.resolution, "fps": args.fps, "repeat": args.repeat,
+    }
+    sys.exit(finish(args, cases, parameters))
+
+
+if __name__ == '__main__':
+    main()
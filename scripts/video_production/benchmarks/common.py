@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark Support
+Stand-in tool selection, repeated timing and baseline comparison shared by
+the benchmark scripts.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+STAND_IN_DIR = Path(__file__).parent / "stand_ins"
+
+# Welch's t above this is treated as a real difference (about 95% for the
+# handful of repeats a benchmark run makes)
+T_CRITICAL = 2.0
+
+
+def use_stand_ins() -> None:
+    """
+    Put the stand-in espeak-ng, ffmpeg and ffprobe first on PATH.
+
+    Every child process started afterwards (including `which` checks)
+    resolves these names to the stand-ins.
+    """
+    os.environ["PATH"] = f"{STAND_IN_DIR}{os.pathsep}{os.environ.get('PATH', '')}"
+
+
+def add_common_arguments(parser) -> None:
+    """Add the options every benchmark script accepts."""
+    parser.add_argument("--tools", choices=("real", "stand-in"), default="real",
+                        help="Run against installed tools or the deterministic stand-ins")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against this results file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown of the median that counts as a regression")
+
+
+def measure(fn: Callable[[], bool], repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Time a case several times.
+
+    Args:
+        fn: The timed work; returns whether it succeeded
+        repeat: Number of timed runs
+        setup: Untimed preparation run before each timed run
+
+    Returns:
+        Timing statistics of the runs (see summarize)
+    """
+    samples, success = [], True
+    for _ in range(max(1, repeat)):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        ok = fn()
+        samples.append(time.perf_counter() - start)
+        success = success and bool(ok)
+    return {**summarize(samples), "success": success}
+
+
+def summarize(samples: List[float]) -> Dict:
+    """Median, mean, standard deviation and range of timing samples."""
+    return {
+        "samples": [round(s, 4) for s in samples],
+        "median": round(statistics.median(samples), 4),
+        "mean": round(statistics.fmean(samples), 4),
+        "stdev": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+        "min": round(min(samples), 4),
+        "max": round(max(samples), 4),
+    }
+
+
+def results_document(cases: Dict[str, Dict], tools: str, parameters: Dict) -> Dict:
+    """Wrap case results with the metadata needed to interpret them later."""
+    return {
+        "created": datetime.now().isoformat(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "tools": tools,
+        "parameters": parameters,
+        "cases": cases,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    Compare each case with the baseline.
+
+    A case regresses when its median is more than `threshold` slower and
+    Welch's t-test on the samples says the difference is not noise (with a
+    single sample per side only the threshold applies). A case that used to
+    succeed and now fails is always a regression.
+
+    Returns:
+        One entry per case with "case", "status" ("regression",
+        "improvement", "unchanged", "new" or "missing"), "change" and "t"
+    """
+    comparisons = []
+    old_cases = baseline.get("cases", {})
+    new_cases = current.get("cases", {})
+
+    for case in sorted(set(old_cases) | set(new_cases)):
+        old, new = old_cases.get(case), new_cases.get(case)
+        if old is None or new is None:
+            comparisons.append({"case": case, "status": "new" if old is None else "missing",
+                                "change": None, "t": None})
+            continue
+
+        change = (new["median"] - old["median"]) / old["median"] if old["median"] > 0 else 0.0
+        t = _welch_t(old["samples"], new["samples"])
+        significant = t is None or abs(t) >= T_CRITICAL
+
+        if old.get("success", True) and not new.get("success", True):
+            status = "regression"
+        elif change > threshold and significant:
+            status = "regression"
+        elif change < -threshold and significant:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append({
+            "case": case,
+            "status": status,
+            "baseline_median": old["median"],
+            "median": new["median"],
+            "change": round(change, 4),
+            "t": round(t, 2) if t is not None else None,
+        })
+    return comparisons
+
+
+def _welch_t(old: List[float], new: List[float]) -> Optional[float]:
+    """Welch's t statistic of new versus old (positive means slower)."""
+    if len(old) < 2 or len(new) < 2:
+        return None
+    error = math.sqrt(statistics.variance(old) / len(old) + statistics.variance(new) / len(new))
+    difference = statistics.fmean(new) - statistics.fmean(old)
+    if error == 0:
+        return math.copysign(math.inf, difference) if difference else 0.0
+    return difference / error
+
+
+def finish(args, cases: Dict[str, Dict], parameters: Dict) -> int:
+    """
+    Write the results and check them against the baseline.
+
+    Returns:
+        Process exit code: 1 if any case regressed, else 0
+    """
+    document = results_document(cases, args.tools, parameters)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get("tools") != args.tools:
+        print(f"Warning: baseline used {baseline.get('tools')} tools, this run used {args.tools}")
+
+    comparisons = compare(document, baseline, args.threshold)
+    print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+    for entry in comparisons:
+        if entry["change"] is None:
+            print(f"  {entry['status']:<11} {entry['case']}")
+        else:
+            t = f"t={entry['t']}" if entry["t"] is not None else "t=n/a"
+            print(f"  {entry['status']:<11} {entry['case']:<40} "
+                  f"{entry['baseline_median']:.3f}s -> {entry['median']:.3f}s "
+                  f"({entry['change']:+.1%}, {t})")
+
+    regressions = [entry for entry in comparisons if entry["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
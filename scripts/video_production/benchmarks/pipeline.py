@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+Times each production stage in isolation and the whole pipeline end to end
+on synthetic scripts, against real tools or deterministic stand-ins.
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+# Add the video_production directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.assembly_modes import make_card
+from benchmarks.common import add_common_arguments, finish, measure, use_stand_ins
+from benchmarks.synthetic_scripts import FORMS, write_script
+
+STAGES = ("parse", "audio", "visuals", "assembly", "end_to_end")
+
+
+def _reset(directory: Path) -> None:
+    """Empty a directory so every timed run starts cold."""
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+
+
+def run_benchmark(
+    forms: List[str],
+    scene_counts: List[int],
+    stages: List[str],
+    words: int,
+    resolution: str,
+    fps: int,
+    repeat: int
+) -> Dict[str, Dict]:
+    """
+    Time the selected stages for every script form and size.
+
+    Stages after parse get their inputs from one untimed run of the stage
+    before them, so each is measured on its own.
+
+    Returns:
+        {"<stage>/<form>/<scenes>": timing statistics}
+    """
+    from audio_generator import AudioGenerator
+    from ffmpeg_progress import ProgressTracker
+    from orchestrator import VideoProductionOrchestrator
+    from script_parser import ScriptParser
+    from video_assembler import VideoAssembler
+    from visual_generator import VisualGenerator
+
+    cases = {}
+    for form in forms:
+        for scene_count in scene_counts:
+            work_dir = Path(tempfile.mkdtemp(prefix="pipeline_bench_"))
+            try:
+                script_path = write_script(work_dir / "scripts", form, scene_count, words)
+                name = script_path.stem
+                parser = ScriptParser(str(script_path))
+                parser.load()
+                scenes = parser.parse()
+                narrated = [s for s in scenes if s['content'].strip()]
+                if len(scenes) != scene_count:
+                    # A script the parser reads differently would be timed under the wrong label
+                    print(f"{form}/{scene_count}: parsed {len(scenes)} scene(s), expected {scene_count}; "
+                          f"cases marked failed")
+                    for stage in stages:
+                        cases[f"{stage}/{form}/{scene_count}"] = measure(lambda: False, 1)
+                    continue
+                audio_dir, visual_dir, render_dir = work_dir / "audio", work_dir / "visuals", work_dir / "render"
+
+                def parse() -> bool:
+                    p = ScriptParser(str(script_path))
+                    return p.load() and len(p.parse()) == len(scenes)
+
+                def audio() -> bool:
+                    generator = AudioGenerator(str(audio_dir), progress=ProgressTracker(name))
+                    return len(generator.generate_from_scenes(scenes, name)) == len(narrated)
+
+                def visuals() -> bool:
+                    generator = VisualGenerator(str(visual_dir), resolution, fps, progress=ProgressTracker(name))
+                    files = generator.generate_for_scenes(scenes, name)
+                    return len(files) == len(scenes) and all(f.get("path") for f in files)
+
+                def assembly() -> bool:
+                    assembler = VideoAssembler(str(render_dir), resolution, fps, progress=ProgressTracker(name))
+                    return bool(assembler.assemble(name, scenes, audio_files, visual_files))
+
+                def end_to_end() -> bool:
+                    orchestrator = VideoProductionOrchestrator({
+                        'REPO_ROOT': str(work_dir),
+                        'SCRIPT_DIR': str(script_path.parent),
+                        'SCRIPT_PATTERN': script_path.name,
+                        'VIDEO_OUT_DIR': str(render_dir),
+                        'VIDEO_RESOLUTION': resolution,
+                        'FPS': str(fps),
+                    })
+                    results = orchestrator.run()
+                    return results.get('success_count') == 1 and results.get('failure_count') == 0
+
+                timed = {
+                    "parse": (parse, None),
+                    "audio": (audio, lambda: _reset(audio_dir)),
+                    "visuals": (visuals, lambda: _reset(visual_dir)),
+                    "assembly": (assembly, lambda: _reset(render_dir)),
+                    "end_to_end": (end_to_end, lambda: _reset(render_dir)),
+                }
+
+                # Untimed inputs for the isolated assembly stage
+                audio_files, visual_files = [], []
+                if "assembly" in stages:
+                    _reset(audio_dir)
+                    audio_files = AudioGenerator(str(audio_dir)).generate_from_scenes(scenes, name)
+                    _reset(visual_dir)
+                    visual_files = VisualGenerator(str(visual_dir), resolution, fps).generate_for_scenes(scenes, name)
+                    if not all(f.get("path") for f in visual_files) or len(visual_files) != len(scenes):
+                        card = make_card(work_dir, resolution)
+                        visual_files = [
+                            {"scene_num": s["scene_num"], "path": str(card), "type": "title_card", "duration": None}
+                            for s in scenes
+                        ]
+
+                for stage in stages:
+                    fn, setup = timed[stage]
+                    case = f"{stage}/{form}/{scene_count}"
+                    cases[case] = measure(fn, repeat, setup)
+                    status = "" if cases[case]["success"] else "  (failed)"
+                    print(f"{case:<32} median {cases[case]['median']:8.3f}s  "
+                          f"stdev {cases[case]['stdev']:.3f}s{status}")
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+    return cases
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--forms", default=",".join(FORMS), help="Comma-separated script forms")
+    parser.add_argument("--scenes", default="5,20", help="Comma-separated scene counts")
+    parser.add_argument("--words", type=int, default=40, help="Narration words per scene")
+    parser.add_argument("--stages", default=",".join(STAGES), help="Comma-separated stages")
+    parser.add_argument("--resolution", default="1920x1080")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logging")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    forms = [f.strip() for f in args.forms.split(",") if f.strip()]
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES] + [f for f in forms if f not in FORMS]
+    if unknown:
+        parser.error(f"unknown stage or form: {', '.join(unknown)}")
+
+    if args.tools == "stand-in":
+        use_stand_ins()
+    scene_counts = [int(n) for n in args.scenes.split(",") if n.strip()]
+
+    # Importing the orchestrator configures logging; quiet it afterwards
+    import orchestrator  # noqa: F401
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    cases = run_benchmark(forms, scene_counts, stages, args.words, args.resolution, args.fps, args.repeat)
+    parameters = {
+        "forms": forms, "scenes": scene_counts, "words": args.words,
+        "stages": stages, "resolution": args.resolution, "fps": args.fps, "repeat": args.repeat,
+    }
+    sys.exit(finish(args, cases, parameters))
+
+
+if __name__ == '__main__':
+    main()
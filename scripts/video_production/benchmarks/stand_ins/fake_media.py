@@ -0,0 +1,84 @@
+"""
+Fake Media
+Shared helpers for the stand-in espeak-ng, ffmpeg and ffprobe binaries.
+
+Audio is written as real (silent, low-rate) WAV files so anything reading
+them with the wave module still works. Everything else is a small JSON
+document recording the duration and keyframe times an encoder would have
+produced, which the stand-in ffprobe reports back.
+"""
+
+import json
+import math
+import re
+import wave
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SAMPLE_RATE = 8000
+MARKER = "fake-media"
+
+
+def write_wav(path: str, duration: float) -> None:
+    """Write a silent mono WAV of the given duration."""
+    frames = max(1, int(round(duration * SAMPLE_RATE)))
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(b"\0\0" * frames)
+
+
+def write_media(path: str, duration: float, keyframes: Optional[List[float]] = None) -> None:
+    """Write a fake media file (a WAV for .wav outputs)."""
+    if path.endswith('.wav'):
+        write_wav(path, duration)
+        return
+    with open(path, 'w') as f:
+        json.dump({MARKER: 1, "duration": round(duration, 6), "keyframes": keyframes or [0.0]}, f)
+
+
+def read_media(path: str) -> Optional[Dict]:
+    """Return {"duration", "keyframes"} of a fake media or WAV file."""
+    try:
+        with wave.open(path, 'rb') as f:
+            return {"duration": f.getnframes() / f.getframerate(), "keyframes": [0.0]}
+    except (wave.Error, EOFError, OSError):
+        pass
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+    if isinstance(data, dict) and MARKER in data:
+        return {"duration": float(data["duration"]), "keyframes": data.get("keyframes") or [0.0]}
+    return None
+
+
+def lavfi_duration(graph: str) -> Optional[float]:
+    """Duration set on a lavfi source (e.g. sine=...:duration=3)."""
+    match = re.search(r'(?:^|[:,])d(?:uration)?=([0-9.]+)', graph)
+    return float(match.group(1)) if match else None
+
+
+def concat_list_duration(list_file: str) -> float:
+    """Total duration of the files named in a concat demuxer list."""
+    base = Path(list_file).parent
+    total = 0.0
+    with open(list_file, 'r') as f:
+        for line in f:
+            match = re.match(r"\s*file\s+'(.*)'\s*$", line)
+            if not match:
+                continue
+            path = Path(match.group(1).replace("'\\''", "'"))
+            media = read_media(str(path if path.is_absolute() else base / path))
+            total += media["duration"] if media else 0.0
+    return total
+
+
+def regular_keyframes(duration: float, interval: float, forced: List[float] = ()) -> List[float]:
+    """Keyframe times of an encode with a fixed GOP plus forced keyframes."""
+    count = int(math.floor(duration / interval)) + 1 if interval > 0 else 1
+    times = {round(i * interval, 6) for i in range(count)}
+    times.update(round(t, 6) for t in forced if 0 <= t < duration)
+    return sorted(times)
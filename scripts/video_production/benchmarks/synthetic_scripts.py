@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Synthetic Scripts
+Deterministic benchmark scripts with timecoded or plain section headings.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+FORMS = ("timecoded", "heading", "paragraph")
+
+_WORDS = (
+    "perpetual futures funding rate margin leverage liquidation order book "
+    "position collateral settlement oracle price index mark trader exchange "
+    "risk engine insurance fund spread volume latency wallet dashboard chart"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """One pseudo-random sentence of the given length."""
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _sentences(rng: random.Random, words: int) -> List[str]:
+    """Sentences of 12 words (the last one shorter) totalling the given word count."""
+    sentences = []
+    remaining = words
+    while remaining > 0:
+        length = min(12, remaining)
+        sentences.append(_sentence(rng, length))
+        remaining -= length
+    return sentences
+
+
+def generate_script(form: str, scenes: int, words_per_scene: int = 40, seed: int = 0) -> str:
+    """
+    Build a script in one of the parser's forms.
+
+    Args:
+        form: "timecoded" (### **[MM:SS-MM:SS] TITLE**), "heading" (## Title)
+            or "paragraph" (## Title over narration in one paragraph per
+            sentence)
+        scenes: Number of scenes
+        words_per_scene: Narration words per scene
+        seed: Random seed (same arguments always give the same script)
+
+    Returns:
+        Markdown script text
+    """
+    if form not in FORMS:
+        raise ValueError(f"Unknown script form '{form}', expected one of {FORMS}")
+
+    rng = random.Random(f"{form}:{scenes}:{words_per_scene}:{seed}")
+    seconds_per_scene = max(1, round(words_per_scene / 2.5))
+    # A title line before the first "##" heading would become a scene of its own
+    parts: List[str] = [f"# Benchmark Script ({form}, {scenes} scenes)\n"] if form == "timecoded" else []
+
+    for n in range(scenes):
+        sentences = _sentences(rng, words_per_scene)
+        narration = " ".join(sentences)
+        if form == "timecoded":
+            start, end = n * seconds_per_scene, (n + 1) * seconds_per_scene
+            parts.append(
+                f"### **[{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}] "
+                f"SECTION {n + 1}**\n\n"
+                f"[ON SCREEN: {rng.choice(_WORDS)} {rng.choice(_WORDS)} chart]\n\n"
+                f"{narration}\n"
+            )
+        elif form == "heading":
+            parts.append(f"## Section {n + 1}\n\n{narration}\n")
+        else:
+            paragraphs = "\n\n".join(sentences)
+            parts.append(f"## Section {n + 1}\n\n{paragraphs}\n")
+
+    return "\n".join(parts)
+
+
+def write_script(directory: Path, form: str, scenes: int, words_per_scene: int = 40, seed: int = 0) -> Path:
+    """Write a synthetic script to directory and return its path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"BENCH_{form.upper()}_{scenes:03d}.md"
+    path.write_text(generate_script(form, scenes, words_per_scene, seed), encoding="utf-8")
+    return path
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Demo Capture Cache Module
+Shares browser demo captures across scripts so each URL is recorded once.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DemoCaptureCache:
+    """Caches demo captures keyed by URL, viewport, interaction and content version."""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, time_window: int = 3600):
+        """
+        Initialize the demo capture cache.
+
+        Args:
+            cache_dir: Directory holding cached captures and the index
+            time_window: Seconds a capture stays valid when the server
+                provides no ETag or Last-Modified header
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.time_window = max(1, int(time_window))
+        self.index_path = self.cache_dir / self.INDEX_FILE
+        self.index = self._load_index()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._versions: Dict[str, str] = {}
+        self._failed: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, url: str, width: int, height: int, interaction: str) -> str:
+        """
+        Build the cache key for a capture.
+
+        Args:
+            url: Demo URL
+            width: Viewport width
+            height: Viewport height
+            interaction: Identifier of the interaction script run in the page
+
+        Returns:
+            Hex digest identifying the capture
+        """
+        parts = [url, f"{width}x{height}", interaction, self._content_version(url)]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+    def output_path(self, key: str, suffix: str = ".mp4") -> Path:
+        """Return the file path a capture with this key is stored at."""
+        return self.cache_dir / f"demo_{key}{suffix}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached capture.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Capture entry dict, or None if missing or the file is gone
+        """
+        entry = self.index.get(key)
+        if entry and Path(entry["path"]).exists():
+            return entry
+        return None
+
+    def put(self, key: str, path: str, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Record a finished capture.
+
+        Args:
+            key: Cache key from make_key()
+            path: Path to the captured video
+            metadata: Extra capture metadata to store with the entry
+
+        Returns:
+            The stored entry
+        """
+        entry = {
+            "path": str(path),
+            "created": time.time(),
+            "metadata": metadata or {},
+        }
+        with self._lock:
+            self.index[key] = entry
+            self._save_index()
+        return entry
+
+    def get_or_capture(
+        self,
+        url: str,
+        width: int,
+        height: int,
+        interaction: str,
+        capture_fn: Callable[[Path], Optional[Dict]]
+    ) -> Optional[Dict]:
+        """
+        Return a cached capture, recording it first if needed.
+
+        Concurrent callers asking for the same key wait for a single capture.
+        A failed capture is remembered for the rest of the run, so later
+        callers for the key get None instead of launching the browser again.
+
+        Args:
+            url: Demo URL
+            width: Viewport width
+            height: Viewport height
+            interaction: Identifier of the interaction script
+            capture_fn: Callable receiving the target path and returning a
+                dict with at least "path", or None if the capture failed
+
+        Returns:
+            Capture entry dict, or None if the capture failed
+        """
+        key = self.make_key(url, width, height, interaction)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self.get(key)
+            if entry:
+                self.hits += 1
+                logger.info(f"  ✓ Reusing cached demo capture {Path(entry['path']).name}")
+                return entry
+            if key in self._failed:
+                logger.info("  Demo capture already failed this run, skipping")
+                return None
+
+            self.misses += 1
+            captured = capture_fn(self.output_path(key))
+            if not captured or not captured.get("path"):
+                self._failed.add(key)
+                return None
+
+            metadata = {k: v for k, v in captured.items() if k != "path"}
+            metadata.update({"url": url, "viewport": f"{width}x{height}", "interaction": interaction})
+            return self.put(key, captured["path"], metadata)
+
+    def _content_version(self, url: str) -> str:
+        """
+        Identify the current version of the page content.
+
+        Uses the ETag or Last-Modified response header when the server sends
+        one, otherwise the current time window.
+        """
+        with self._lock:
+            if url in self._versions:
+                return self._versions[url]
+
+        version = None
+        try:
+            request = urllib.request.Request(url, method="HEAD")
+            with urllib.request.urlopen(request, timeout=5) as response:
+                etag = response.headers.get("ETag")
+                modified = response.headers.get("Last-Modified")
+                if etag:
+                    version = f"etag:{etag}"
+                elif modified:
+                    version = f"modified:{modified}"
+        except Exception as e:
+            logger.debug(f"Could not read content version for {url}: {e}")
+
+        if not version:
+            version = f"window:{int(time.time() // self.time_window)}"
+
+        with self._lock:
+            return self._versions.setdefault(url, version)
+
+    def _load_index(self) -> Dict:
+        """Load the cache index from disk."""
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        """Write the cache index atomically, dropping entries whose file is gone (lock held)."""
+        for key in [k for k, entry in self.index.items() if not Path(entry["path"]).exists()]:
+            del self.index[key]
+        temp_path = self.index_path.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(self.index, f, indent=2)
+            temp_path.replace(self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save demo cache index: {e}")
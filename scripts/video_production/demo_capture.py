@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Demo Capture Module
+Records demo footage from URLs with async Playwright into isolated directories.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import time
+from typing import Dict, Optional
+import logging
+
+from demo_timeline import DemoTimeline
+
+logger = logging.getLogger(__name__)
+
+
+class DemoCaptureEngine:
+    """Captures a demo video in its own browser context and recording directory."""
+
+    def __init__(self, headless: bool = True, navigation_timeout: int = 30000):
+        """
+        Initialize the capture engine.
+
+        Args:
+            headless: Run browser in headless mode
+            navigation_timeout: Page navigation timeout in milliseconds
+        """
+        self.headless = headless
+        self.navigation_timeout = navigation_timeout
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether async Playwright can be imported."""
+        try:
+            import playwright.async_api  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def capture(self, request: Dict) -> Optional[Dict]:
+        """
+        Record a demo.
+
+        The request dict contains:
+        - url: Page to record
+        - width, height: Viewport and recording size
+        - color_scheme: Optional "light" or "dark" theme emulation
+        - timeline: Optional DemoTimeline (defaults to a page scroll-through)
+
+        Args:
+            request: Capture request dict
+
+        Returns:
+            Dict with "path" (the recorded .webm), "temp_dir" (the isolated
+            recording directory, owned by the caller) and the timeline
+            metadata ("marks", "scene_marks", "duration"), or None if the
+            capture failed
+        """
+        if not self.is_available():
+            logger.warning("Playwright not available, skipping demo capture")
+            return None
+
+        try:
+            return asyncio.run(self._capture(request))
+        except Exception as e:
+            logger.error(f"  Demo capture failed: {e}")
+            return None
+
+    @staticmethod
+    def cleanup(result: Optional[Dict]) -> None:
+        """Remove the temporary recording directory of a capture result."""
+        if result and result.get("temp_dir"):
+            shutil.rmtree(result["temp_dir"], ignore_errors=True)
+
+    async def _capture(self, request: Dict) -> Optional[Dict]:
+        """
+        Launch a browser and record the request into a temporary directory.
+
+        Args:
+            request: Capture request dict
+
+        Returns:
+            Capture result dict, or None if failed
+        """
+        from playwright.async_api import async_playwright
+
+        url = request["url"]
+        width = request["width"]
+        height = request["height"]
+        temp_dir = tempfile.mkdtemp(prefix="demo_capture_")
+
+        logger.info("  Starting browser automation...")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            try:
+                context_args = {
+                    "viewport": {"width": width, "height": height},
+                    "record_video_dir": temp_dir,
+                    "record_video_size": {"width": width, "height": height},
+                }
+                if request.get("color_scheme"):
+                    context_args["color_scheme"] = request["color_scheme"]
+
+                context = await browser.new_context(**context_args)
+                page = await context.new_page()
+                # Recording starts with the page; marks are relative to this
+                recording_start = time.monotonic()
+
+                logger.info(f"  Navigating to {url} ({width}x{height})...")
+                await page.goto(url, wait_until="domcontentloaded", timeout=self.navigation_timeout)
+
+                logger.info("  Running interaction timeline...")
+                timeline = request.get("timeline") or DemoTimeline()
+                metadata = await timeline.run(page, height, recording_start)
+
+                # The video is only finalized once the context is closed
+                await page.close()
+                await context.close()
+                video_path = await page.video.path()
+
+                return {"path": str(video_path), "temp_dir": temp_dir, **metadata}
+
+            except Exception as e:
+                logger.error(f"  Demo capture of {url} failed: {e}")
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return None
+            finally:
+                await browser.close()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Demo Segmenter Module
+Cuts a demo capture once into keyframe-aligned, per-scene segments.
+"""
+
+import csv
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from encoding_profiles import EncodingProfile, get_profile
+from ffmpeg_progress import ProgressTracker
+from process_runner import command_available, run_process
+
+logger = logging.getLogger(__name__)
+
+
+class DemoSegmenter:
+    """Splits a demo recording into one segment per scene."""
+
+    def __init__(
+        self,
+        resolution: str = "1920x1080",
+        fps: int = 30,
+        profile: Optional[EncodingProfile] = None,
+        progress: Optional[ProgressTracker] = None
+    ):
+        """
+        Initialize the segmenter.
+
+        Args:
+            resolution: Video resolution of the segments
+            fps: Frames per second of the segments
+            profile: Encoding profile used when the cut needs a re-encode
+            progress: Tracker that runs the segmenting job
+        """
+        self.resolution = resolution
+        self.fps = fps
+        self.profile = profile or get_profile("standard")
+        self.progress = progress or ProgressTracker()
+
+    def segment_for_scenes(
+        self,
+        video_path: str,
+        scenes: List[Dict],
+        scene_marks: Optional[Dict] = None,
+        keyframe_times: Optional[List[float]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Cut the capture into one segment per scene.
+
+        Scene boundaries come from capture marks when every scene has one,
+        otherwise from the scene timecodes scaled onto the capture, otherwise
+        from each scene's share of the narration word count.
+
+        Args:
+            video_path: Path to the demo capture
+            scenes: List of scene dictionaries
+            scene_marks: Scene number (as string) to capture time in seconds
+            keyframe_times: Times the capture already has keyframes at
+
+        Returns:
+            List of dicts aligned with scenes ("scene_num", "path", "start",
+            "duration"), or None if segmentation failed
+        """
+        if not scenes or not self._check_command("ffmpeg"):
+            return None
+
+        capture_duration = self._get_duration(video_path)
+        if not capture_duration:
+            logger.warning("  Cannot determine demo duration, skipping segmentation")
+            return None
+
+        boundaries = self._scene_boundaries(scenes, scene_marks or {}, capture_duration)
+        segment_dir = self._segment_dir(video_path, boundaries)
+        index_file = segment_dir / "segments.json"
+
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    segments = json.load(f)
+                if all(Path(s["path"]).exists() for s in segments):
+                    logger.info(f"  ✓ Reusing demo segments in {segment_dir.name}")
+                    return self._map_to_scenes(segments, scenes)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        cut_points = boundaries[1:]
+        aligned = self._keyframes_cover(cut_points, keyframe_times or [])
+
+        logger.info(
+            f"  Cutting demo into {len(boundaries)} segment(s) "
+            f"({'stream copy' if aligned else 'single re-encode'})..."
+        )
+        segments = self._cut(video_path, cut_points, segment_dir, aligned, capture_duration)
+        if not segments:
+            return None
+
+        try:
+            with open(index_file, 'w') as f:
+                json.dump(segments, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write segment index: {e}")
+
+        return self._map_to_scenes(segments, scenes)
+
+    def _scene_boundaries(
+        self,
+        scenes: List[Dict],
+        scene_marks: Dict,
+        capture_duration: float
+    ) -> List[float]:
+        """Return the start time of each scene within the capture."""
+        marks = [scene_marks.get(str(scene['scene_num'])) for scene in scenes]
+        if all(m is not None for m in marks):
+            starts = [float(m) for m in marks]
+            starts[0] = 0.0
+            return self._monotonic(starts, capture_duration)
+
+        timecodes = [self._parse_timecode(scene.get('start_time')) for scene in scenes]
+        if all(t is not None for t in timecodes):
+            script_end = self._parse_timecode(scenes[-1].get('end_time')) or 0.0
+            script_end = max(script_end, timecodes[-1] + 1.0)
+            scale = capture_duration / script_end
+            return self._monotonic([t * scale for t in timecodes], capture_duration)
+
+        words = [max(1, len(scene.get('content', '').split())) for scene in scenes]
+        total = sum(words)
+        starts = []
+        position = 0.0
+        for count in words:
+            starts.append(position)
+            position += capture_duration * count / total
+        return self._monotonic(starts, capture_duration)
+
+    def _monotonic(self, starts: List[float], capture_duration: float) -> List[float]:
+        """Force strictly increasing starts of at least one frame each."""
+        frame = 1.0 / self.fps
+        result = []
+        for t in starts:
+            t = min(max(0.0, t), max(0.0, capture_duration - frame))
+            if result and t <= result[-1]:
+                t = result[-1] + frame
+            result.append(round(t, 3))
+        result[0] = 0.0
+        return result
+
+    def _keyframes_cover(self, cut_points: List[float], keyframe_times: List[float]) -> bool:
+        """Check that every cut point falls on an existing keyframe."""
+        tolerance = 0.5 / self.fps
+        return all(
+            any(abs(cut - k) <= tolerance for k in keyframe_times)
+            for cut in cut_points
+        )
+
+    def _cut(
+        self,
+        video_path: str,
+        cut_points: List[float],
+        segment_dir: Path,
+        stream_copy: bool,
+        capture_duration: Optional[float] = None
+    ) -> Optional[List[Dict]]:
+        """Run a single ffmpeg segment pass and collect the produced segments."""
+        list_file = segment_dir / "segments.csv"
+        pattern = str(segment_dir / "segment_%03d.mp4")
+
+        cmd = ["ffmpeg", "-y", "-i", video_path, "-an"]
+        if stream_copy:
+            cmd += ["-c:v", "copy"]
+        else:
+            cmd += [
+                *self.profile.video_args(),
+                "-pix_fmt", "yuv420p", "-r", str(self.fps),
+            ]
+            if cut_points:
+                cmd += ["-force_key_frames", ",".join(f"{t:.3f}" for t in cut_points)]
+
+        cmd += ["-f", "segment", "-reset_timestamps", "1",
+                "-segment_list", str(list_file), "-segment_list_type", "csv"]
+        if cut_points:
+            cmd += ["-segment_times", ",".join(f"{t:.3f}" for t in cut_points)]
+        else:
+            # A single scene: one segment covering the whole capture
+            cmd += ["-segment_time", "1000000"]
+        cmd.append(pattern)
+
+        try:
+            result = self.progress.run(
+                cmd,
+                label=f"segment {Path(video_path).stem}",
+                media_seconds=capture_duration,
+                kind="remux" if stream_copy else "encode",
+                resolution=self.resolution
+            )
+            if result.returncode != 0:
+                logger.error(f"FFmpeg segment error: {result.stderr}")
+                return None
+
+            segments = []
+            with open(list_file, 'r', newline='') as f:
+                for row in csv.reader(f):
+                    if len(row) < 3:
+                        continue
+                    start, end = float(row[1]), float(row[2])
+                    segments.append({
+                        "path": str(segment_dir / row[0]),
+                        "start": round(start, 3),
+                        "duration": round(end - start, 3)
+                    })
+            return segments or None
+
+        except Exception as e:
+            logger.error(f"Error segmenting demo: {e}")
+            return None
+
+    def _map_to_scenes(self, segments: List[Dict], scenes: List[Dict]) -> List[Dict]:
+        """
+        Pair segments with scenes in order.
+
+        If keyframe placement merged two cuts, the remaining scenes reuse the
+        last segment rather than failing.
+        """
+        mapped = []
+        for i, scene in enumerate(scenes):
+            segment = segments[min(i, len(segments) - 1)]
+            mapped.append({"scene_num": scene['scene_num'], **segment})
+        return mapped
+
+    def _segment_dir(self, video_path: str, boundaries: List[float]) -> Path:
+        """Directory holding the segments for this capture and boundary set."""
+        source = Path(video_path)
+        digest = hashlib.sha256(
+            json.dumps([source.name, boundaries, self.resolution, self.fps, self.profile.cache_key()]).encode("utf-8")
+        ).hexdigest()[:12]
+        return source.parent / f"{source.stem}_segments_{digest}"
+
+    @staticmethod
+    def _parse_timecode(value: Optional[str]) -> Optional[float]:
+        """Convert an MM:SS timecode to seconds."""
+        if not value:
+            return None
+        match = re.match(r'^(\d+):(\d{2})$', value.strip())
+        if not match:
+            return None
+        return int(match.group(1)) * 60 + int(match.group(2))
+
+    def _get_duration(self, media_path: str) -> Optional[float]:
+        """Get duration of media file in seconds."""
+        if not self._check_command("ffprobe"):
+            return None
+
+        try:
+            cmd = [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                media_path
+            ]
+            result = run_process(cmd, capture_output=True, text=True, timeout=10)
+            if result.returncode == 0 and result.stdout.strip():
+                return float(result.stdout.strip())
+        except Exception as e:
+            logger.error(f"Error getting duration: {e}")
+
+        return None
+
+    def _check_command(self, command: str) -> bool:
+        """Check if a command is available."""
+        return command_available(command)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Demo Timeline Module
+Declarative, event-driven interaction sequences for demo capture.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    # Timelines only run inside a Playwright capture
+    PlaywrightTimeoutError = TimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class DemoTimeline:
+    """
+    Runs a list of interaction steps against a Playwright page.
+
+    Steps are dicts with an "action" key:
+    - wait: {"for": "networkidle" | "load" | "domcontentloaded"}
+    - wait_for_selector: {"selector": "...", "state": "visible"}
+    - animation_frames: {"count": 2}
+    - scroll: {"to": "top" | "bottom" | <pixels>} or {"by": <viewport fraction>}
+    - scroll_through: scroll one viewport at a time to the bottom,
+      settling on animation frames; optional {"mark_each": "section"}
+    - click / hover: {"selector": "..."}
+    - pause: {"seconds": 1.5} (explicit hold, e.g. to match narration)
+    - mark: {"scene": 3} or {"name": "pricing"}
+
+    Waits finish as soon as the page is ready, so recording length follows
+    the page rather than fixed sleeps. A page that never reaches the load
+    state of a "wait" step (e.g. it keeps polling) is recorded anyway once
+    the step times out; only "wait_for_selector" steps fail the capture.
+    Marks record the elapsed time since the recording started.
+    """
+
+    ACTIONS = {
+        "wait", "wait_for_selector", "animation_frames", "scroll",
+        "scroll_through", "click", "hover", "pause", "mark"
+    }
+
+    DEFAULT_STEPS = [
+        {"action": "wait", "for": "networkidle"},
+        {"action": "animation_frames", "count": 2},
+        {"action": "mark", "name": "start"},
+        {"action": "scroll_through", "mark_each": "section"},
+        {"action": "scroll", "to": "top"},
+        {"action": "animation_frames", "count": 2},
+        {"action": "mark", "name": "end"},
+    ]
+
+    def __init__(self, steps: Optional[List[Dict]] = None, step_timeout: int = 10000):
+        """
+        Initialize the timeline.
+
+        Args:
+            steps: Interaction steps (defaults to a scroll-through of the page)
+            step_timeout: Timeout for each wait step in milliseconds
+        """
+        self.steps = steps if steps is not None else [dict(s) for s in self.DEFAULT_STEPS]
+        self.step_timeout = step_timeout
+
+        for step in self.steps:
+            if step.get("action") not in self.ACTIONS:
+                raise ValueError(f"Unknown timeline action: {step.get('action')}")
+
+    @classmethod
+    def from_file(cls, path: str) -> "DemoTimeline":
+        """
+        Load a timeline from a JSON file.
+
+        The file holds either a list of steps or a dict with a "steps" list.
+        """
+        with open(Path(path), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return cls(data.get("steps", []), data.get("step_timeout", 10000))
+        return cls(data)
+
+    def fingerprint(self) -> str:
+        """Return a stable identifier of the steps, used in capture cache keys."""
+        payload = json.dumps(self.steps, sort_keys=True)
+        return "timeline-" + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+    async def run(self, page, viewport_height: int, recording_start: float) -> Dict:
+        """
+        Execute the timeline.
+
+        Args:
+            page: Playwright async page
+            viewport_height: Viewport height in pixels
+            recording_start: time.monotonic() value when recording began
+
+        Returns:
+            Metadata dict with:
+            - marks: List of {"name", "time"} in seconds since recording start
+            - scene_marks: Dict of scene number (as string) to start time
+            - duration: Seconds from recording start to the last step
+        """
+        marks = []
+        scene_marks = {}
+
+        def elapsed() -> float:
+            return round(time.monotonic() - recording_start, 3)
+
+        for step in self.steps:
+            action = step["action"]
+
+            if action == "wait":
+                state = step.get("for", "networkidle")
+                try:
+                    await page.wait_for_load_state(state, timeout=self.step_timeout)
+                except PlaywrightTimeoutError:
+                    logger.info(f"  Page did not reach {state} within {self.step_timeout} ms, continuing")
+            elif action == "wait_for_selector":
+                await page.wait_for_selector(
+                    step["selector"],
+                    state=step.get("state", "visible"),
+                    timeout=self.step_timeout
+                )
+            elif action == "animation_frames":
+                await self._animation_frames(page, step.get("count", 1))
+            elif action == "scroll":
+                await self._scroll(page, step, viewport_height)
+            elif action == "scroll_through":
+                total_height = await page.evaluate("document.body.scrollHeight")
+                scroll_steps = max(1, int(total_height / viewport_height))
+                for i in range(scroll_steps):
+                    await page.evaluate(f"window.scrollTo(0, {i * viewport_height})")
+                    await self._settle(page)
+                    if step.get("mark_each"):
+                        marks.append({"name": f"{step['mark_each']}{i + 1}", "time": elapsed()})
+            elif action == "click":
+                await page.click(step["selector"], timeout=self.step_timeout)
+                await self._settle(page)
+            elif action == "hover":
+                await page.hover(step["selector"], timeout=self.step_timeout)
+                await self._animation_frames(page, 2)
+            elif action == "pause":
+                await page.wait_for_timeout(float(step.get("seconds", 1)) * 1000)
+            elif action == "mark":
+                t = elapsed()
+                if "scene" in step:
+                    scene_marks[str(step["scene"])] = t
+                    marks.append({"name": f"scene{int(step['scene']):02d}", "time": t})
+                else:
+                    marks.append({"name": step.get("name", f"mark{len(marks) + 1}"), "time": t})
+
+        return {"marks": marks, "scene_marks": scene_marks, "duration": elapsed()}
+
+    async def _scroll(self, page, step: Dict, viewport_height: int) -> None:
+        """Scroll to an absolute position or by a fraction of the viewport."""
+        if "by" in step:
+            await page.evaluate(f"window.scrollBy(0, {int(float(step['by']) * viewport_height)})")
+        else:
+            target = step.get("to", "top")
+            if target == "top":
+                await page.evaluate("window.scrollTo(0, 0)")
+            elif target == "bottom":
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            else:
+                await page.evaluate(f"window.scrollTo(0, {int(target)})")
+        await self._settle(page)
+
+    async def _settle(self, page) -> None:
+        """Wait until lazy content triggered by an interaction has rendered."""
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.step_timeout)
+        except Exception as e:
+            logger.debug(f"Network did not go idle: {e}")
+        await self._animation_frames(page, 2)
+
+    async def _animation_frames(self, page, count: int) -> None:
+        """Wait for the given number of rendered animation frames."""
+        await page.evaluate(
+            """(count) => new Promise(resolve => {
+                let remaining = count;
+                const tick = () => (--remaining <= 0) ? resolve() : requestAnimationFrame(tick);
+                requestAnimationFrame(tick);
+            })""",
+            max(1, int(count))
+        )
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Encoder Budget Module
+Shares a global CPU thread budget between concurrently running encoders.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EncoderBudget:
+    """
+    Decides how many FFmpeg processes run at once and how many threads each gets.
+
+    Threads are handed out as tokens from one pool, so the encoders running
+    at any moment never use more threads than the budget allows.
+    """
+
+    def __init__(self, cpu_budget: Optional[int] = None, max_jobs: Optional[int] = None):
+        """
+        Initialize the budget.
+
+        Args:
+            cpu_budget: Total encoder threads allowed at once (defaults to CPU count)
+            max_jobs: Maximum concurrent FFmpeg processes (defaults to budget / 2)
+        """
+        self.cpu_budget = max(1, cpu_budget or os.cpu_count() or 1)
+        self.max_jobs = max(1, max_jobs or self.cpu_budget // 2 or 1)
+        self._available = self.cpu_budget
+        self._condition = threading.Condition()
+
+    def plan(self, durations: List[float]) -> Dict:
+        """
+        Size the encode of a set of scenes.
+
+        Every job gets an equal share of the budget, scaled by how long its
+        scene is relative to the average, so long scenes get more threads.
+
+        Args:
+            durations: Scene durations in seconds
+
+        Returns:
+            Dict with "jobs" (concurrent processes) and "threads" (per scene,
+            aligned with durations)
+        """
+        if not durations:
+            return {"jobs": 1, "threads": []}
+
+        jobs = min(len(durations), self.max_jobs)
+        share = self.cpu_budget / jobs
+        mean = sum(durations) / len(durations) or 1.0
+
+        threads = [
+            max(1, min(self.cpu_budget, int(round(share * duration / mean))))
+            for duration in durations
+        ]
+        return {"jobs": jobs, "threads": threads}
+
+    @contextmanager
+    def reserve(self, threads: int):
+        """
+        Hold threads from the budget while an encoder runs.
+
+        Blocks until enough threads are free.
+
+        Args:
+            threads: Number of threads the encoder will use
+        """
+        threads = max(1, min(threads, self.cpu_budget))
+        with self._condition:
+            while self._available < threads:
+                self._condition.wait()
+            self._available -= threads
+        try:
+            yield threads
+        finally:
+            with self._condition:
+                self._available += threads
+                self._condition.notify_all()
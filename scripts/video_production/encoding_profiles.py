@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Encoding Profiles Module
+Named encoder settings shared by every FFmpeg encode, with host calibration.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from process_runner import run_process
+
+logger = logging.getLogger(__name__)
+
+
+class EncodingProfile:
+    """A named set of x264/AAC encoder settings."""
+
+    def __init__(
+        self,
+        name: str,
+        preset: str,
+        crf: int,
+        audio_bitrate: str,
+        maxrate: Optional[str] = None,
+        bufsize: Optional[str] = None
+    ):
+        """
+        Initialize the profile.
+
+        Args:
+            name: Profile name
+            preset: x264 preset
+            crf: x264 constant rate factor
+            audio_bitrate: AAC bitrate (e.g. "192k")
+            maxrate: Optional video bitrate cap for size-limited targets
+            bufsize: Rate control buffer size used with maxrate
+        """
+        self.name = name
+        self.preset = preset
+        self.crf = crf
+        self.audio_bitrate = audio_bitrate
+        self.maxrate = maxrate
+        self.bufsize = bufsize
+
+    def video_args(self, tune: Optional[str] = None) -> List[str]:
+        """FFmpeg arguments for the video encoder."""
+        args = ["-c:v", "libx264", "-preset", self.preset]
+        if tune:
+            args += ["-tune", tune]
+        args += ["-crf", str(self.crf)]
+        if self.maxrate:
+            args += ["-maxrate", self.maxrate, "-bufsize", self.bufsize or self.maxrate]
+        return args
+
+    def audio_args(self) -> List[str]:
+        """FFmpeg arguments for the audio encoder."""
+        return ["-c:a", "aac", "-b:a", self.audio_bitrate]
+
+    def cache_key(self) -> str:
+        """Identify the settings that affect encoded output."""
+        return f"{self.preset}:{self.crf}:{self.maxrate}:{self.bufsize}"
+
+    def to_dict(self) -> Dict:
+        """Return the profile as a plain dict for logs and summaries."""
+        return {
+            "name": self.name,
+            "preset": self.preset,
+            "crf": self.crf,
+            "audio_bitrate": self.audio_bitrate,
+            "maxrate": self.maxrate,
+            "bufsize": self.bufsize,
+        }
+
+
+PROFILES = {
+    "draft": EncodingProfile("draft", "ultrafast", 30, "64k"),
+    "standard": EncodingProfile("standard", "medium", 23, "192k"),
+    "archival": EncodingProfile("archival", "slow", 18, "256k"),
+    # Size-capped for upload targets with bitrate limits
+    "upload": EncodingProfile("upload", "medium", 23, "128k", maxrate="4500k", bufsize="9000k"),
+}
+
+
+def get_profile(name: str) -> EncodingProfile:
+    """
+    Look up a named profile.
+
+    Args:
+        name: One of PROFILES
+
+    Returns:
+        The profile ("standard" if the name is unknown)
+    """
+    profile = PROFILES.get(name)
+    if not profile:
+        logger.warning(f"Unknown encoding profile '{name}', using standard")
+        profile = PROFILES["standard"]
+    return profile
+
+
+class ProfileCalibrator:
+    """
+    Picks an encoder preset for this host from a short calibration encode.
+
+    Each candidate preset encodes the same few seconds of a synthetic test
+    pattern. With a size budget, the fastest preset whose bitrate fits is
+    chosen; with only a time budget, the slowest (best-compressing) preset
+    that still encodes fast enough is chosen. Results are cached per host
+    and resolution.
+    """
+
+    CANDIDATE_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow"]
+
+    def __init__(
+        self,
+        cache_file: str,
+        resolution: str = "1920x1080",
+        fps: int = 30,
+        sample_seconds: float = 2.0
+    ):
+        """
+        Initialize the calibrator.
+
+        Args:
+            cache_file: JSON file caching calibration results
+            resolution: Resolution of the calibration encode
+            fps: Frame rate of the calibration encode
+            sample_seconds: Length of the calibration encode
+        """
+        self.cache_file = Path(cache_file)
+        self.resolution = resolution
+        self.fps = fps
+        self.sample_seconds = sample_seconds
+
+    def select(
+        self,
+        min_speed: Optional[float] = None,
+        max_kbps: Optional[float] = None,
+        base: str = "standard"
+    ) -> EncodingProfile:
+        """
+        Choose a profile meeting the time and size budgets.
+
+        Args:
+            min_speed: Minimum encode speed as a multiple of realtime
+            max_kbps: Maximum video bitrate in kbit/s
+            base: Profile whose CRF and audio settings are kept
+
+        Returns:
+            An "auto" profile with the chosen preset, or the base profile if
+            calibration is not possible
+        """
+        base_profile = get_profile(base)
+        measurements = self._measurements(base_profile.crf)
+        if not measurements:
+            logger.warning("Encoder calibration unavailable, using base profile")
+            return base_profile
+
+        fitting = [
+            m for m in measurements
+            if (min_speed is None or m["speed"] >= min_speed)
+            and (max_kbps is None or m["kbps"] <= max_kbps)
+        ]
+
+        if not fitting:
+            # Nothing meets the budget; take the fastest preset
+            chosen = measurements[0]
+        elif max_kbps is not None:
+            chosen = fitting[0]
+        else:
+            chosen = fitting[-1]
+
+        logger.info(
+            f"Auto encoding profile: preset {chosen['preset']} "
+            f"({chosen['speed']}x realtime, {chosen['kbps']} kbit/s)"
+        )
+        return EncodingProfile(
+            "auto",
+            chosen["preset"],
+            base_profile.crf,
+            base_profile.audio_bitrate,
+            base_profile.maxrate,
+            base_profile.bufsize
+        )
+
+    def _measurements(self, crf: int) -> List[Dict]:
+        """Return per-preset measurements, calibrating if not cached."""
+        host_key = f"{platform.node()}:{os.cpu_count()}:{self.resolution}:{self.fps}:{crf}"
+
+        cache = {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            if host_key in cache:
+                return cache[host_key]
+        except (OSError, ValueError):
+            pass
+
+        measurements = self._calibrate(crf)
+        if measurements:
+            cache[host_key] = measurements
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.cache_file, 'w') as f:
+                    json.dump(cache, f, indent=2)
+            except OSError as e:
+                logger.warning(f"Could not save calibration results: {e}")
+        return measurements
+
+    def _calibrate(self, crf: int) -> List[Dict]:
+        """Encode the test pattern with every candidate preset."""
+        measurements = []
+        with tempfile.TemporaryDirectory(prefix="encode_calibration_") as temp_dir:
+            for preset in self.CANDIDATE_PRESETS:
+                output = Path(temp_dir) / f"{preset}.mp4"
+                cmd = [
+                    "ffmpeg", "-y", "-f", "lavfi",
+                    "-i", f"testsrc2=size={self.resolution}:rate={self.fps}",
+                    "-t", str(self.sample_seconds),
+                    "-c:v", "libx264", "-preset", preset, "-crf", str(crf),
+                    "-pix_fmt", "yuv420p",
+                    str(output)
+                ]
+                try:
+                    start = time.perf_counter()
+                    result = run_process(cmd, capture_output=True, timeout=120)
+                    elapsed = time.perf_counter() - start
+                except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
+                    logger.warning(f"Calibration encode failed for {preset}: {e}")
+                    continue
+
+                if result.returncode != 0 or not output.exists():
+                    continue
+
+                kbps = output.stat().st_size * 8 / 1000 / self.sample_seconds
+                measurements.append({
+                    "preset": preset,
+                    "speed": round(self.sample_seconds / elapsed, 2),
+                    "kbps": round(kbps, 1),
+                })
+        return measurements
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+FFmpeg Progress Module
+Runs FFmpeg with live progress reporting and per-job throughput metrics.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Dict, IO, List, Optional
+import logging
+
+from process_runner import TrackedProcess
+from timeout_policy import TimeoutPolicy
+from tracing import get_tracer, in_current_context
+
+logger = logging.getLogger(__name__)
+
+
+class FFmpegResult:
+    """Outcome of one FFmpeg job (mirrors the fields callers used from CompletedProcess)."""
+
+    def __init__(self, returncode: int, stderr: str, stats: Dict):
+        self.returncode = returncode
+        self.stderr = stderr
+        self.stats = stats
+
+
+class ProgressTracker:
+    """
+    Runs FFmpeg jobs with `-progress` and reports fps, speed and ETA.
+
+    Progress is read from a dedicated pipe, so stdout stays free for piped
+    output. Only the last STDERR_LINES lines of stderr are kept. Jobs marked
+    as planned count toward the script-level ETA against the media seconds
+    announced with expect(). Deadlines come from the timeout policy, which
+    also learns from every successful job.
+    """
+
+    LOG_INTERVAL = 5.0
+    STDERR_LINES = 200
+
+    def __init__(self, name: str = "ffmpeg", timeouts: Optional[TimeoutPolicy] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            name: Name used in progress lines (usually the script name)
+            timeouts: Policy sizing job deadlines (shared by the run)
+        """
+        self.name = name
+        self.timeouts = timeouts or TimeoutPolicy()
+        self.timeout_kills: List[Dict] = []
+        self.jobs: List[Dict] = []
+        self.expected_media_seconds = 0.0
+        self._planned_done = 0.0
+        self._planned_start: Optional[float] = None
+        self._active: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+
+    def expect(self, media_seconds: float) -> None:
+        """Announce media seconds that planned jobs will process."""
+        with self._lock:
+            self.expected_media_seconds += media_seconds
+
+    def run(
+        self,
+        cmd: List[str],
+        label: str,
+        media_seconds: Optional[float] = None,
+        planned: bool = False,
+        stdout: Optional[IO] = None,
+        kind: str = "encode",
+        resolution: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> FFmpegResult:
+        """
+        Run one FFmpeg command while following its progress.
+
+        Args:
+            cmd: FFmpeg command line (starting with "ffmpeg")
+            label: Job name for logs and metrics
+            media_seconds: Expected output duration, for percentage, ETA and
+                the job's deadline
+            planned: Count the job toward the script-level ETA
+            stdout: Where FFmpeg's stdout goes (discarded by default)
+            kind: Timeout policy kind ("encode" or "remux")
+            resolution: Output resolution of an encode, for the deadline
+            timeout: Explicit deadline overriding the policy
+
+        Returns:
+            FFmpegResult with the return code, stderr tail and job stats
+
+        Raises:
+            subprocess.TimeoutExpired: If the job outlives its timeout
+        """
+        with get_tracer().span(cmd[0], "subprocess", label=label) as span:
+            result = self._execute(cmd, label, media_seconds, planned, stdout, kind, resolution, timeout)
+            span.update(result.stats)
+        return result
+
+    def _execute(
+        self,
+        cmd: List[str],
+        label: str,
+        media_seconds: Optional[float],
+        planned: bool,
+        stdout: Optional[IO],
+        kind: str,
+        resolution: Optional[str],
+        timeout: Optional[float]
+    ) -> FFmpegResult:
+        """Start the job, follow its progress and wait for it under its deadline."""
+        if timeout is None:
+            timeout = self.timeouts.deadline(kind, media_seconds, resolution)
+        read_fd, write_fd = os.pipe()
+        full_cmd = [cmd[0], "-nostats", "-progress", f"pipe:{write_fd}", *cmd[1:]]
+        job = {
+            "label": label,
+            "media_seconds": media_seconds,
+            "planned": planned,
+            "start": time.perf_counter(),
+            "out_seconds": 0.0,
+            "frames": 0,
+            "fps": 0.0,
+            "speed": None,
+            "last_log": time.perf_counter(),
+        }
+        stderr_tail = deque(maxlen=self.STDERR_LINES)
+
+        try:
+            process = TrackedProcess(
+                full_cmd,
+                label,
+                stdin=subprocess.DEVNULL,
+                stdout=stdout if stdout is not None else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                pass_fds=(write_fd,)
+            )
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        with self._lock:
+            self._active[id(job)] = job
+            if planned and self._planned_start is None:
+                self._planned_start = job["start"]
+
+        readers = [
+            # Progress lines are logged in the context of the script being encoded
+            threading.Thread(target=in_current_context(self._read_progress), args=(read_fd, job), daemon=True),
+            threading.Thread(target=self._read_stderr, args=(process.stderr, stderr_tail), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            self._finish(job, None, readers, process.usage)
+            self.record_kill(kind, label, timeout, media_seconds)
+            raise subprocess.TimeoutExpired(full_cmd, timeout, stderr="".join(stderr_tail))
+
+        stats = self._finish(job, returncode, readers, process.usage)
+        if returncode == 0:
+            self.timeouts.observe(kind, media_seconds, stats["wall_seconds"], resolution)
+        return FFmpegResult(returncode, "".join(stderr_tail), stats)
+
+    def record_kill(self, kind: str, label: str, timeout: float, units: Optional[float] = None) -> None:
+        """Record a job of this script killed at its deadline."""
+        entry = self.timeouts.record_kill(kind, label, timeout, units)
+        with self._lock:
+            self.timeout_kills.append(entry)
+
+    def summary(self) -> Dict:
+        """Aggregate metrics of every finished job."""
+        with self._lock:
+            jobs = list(self.jobs)
+        media = sum(job["media_seconds"] or 0.0 for job in jobs)
+        wall = sum(job["wall_seconds"] for job in jobs)
+        frames = sum(job["frames"] for job in jobs)
+        return {
+            "job_count": len(jobs),
+            "failed_jobs": sum(1 for job in jobs if job["returncode"] != 0),
+            "timeout_kills": len(self.timeout_kills),
+            "media_seconds": round(media, 3),
+            "job_seconds": round(wall, 3),
+            "frames": frames,
+            "fps": round(frames / wall, 1) if wall > 0 else None,
+            "speed": round(media / wall, 2) if wall > 0 else None,
+            "jobs": jobs,
+        }
+
+    def _finish(
+        self,
+        job: Dict,
+        returncode: Optional[int],
+        readers: List[threading.Thread],
+        usage: Optional[Dict] = None
+    ) -> Dict:
+        """Record a finished job and return its stats (with its resource usage)."""
+        for reader in readers:
+            reader.join(timeout=5)
+
+        wall = time.perf_counter() - job["start"]
+        media = job["media_seconds"] if job["media_seconds"] is not None else job["out_seconds"]
+        stats = {
+            "label": job["label"],
+            "media_seconds": round(media, 3) if media else None,
+            "wall_seconds": round(wall, 3),
+            "frames": job["frames"],
+            "fps": round(job["frames"] / wall, 1) if wall > 0 else None,
+            "speed": round(job["out_seconds"] / wall, 2) if wall > 0 else None,
+            "returncode": returncode,
+        }
+        if usage:
+            stats.update({
+                key: usage[key]
+                for key in ("user_cpu_seconds", "sys_cpu_seconds", "max_rss_mb", "read_bytes", "write_bytes")
+                if key in usage
+            })
+        with self._lock:
+            self._active.pop(id(job), None)
+            if job["planned"]:
+                self._planned_done += job["media_seconds"] or job["out_seconds"]
+            self.jobs.append(stats)
+        return stats
+
+    def _read_progress(self, read_fd: int, job: Dict) -> None:
+        """Parse `key=value` progress blocks as FFmpeg writes them."""
+        values = {}
+        with os.fdopen(read_fd, 'r', errors='replace') as stream:
+            for line in stream:
+                key, _, value = line.strip().partition('=')
+                if key != "progress":
+                    values[key] = value
+                    continue
+                self._update(job, values)
+                values = {}
+
+    def _update(self, job: Dict, values: Dict) -> None:
+        """Apply one progress block and log it if the interval has passed."""
+        out_us = values.get("out_time_us") or values.get("out_time_ms")
+        try:
+            if out_us and out_us != "N/A":
+                job["out_seconds"] = max(0.0, int(out_us) / 1_000_000)
+            if values.get("frame"):
+                job["frames"] = int(values["frame"])
+            if values.get("fps"):
+                job["fps"] = float(values["fps"])
+        except ValueError:
+            return
+        speed = values.get("speed", "").rstrip('x')
+        if speed and speed != "N/A":
+            try:
+                job["speed"] = float(speed)
+            except ValueError:
+                pass
+
+        now = time.perf_counter()
+        if now - job["last_log"] < self.LOG_INTERVAL:
+            return
+        job["last_log"] = now
+        logger.info(f"    [{self.name}] {job['label']}: {self._describe(job, now)}{self._describe_script(now)}")
+
+    def _describe(self, job: Dict, now: float) -> str:
+        """Progress text for one job."""
+        parts = [f"{job['fps']:.0f} fps"]
+        if job["speed"] is not None:
+            parts.append(f"{job['speed']:.2f}x")
+        media = job["media_seconds"]
+        if media:
+            parts.insert(0, f"{min(100.0, 100 * job['out_seconds'] / media):.0f}%")
+            rate = job["out_seconds"] / (now - job["start"])
+            if rate > 0:
+                parts.append(f"ETA {self._format_seconds((media - job['out_seconds']) / rate)}")
+        return ", ".join(parts)
+
+    def _describe_script(self, now: float) -> str:
+        """Progress text for the planned jobs of the whole script."""
+        with self._lock:
+            if not self.expected_media_seconds or self._planned_start is None:
+                return ""
+            done = self._planned_done + sum(
+                job["out_seconds"] for job in self._active.values() if job["planned"]
+            )
+            elapsed = now - self._planned_start
+        if done <= 0 or elapsed <= 0:
+            return ""
+        remaining = max(0.0, self.expected_media_seconds - done)
+        percent = min(100.0, 100 * done / self.expected_media_seconds)
+        return f" | script {percent:.0f}%, ETA {self._format_seconds(remaining * elapsed / done)}"
+
+    @staticmethod
+    def _read_stderr(stream: IO[bytes], tail: deque) -> None:
+        """Keep the last lines of stderr without buffering all of it."""
+        for line in iter(stream.readline, b''):
+            tail.append(line.decode('utf-8', errors='replace'))
+        stream.close()
+
+    @staticmethod
+    def _format_seconds(seconds: float) -> str:
+        """Format a duration as 1m05s or 42s."""
+        seconds = int(round(seconds))
+        if seconds >= 60:
+            return f"{seconds // 60}m{seconds % 60:02d}s"
+        return f"{seconds}s"
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Log Routing Module
+Non-blocking logging with records routed to per-script logs by context.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+_log_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default={})
+
+CONSOLE_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+SCRIPT_FORMAT = '%(asctime)s - %(levelname)s - %(scene_tag)s%(message)s'
+
+
+@contextmanager
+def log_context(**fields) -> Iterator[None]:
+    """
+    Tag every record logged inside the block (script=..., scene=...).
+
+    Contexts nest; inner fields override outer ones. Worker threads see
+    the context when their callable is wrapped with
+    tracing.in_current_context.
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the script and scene of the context that logged them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _log_context.get()
+        record.script = context.get("script")
+        record.scene = context.get("scene")
+        record.scene_tag = f"[scene {record.scene}] " if record.scene is not None else ""
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record, for machine parsing."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "script": getattr(record, "script", None),
+            "scene": getattr(record, "scene", None),
+            "message": record.getMessage(),
+        })
+
+
+class ScriptLogRouter(logging.Handler):
+    """
+    Writes queued records to the console and to the log of their script.
+
+    Runs on the listener thread only, so the threads that log never wait
+    on a write. Script logs are opened and closed through the same queue
+    as the records, so every record logged while a script's log is open
+    reaches that file and no other.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue, console: logging.Handler):
+        """
+        Initialize the router.
+
+        Args:
+            log_queue: Queue the listener drains (control records go here too)
+            console: Handler every record is written to
+        """
+        super().__init__()
+        self.queue = log_queue
+        self.console = console
+        self._files: Dict[str, logging.Handler] = {}
+
+    def open_script(self, script_name: str, path: Path, json_lines: bool = False) -> None:
+        """
+        Start writing the script's records to path (appending).
+
+        Args:
+            script_name: Script whose records go to the file
+            path: Log file
+            json_lines: Write JSON lines instead of text
+        """
+        handler = logging.FileHandler(path, delay=True)
+        handler.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(SCRIPT_FORMAT))
+        self._control("open", script_name, handler)
+
+    def close_script(self, script_name: str) -> None:
+        """Stop writing the script's records once those already queued are written."""
+        self._control("close", script_name)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        control = getattr(record, "log_control", None)
+        if control:
+            action, script_name, handler = control
+            previous = self._files.pop(script_name, None)
+            if previous:
+                previous.close()
+            if action == "open":
+                self._files[script_name] = handler
+            return
+
+        if record.levelno >= self.console.level:
+            self.console.handle(record)
+        script_log = self._files.get(getattr(record, "script", None))
+        if script_log:
+            script_log.handle(record)
+
+    def shutdown(self) -> None:
+        """Close every open script log (listener stopped)."""
+        for handler in self._files.values():
+            handler.close()
+        self._files.clear()
+
+    def _control(self, action: str, script_name: str, handler: Optional[logging.Handler] = None) -> None:
+        """Queue an open/close so it is ordered with the records around it."""
+        self.queue.put_nowait(logging.makeLogRecord({"log_control": (action, script_name, handler)}))
+
+
+_router: Optional[ScriptLogRouter] = None
+
+
+def configure_logging(level: int = logging.INFO) -> ScriptLogRouter:
+    """
+    Route all logging through a queue drained by a background listener.
+
+    The root logger gets a QueueHandler, so logging from any thread only
+    stamps the record with its context and enqueues it. Calling this
+    again returns the router already installed.
+    """
+    global _router
+    if _router is not None:
+        return _router
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    _router = ScriptLogRouter(log_queue, console)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, _router)
+    listener.start()
+
+    def shutdown() -> None:
+        listener.stop()
+        _router.shutdown()
+
+    atexit.register(shutdown)
+    return _router
+
+
+def get_log_router() -> ScriptLogRouter:
+    """Return the process-wide router, configuring logging if needed."""
+    return configure_logging()
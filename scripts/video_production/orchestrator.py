@@ -4,31 +4,42 @@ Video Production Orchestrator
 Main orchestration script for automated video production from scripts.
 """
 
+import argparse
 import os
 import sys
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 import json
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from artifact_store import ArtifactStore
+from scene_dedup import SceneClipCache, plan_dedup
 from script_scanner import ScriptScanner
+from script_watcher import ScriptWatcher
+from render_server import RenderServer
 from script_parser import ScriptParser
 from audio_generator import AudioGenerator
 from visual_generator import VisualGenerator
 from video_assembler import VideoAssembler
+from demo_cache import DemoCaptureCache
+from demo_timeline import DemoTimeline
+from encoder_budget import EncoderBudget
+from encoding_profiles import ProfileCalibrator, get_profile
+from log_routing import configure_logging, get_log_router, log_context
+from ffmpeg_progress import ProgressTracker
+from process_runner import get_accounting, reset_accounting, resource_scope
+from run_journal import RunJournal, SceneCheckpoint, fingerprint
+from work_queue import QueueWorker, WorkQueue, enqueue_scripts
+from timeout_policy import TimeoutPolicy
+from tracing import get_tracer, reset_tracer
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging (records are written by a background listener)
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +63,21 @@ class VideoProductionOrchestrator:
         self.resolution = config.get('VIDEO_RESOLUTION', '1920x1080')
         self.fps = int(config.get('FPS', '30'))
         self.headless = config.get('HEADLESS', 'true').lower() == 'true'
+        self.draft = str(config.get('DRAFT', 'false')).lower() == 'true'
+        self.assembly_mode = config.get('ASSEMBLY_MODE', 'per_scene')
+        hls_seconds = config.get('HLS_SEGMENT_SECONDS')
+        self.hls_segment_seconds = float(hls_seconds) if hls_seconds else None
+        self.renditions = [r.strip() for r in (config.get('RENDITIONS') or '').split(',') if r.strip()]
+        transition = (config.get('TRANSITION') or 'none').lower()
+        self.transition = None if transition in ('none', 'cut') else transition
+        self.transition_duration = float(config.get('TRANSITION_DURATION', '0.5'))
+        self.resume = str(config.get('RESUME', 'false')).lower() == 'true'
+        self.keep_scene_clips = str(config.get('KEEP_SCENE_CLIPS', 'false')).lower() == 'true'
+        self.scene_dedup = str(config.get('SCENE_DEDUP', 'true')).lower() == 'true'
+        self.log_json = str(config.get('LOG_FORMAT', 'text')).lower() == 'jsonl'
+        self.journal: Optional[RunJournal] = None
+        # Called with (stage, "started"/"finished") around each pipeline stage
+        self.stage_listener: Optional[Callable[[str, str], None]] = None
         
         # Create output directories
         self.video_out_dir.mkdir(parents=True, exist_ok=True)
@@ -59,9 +85,59 @@ class VideoProductionOrchestrator:
         self.visuals_dir = self.video_out_dir / 'visuals'
         self.logs_dir = self.video_out_dir / 'logs'
         
-        for dir_path in [self.audio_dir, self.visuals_dir, self.logs_dir]:
+        # Draft renders go to their own directory at reduced resolution/FPS;
+        # narration audio and demo captures are shared with full renders
+        self.render_dir = self.video_out_dir / 'draft' if self.draft else self.video_out_dir
+        self.render_visuals_dir = self.render_dir / 'visuals'
+        self.render_resolution = config.get('DRAFT_RESOLUTION', '854x480') if self.draft else self.resolution
+        self.render_fps = int(config.get('DRAFT_FPS', '15')) if self.draft else self.fps
+        
+        for dir_path in [self.audio_dir, self.visuals_dir, self.logs_dir, self.render_visuals_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
         
+        # Demo captures are shared by every script in the run
+        self.demo_cache = DemoCaptureCache(
+            self.visuals_dir / 'demo_cache',
+            int(config.get('DEMO_CACHE_WINDOW', '3600'))
+        )
+        # One encoder thread budget for every scene encode in the run
+        cpu_budget = config.get('ENCODE_CPU_BUDGET')
+        max_jobs = config.get('ENCODE_MAX_JOBS')
+        self.encoder_budget = EncoderBudget(
+            int(cpu_budget) if cpu_budget else None,
+            int(max_jobs) if max_jobs else None
+        )
+        # Encoding profile for full renders ("auto" calibrates on this host);
+        # drafts always use the draft profile
+        profile_name = config.get('ENCODING_PROFILE', 'standard')
+        if profile_name == 'auto':
+            min_speed = config.get('ENCODE_MIN_SPEED')
+            max_kbps = config.get('ENCODE_MAX_KBPS')
+            calibrator = ProfileCalibrator(self.logs_dir / 'encoder_calibration.json', self.resolution, self.fps)
+            self.profile = calibrator.select(
+                float(min_speed) if min_speed else None,
+                float(max_kbps) if max_kbps else None
+            )
+        else:
+            self.profile = get_profile(profile_name)
+        self.render_profile = get_profile('draft') if self.draft else self.profile
+        
+        # Job deadlines scale with input size and this host's recent throughput
+        self.timeouts = TimeoutPolicy(self.logs_dir / 'throughput_history.json')
+        
+        # Intermediates are tracked so they can be kept within a size budget
+        quota_mb = config.get('ARTIFACT_QUOTA_MB')
+        self.artifact_store = ArtifactStore(
+            self.video_out_dir,
+            int(float(quota_mb) * 1024 * 1024) if quota_mb else None
+        )
+        
+        # Scenes repeated across scripts are encoded once and their clip reused
+        self.scene_cache = SceneClipCache(self.render_dir / 'scene_cache') if self.scene_dedup else None
+        
+        timeline_file = config.get('DEMO_TIMELINE')
+        self.demo_timeline = DemoTimeline.from_file(timeline_file) if timeline_file else DemoTimeline()
+        
         logger.info("="*80)
         logger.info("VIDEO PRODUCTION AGENT INITIALIZED")
         logger.info("="*80)
@@ -73,15 +149,45 @@ class VideoProductionOrchestrator:
         logger.info(f"Voice mode: {self.voice_mode}")
         logger.info(f"Resolution: {self.resolution} @ {self.fps} FPS")
         logger.info(f"Headless mode: {self.headless}")
+        logger.info(f"Encoding profile: {self.render_profile.name} (preset {self.render_profile.preset})")
+        if self.draft:
+            logger.info(f"Draft mode: {self.render_resolution} @ {self.render_fps} FPS -> {self.render_dir}")
         logger.info("="*80)
     
     def run(self) -> Dict:
         """
         Execute the complete video production workflow.
         
+        The run is traced; the trace is written to logs/production_trace.json
+        and its per-stage timings are rolled up into the summary.
+        
         Returns:
             Dictionary with results summary
         """
+        tracer = reset_tracer()
+        accounting = reset_accounting()
+        with tracer.span("run", "run"):
+            results = self._run_scripts()
+        
+        if "end_time" in results:
+            trace_file = tracer.export(self.logs_dir / "production_trace.json")
+            results["trace"] = {"file": trace_file, **tracer.rollup()}
+            results["resources"] = {
+                "by_stage": accounting.summary("stage"),
+                "by_script": accounting.summary("script"),
+                "by_command": accounting.summary("command"),
+            }
+            self._save_summary_log(results)
+        
+        return results
+    
+    def _run_scripts(self) -> Dict:
+        """
+        Scan for scripts and produce a video for each.
+        
+        Returns:
+            Dictionary with results summary (with "end_time" once complete)
+        """
         start_time = datetime.now()
         results = {
             "start_time": start_time.isoformat(),
@@ -108,15 +214,23 @@ class VideoProductionOrchestrator:
             logger.info(f"Found {len(scripts)} script(s) to process")
             results["logs"].append(f"Found {len(scripts)} scripts")
             
+            # Every finished scene artifact and script is journaled, so an
+            # interrupted run can pick up where it stopped
+            self.journal = RunJournal(self._journal_path(), self.resume, self._render_settings())
+            dedup_plan = self._plan_dedup(scripts) if self.scene_cache else None
+            
             # Step 2: Process each script
             for script in scripts:
-                script_result = self._process_script(script)
+                script_result = self._render_script(script)
                 
                 if script_result["success"]:
                     results["videos_created"].append(script_result)
                 else:
                     results["videos_failed"].append(script_result)
             
+            self.timeouts.save()
+            results["artifacts"] = self.artifact_store.enforce_quota()
+            
             # Summary
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
@@ -125,6 +239,24 @@ class VideoProductionOrchestrator:
             results["duration_seconds"] = duration
             results["success_count"] = len(results["videos_created"])
             results["failure_count"] = len(results["videos_failed"])
+            results["demo_cache"] = {
+                "hits": self.demo_cache.hits,
+                "misses": self.demo_cache.misses
+            }
+            results["ffmpeg"] = self._ffmpeg_totals(results["videos_created"] + results["videos_failed"])
+            results["timeout_kills"] = len(self.timeouts.kills)
+            results["resume"] = {
+                "resumed": self.resume,
+                "journal": str(self.journal.path),
+                "scripts_skipped": self.journal.skipped_scripts,
+                "scenes_restored": self.journal.restored_scenes,
+            }
+            results["failure_classes"] = {
+                failure_class: sum(1 for v in results["videos_failed"] if v.get("failure_class") == failure_class)
+                for failure_class in ("timeout", "error")
+            }
+            if dedup_plan:
+                results["dedup"] = {**dedup_plan, **self.scene_cache.summary()}
             
             logger.info("\n" + "="*80)
             logger.info("VIDEO PRODUCTION COMPLETE")
@@ -132,29 +264,92 @@ class VideoProductionOrchestrator:
             logger.info(f"Total time: {duration:.1f} seconds")
             logger.info(f"Videos created: {results['success_count']}")
             logger.info(f"Videos failed: {results['failure_count']}")
+            if dedup_plan:
+                logger.info(
+                    f"Shared scene clips reused: {results['dedup']['clips_reused']} "
+                    f"({results['dedup']['encode_seconds_saved']:.1f}s of encoding saved)"
+                )
             logger.info("="*80)
-            
-            # Save summary log
-            self._save_summary_log(results)
-            
+
         except Exception as e:
             logger.error(f"Fatal error in orchestrator: {e}", exc_info=True)
             results["logs"].append(f"FATAL ERROR: {e}")
+        finally:
+            if self.journal:
+                self.journal.close()
         
         return results
     
-    def _process_script(self, script: Dict) -> Dict:
+    def render_script(self, script_path: str) -> Dict:
+        """
+        Render one script in this process, keeping warm state between calls.
+        
+        Used by watch mode and the render server. The journal is kept open across calls, so
+        scenes whose inputs did not change are restored instead of rendered
+        again, and an unchanged script is not rendered at all.
+        
+        Args:
+            script_path: Path to the script file
+            
+        Returns:
+            Result dictionary of the script
+        """
+        path = Path(script_path).absolute()
+        script = {
+            "path": str(path),
+            "name": path.stem,
+            "extension": path.suffix,
+            "size": path.stat().st_size
+        }
+        if self.journal is None:
+            self.journal = RunJournal(self._journal_path(), resume=True, settings=self._render_settings())
+        
+        # Each render gets its own trace and accounting so they do not grow
+        # for the life of the process
+        tracer = reset_tracer()
+        reset_accounting()
+        with tracer.span("run", "run"):
+            result = self._render_script(script)
+        self.timeouts.save()
+        self.artifact_store.enforce_quota()
+        return result
+    
+    def _render_script(self, script: Dict) -> Dict:
+        """
+        Render a script unless the journal shows it already finished.
+        
+        Args:
+            script: Script metadata dictionary
+            
+        Returns:
+            Result dictionary (the recorded one, marked "resumed", if skipped)
+        """
+        script_key = self._script_key(script)
+        script_result = self.journal.finished_script(script['name'], script_key)
+        if script_result:
+            logger.info(f"\nSkipping {script['name']}: already finished ({script_result['video_path']})")
+            return {**script_result, "resumed": True}
+        
+        with get_tracer().span(script['name'], "script"), resource_scope(script=script['name']), \
+                log_context(script=script['name']):
+            script_result = self._process_script(script, self.journal.checkpoint(script['name']))
+        self.journal.record_script(script['name'], script_key, script_result)
+        return script_result
+    
+    def _process_script(self, script: Dict, checkpoint: Optional[SceneCheckpoint] = None) -> Dict:
         """
         Process a single script to produce a video.
         
         Args:
             script: Script metadata dictionary
+            checkpoint: Run journal view for the script's scene artifacts
             
         Returns:
             Result dictionary
         """
         script_path = script['path']
         script_name = script['name']
+        checkpoint = checkpoint or SceneCheckpoint()
         
         result = {
             "script_name": script_name,
@@ -166,12 +361,12 @@ class VideoProductionOrchestrator:
             "fallbacks": []
         }
         
-        # Create script-specific log
-        log_file = self.logs_dir / f"{script_name}_log.txt"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        logger.addHandler(file_handler)
+        # Records logged in this script's context also go to its own log
+        log_file = self.script_log_path(script_name)
+        get_log_router().open_script(script_name, log_file, self.log_json)
+        
+        # Every FFmpeg job of this script reports progress and metrics here
+        progress = ProgressTracker(script_name, self.timeouts)
         
         try:
             logger.info("\n" + "="*80)
@@ -182,14 +377,16 @@ class VideoProductionOrchestrator:
             logger.info("\nParsing script structure...")
             parser = ScriptParser(script_path)
             
-            if not parser.load():
+            with self._stage("parse"):
+                loaded = parser.load()
+                scenes = parser.parse() if loaded else []
+            
+            if not loaded:
                 error = "Failed to load script"
                 logger.error(error)
                 result["errors"].append(error)
                 return result
             
-            scenes = parser.parse()
-            
             if not scenes:
                 error = "No scenes found in script"
                 logger.error(error)
@@ -205,8 +402,9 @@ class VideoProductionOrchestrator:
             logger.info("Generating narration audio...")
             logger.info("-"*80)
             
-            audio_gen = AudioGenerator(self.audio_dir, self.voice_mode)
-            audio_files = audio_gen.generate_from_scenes(scenes, script_name)
+            audio_gen = AudioGenerator(self.audio_dir, self.voice_mode, progress=progress, checkpoint=checkpoint)
+            with self._stage("audio", scenes=len(scenes)):
+                audio_files = audio_gen.generate_from_scenes(scenes, script_name)
             
             if not audio_files:
                 error = "No audio files were generated"
@@ -222,13 +420,25 @@ class VideoProductionOrchestrator:
             logger.info("Generating visuals...")
             logger.info("-"*80)
             
-            visual_gen = VisualGenerator(self.visuals_dir, self.resolution, self.fps)
-            visual_files = visual_gen.generate_for_scenes(
-                scenes,
-                script_name,
-                self.demo_url,
-                self.headless
+            visual_gen = VisualGenerator(
+                self.render_visuals_dir,
+                self.render_resolution,
+                self.render_fps,
+                demo_cache=self.demo_cache,
+                timeline=self.demo_timeline,
+                capture_resolution=self.resolution,
+                capture_fps=self.fps,
+                capture_profile=self.profile,
+                progress=progress,
+                checkpoint=checkpoint
             )
+            with self._stage("visuals", scenes=len(scenes)):
+                visual_files = visual_gen.generate_for_scenes(
+                    scenes,
+                    script_name,
+                    self.demo_url,
+                    self.headless
+                )
             
             if not visual_files:
                 error = "No visual files were generated"
@@ -238,6 +448,9 @@ class VideoProductionOrchestrator:
                 return result
             
             logger.info(f"✓ Generated {len(visual_files)} visual file(s)")
+            # Demo segments are cut from the cached capture, which is worth keeping too
+            checkpoint.paths += [vf['source'] for vf in visual_files if vf.get('source')]
+            checkpoint.paths += [vf['path'] for vf in visual_files if vf['type'] == 'demo_capture']
             
             # Check for fallbacks used
             for vf in visual_files:
@@ -249,8 +462,30 @@ class VideoProductionOrchestrator:
             logger.info("Assembling final video...")
             logger.info("-"*80)
             
-            assembler = VideoAssembler(self.video_out_dir, self.resolution, self.fps)
-            video_path = assembler.assemble(script_name, scenes, audio_files, visual_files)
+            assembler = VideoAssembler(
+                self.render_dir,
+                self.render_resolution,
+                self.render_fps,
+                profile=self.render_profile,
+                mode=self.assembly_mode,
+                encoder_budget=self.encoder_budget,
+                renditions=[] if self.draft else self.renditions,
+                hls_segment_seconds=self.hls_segment_seconds,
+                transition=self.transition,
+                transition_duration=self.transition_duration,
+                progress=progress,
+                checkpoint=checkpoint,
+                keep_scene_clips=self.keep_scene_clips,
+                scene_cache=self.scene_cache
+            )
+            with self._stage("assembly", mode=self.assembly_mode):
+                video_path = assembler.assemble(script_name, scenes, audio_files, visual_files)
+            if assembler.encode_stats:
+                result["encoding"] = assembler.encode_stats
+            if assembler.rendition_outputs:
+                result["renditions"] = assembler.rendition_outputs
+            if assembler.hls_playlist:
+                result["hls_playlist"] = assembler.hls_playlist
             
             if video_path:
                 logger.info(f"✓ Video created: {video_path}")
@@ -268,12 +503,104 @@ class VideoProductionOrchestrator:
             result["errors"].append(error)
         
         finally:
-            # Remove file handler
-            logger.removeHandler(file_handler)
-            file_handler.close()
+            self._track_artifacts(result, checkpoint.paths)
+            result["ffmpeg"] = progress.summary()
+            result["resources"] = get_accounting().summary("stage", script=script_name)
+            if progress.timeout_kills:
+                result["timeouts"] = progress.timeout_kills
+            if not result["success"]:
+                # A script that lost a job to its deadline failed differently
+                # from one whose tools reported an error
+                result["failure_class"] = "timeout" if progress.timeout_kills else "error"
+            
+            get_log_router().close_script(script_name)
         
         return result
     
+    def script_log_path(self, script_name: str) -> Path:
+        """Per-script log file (JSON lines with LOG_FORMAT=jsonl)."""
+        return self.logs_dir / f"{script_name}_log.{'jsonl' if self.log_json else 'txt'}"
+    
+    def _track_artifacts(self, result: Dict, paths: List[str]) -> None:
+        """Record the intermediates a script used; pin them if its video was made."""
+        try:
+            self.artifact_store.touch(paths)
+            if result["success"]:
+                outputs = [result["video_path"], result.get("hls_playlist")]
+                outputs += [r["path"] for r in result.get("renditions", [])]
+                self.artifact_store.pin(result["script_name"], outputs, paths)
+        except Exception as e:
+            # Bookkeeping must never fail a render
+            logger.warning(f"Could not update the artifact store: {e}")
+    
+    def _journal_path(self) -> Path:
+        """Location of the run journal (drafts keep their own)."""
+        return self.logs_dir / ("draft_run_journal.jsonl" if self.draft else "run_journal.jsonl")
+    
+    def _render_settings(self) -> Dict:
+        """Settings that change what a script renders to."""
+        return {
+            "voice_mode": self.voice_mode,
+            "resolution": self.render_resolution,
+            "fps": self.render_fps,
+            "profile": self.render_profile.cache_key(),
+            "assembly_mode": self.assembly_mode,
+            "renditions": [] if self.draft else self.renditions,
+            "hls_segment_seconds": self.hls_segment_seconds,
+            "transition": self.transition,
+            "transition_duration": self.transition_duration,
+            "demo_url": self.demo_url,
+            "demo_timeline": self.demo_timeline.fingerprint(),
+        }
+    
+    def settings_key(self) -> str:
+        """Fingerprint of the render settings (queue workers only take jobs that match theirs)."""
+        return fingerprint(self._render_settings())
+    
+    def _script_key(self, script: Dict) -> str:
+        """Fingerprint of a script's text and the settings it renders with."""
+        try:
+            text = Path(script['path']).read_text(encoding='utf-8')
+        except OSError:
+            text = None
+        return fingerprint(text, self._render_settings())
+    
+    @contextmanager
+    def _stage(self, name: str, **args) -> Iterator[None]:
+        """Trace a pipeline stage and tag the child processes it starts."""
+        if self.stage_listener:
+            self.stage_listener(name, "started")
+        with get_tracer().span(name, "stage", **args), resource_scope(stage=name):
+            yield
+        if self.stage_listener:
+            self.stage_listener(name, "finished")
+    
+    def _plan_dedup(self, scripts: List[Dict]) -> Dict:
+        """Find the scenes the batch's scripts have in common."""
+        script_scenes = {}
+        for script in scripts:
+            parser = ScriptParser(script['path'])
+            script_scenes[script['name']] = parser.parse() if parser.load() else []
+        plan = plan_dedup(script_scenes)
+        logger.info(
+            f"Scene dedup: {plan['scenes']} scene(s), {plan['unique_scenes']} unique "
+            f"({plan['dedup_ratio']}x), {len(plan['shared'])} shared across scripts"
+        )
+        return plan
+    
+    def _ffmpeg_totals(self, script_results: List[Dict]) -> Dict:
+        """Roll up per-script FFmpeg metrics for the whole run."""
+        summaries = [r["ffmpeg"] for r in script_results if r.get("ffmpeg")]
+        media = sum(s["media_seconds"] for s in summaries)
+        job_seconds = sum(s["job_seconds"] for s in summaries)
+        return {
+            "job_count": sum(s["job_count"] for s in summaries),
+            "failed_jobs": sum(s["failed_jobs"] for s in summaries),
+            "media_seconds": round(media, 3),
+            "job_seconds": round(job_seconds, 3),
+            "speed": round(media / job_seconds, 2) if job_seconds > 0 else None,
+        }
+    
     def _save_summary_log(self, results: Dict) -> None:
         """Save summary log of all operations."""
         summary_file = self.logs_dir / "production_summary.json"
@@ -294,7 +621,32 @@ class VideoProductionOrchestrator:
                 f.write(f"Duration: {results['duration_seconds']:.1f} seconds\n\n")
                 
                 f.write(f"Videos created: {results['success_count']}\n")
-                f.write(f"Videos failed: {results['failure_count']}\n\n")
+                f.write(f"Videos failed: {results['failure_count']}\n")
+                resume = results.get('resume') or {}
+                if resume.get('resumed'):
+                    f.write(f"Resumed: {resume['scripts_skipped']} finished script(s) skipped, "
+                            f"{resume['scenes_restored']} scene artifact(s) restored\n")
+                ffmpeg = results.get('ffmpeg') or {}
+                if ffmpeg.get('job_count'):
+                    f.write(f"FFmpeg jobs: {ffmpeg['job_count']} ({ffmpeg['failed_jobs']} failed), "
+                            f"{ffmpeg['media_seconds']:.1f}s of media at {ffmpeg['speed']}x realtime\n")
+                artifacts = results.get('artifacts') or {}
+                if artifacts:
+                    f.write(f"Artifacts: {artifacts['total_bytes'] / (1024 * 1024):.1f} MB in "
+                            f"{artifacts['artifacts']} artifact(s), "
+                            f"{artifacts['pinned_bytes'] / (1024 * 1024):.1f} MB pinned, "
+                            f"{artifacts['reclaimed_bytes'] / (1024 * 1024):.1f} MB evicted\n")
+                dedup = results.get('dedup') or {}
+                if dedup:
+                    f.write(f"Scene dedup: {dedup['scenes']} scene(s), {dedup['unique_scenes']} unique "
+                            f"({dedup['dedup_ratio']}x), {dedup['clips_reused']} clip(s) reused, "
+                            f"{dedup['encode_seconds_saved']:.1f}s of encoding saved\n")
+                stages = (results.get('trace') or {}).get('stage', {})
+                if stages:
+                    f.write("Stage timings (p50 / p95 per script):\n")
+                    for name, stats in stages.items():
+                        f.write(f"  {name}: {stats['p50_seconds']:.1f}s / {stats['p95_seconds']:.1f}s\n")
+                f.write("\n")
                 
                 if results['videos_created']:
                     f.write("SUCCESSFUL VIDEOS:\n")
@@ -303,6 +655,10 @@ class VideoProductionOrchestrator:
                         f.write(f"  {video['script_name']}\n")
                         f.write(f"    Video: {video['video_path']}\n")
                         f.write(f"    Log: {video['log_path']}\n")
+                        if len(video.get('renditions', [])) > 1:
+                            f.write("    Renditions:\n")
+                            for rendition in video['renditions']:
+                                f.write(f"      - {rendition['resolution']}: {rendition['path']} ({rendition['size_mb']} MB)\n")
                         if video.get('fallbacks'):
                             f.write(f"    Fallbacks used:\n")
                             for fb in video['fallbacks']:
@@ -313,7 +669,7 @@ class VideoProductionOrchestrator:
                     f.write("\nFAILED VIDEOS:\n")
                     f.write("-"*80 + "\n")
                     for video in results['videos_failed']:
-                        f.write(f"  {video['script_name']}\n")
+                        f.write(f"  {video['script_name']} ({video.get('failure_class', 'error')})\n")
                         if video.get('errors'):
                             f.write(f"    Errors:\n")
                             for err in video['errors']:
@@ -338,12 +694,141 @@ def load_config_from_env() -> Dict:
         'VIDEO_RESOLUTION': os.getenv('VIDEO_RESOLUTION', '1920x1080'),
         'FPS': os.getenv('FPS', '30'),
         'HEADLESS': os.getenv('HEADLESS', 'true'),
+        'DEMO_CACHE_WINDOW': os.getenv('DEMO_CACHE_WINDOW', '3600'),
+        'DEMO_TIMELINE': os.getenv('DEMO_TIMELINE'),
+        'ASSEMBLY_MODE': os.getenv('ASSEMBLY_MODE', 'per_scene'),
+        'ENCODE_CPU_BUDGET': os.getenv('ENCODE_CPU_BUDGET'),
+        'ENCODE_MAX_JOBS': os.getenv('ENCODE_MAX_JOBS'),
+        'ENCODING_PROFILE': os.getenv('ENCODING_PROFILE', 'standard'),
+        'ENCODE_MIN_SPEED': os.getenv('ENCODE_MIN_SPEED'),
+        'ENCODE_MAX_KBPS': os.getenv('ENCODE_MAX_KBPS'),
+        'RENDITIONS': os.getenv('RENDITIONS', ''),
+        'HLS_SEGMENT_SECONDS': os.getenv('HLS_SEGMENT_SECONDS'),
+        'TRANSITION': os.getenv('TRANSITION', 'none'),
+        'TRANSITION_DURATION': os.getenv('TRANSITION_DURATION', '0.5'),
+        'DRAFT': os.getenv('DRAFT', 'false'),
+        'DRAFT_RESOLUTION': os.getenv('DRAFT_RESOLUTION', '854x480'),
+        'DRAFT_FPS': os.getenv('DRAFT_FPS', '15'),
+        'RESUME': os.getenv('RESUME', 'false'),
+        'KEEP_SCENE_CLIPS': os.getenv('KEEP_SCENE_CLIPS', 'false'),
+        'SCENE_DEDUP': os.getenv('SCENE_DEDUP', 'true'),
+        'LOG_FORMAT': os.getenv('LOG_FORMAT', 'text'),
+        'WATCH_DEBOUNCE': os.getenv('WATCH_DEBOUNCE', '1.0'),
+        'WATCH_POLL_INTERVAL': os.getenv('WATCH_POLL_INTERVAL', '1.0'),
+        'WATCH_POLLING': os.getenv('WATCH_POLLING', 'false'),
+        'SERVER_HOST': os.getenv('SERVER_HOST', '127.0.0.1'),
+        'SERVER_PORT': os.getenv('SERVER_PORT', '8765'),
+        'SERVER_SOCKET': os.getenv('SERVER_SOCKET'),
+        'SERVER_JOB_HISTORY': os.getenv('SERVER_JOB_HISTORY', '100'),
+        'QUEUE_DB': os.getenv('QUEUE_DB'),
+        'QUEUE_LEASE_SECONDS': os.getenv('QUEUE_LEASE_SECONDS', '120'),
+        'QUEUE_MAX_ATTEMPTS': os.getenv('QUEUE_MAX_ATTEMPTS', '3'),
+        'WORKER_ID': os.getenv('WORKER_ID'),
+        'ARTIFACT_QUOTA_MB': os.getenv('ARTIFACT_QUOTA_MB'),
+        'ARTIFACT_MAX_AGE_DAYS': os.getenv('ARTIFACT_MAX_AGE_DAYS', '7'),
     }
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Produce videos from scripts (configured by environment variables)")
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continue an interrupted run from its journal instead of starting over"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and re-render scripts as they change"
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Run a local render server that renders queued jobs"
+    )
+    parser.add_argument(
+        "--enqueue", action="store_true",
+        help="Split scripts into scene and assembly jobs in the shared work queue"
+    )
+    parser.add_argument(
+        "--worker", action="store_true",
+        help="Claim and run jobs from the shared work queue"
+    )
+    parser.add_argument(
+        "--drain", action="store_true",
+        help="With --worker, exit once the queue has no jobs left"
+    )
+    parser.add_argument(
+        "--queue-status", action="store_true",
+        help="Print the progress of every script in the work queue"
+    )
+    parser.add_argument(
+        "--gc", action="store_true",
+        help="Remove stale intermediates, enforce the artifact quota and report the space reclaimed"
+    )
+    args = parser.parse_args()
+    
+    if args.gc or args.queue_status:
+        # stdout carries the JSON report; keep log lines out of it
+        get_log_router().console.setStream(sys.stderr)
+    
     config = load_config_from_env()
+    if args.resume:
+        config['RESUME'] = 'true'
+    
+    if args.watch or args.serve:
+        # Scene clips stay on disk so unchanged scenes are not encoded again
+        config['KEEP_SCENE_CLIPS'] = 'true'
+    
+    if args.gc:
+        orchestrator = VideoProductionOrchestrator(config)
+        report = orchestrator.artifact_store.gc(float(config['ARTIFACT_MAX_AGE_DAYS']) * 86400)
+        logger.info(
+            f"Artifact GC: {report['evicted_files']} file(s) removed, "
+            f"{report['reclaimed_bytes'] / (1024 * 1024):.1f} MB reclaimed; "
+            f"{report['total_bytes'] / (1024 * 1024):.1f} MB in {report['artifacts']} artifact(s) remain, "
+            f"{report['pinned_bytes'] / (1024 * 1024):.1f} MB pinned"
+        )
+        print(json.dumps(report, indent=2))
+        sys.exit(0)
+    
+    if args.enqueue or args.worker or args.queue_status:
+        orchestrator = VideoProductionOrchestrator(config)
+        queue = WorkQueue(
+            config['QUEUE_DB'] or orchestrator.video_out_dir / 'work_queue.db',
+            lease_seconds=float(config['QUEUE_LEASE_SECONDS']),
+            max_attempts=int(config['QUEUE_MAX_ATTEMPTS'])
+        )
+        if args.enqueue:
+            summary = enqueue_scripts(orchestrator, queue)
+            logger.info(f"Queued {summary['jobs']} job(s) for {summary['scripts']} script(s) in {queue.path}")
+        if args.worker:
+            QueueWorker(orchestrator, queue, config['WORKER_ID']).run(drain=args.drain)
+        if args.queue_status:
+            print(json.dumps(queue.status(), indent=2))
+        queue.close()
+        sys.exit(0)
+    
+    if args.serve:
+        orchestrator = VideoProductionOrchestrator(config)
+        server = RenderServer(
+            orchestrator,
+            host=config['SERVER_HOST'],
+            port=int(config['SERVER_PORT']),
+            socket_path=config['SERVER_SOCKET'],
+            history=int(config['SERVER_JOB_HISTORY'])
+        )
+        server.serve_forever()
+        sys.exit(0)
+    
+    if args.watch:
+        orchestrator = VideoProductionOrchestrator(config)
+        watcher = ScriptWatcher(
+            orchestrator,
+            debounce=float(config['WATCH_DEBOUNCE']),
+            poll_interval=float(config['WATCH_POLL_INTERVAL']),
+            polling=config['WATCH_POLLING'].lower() == 'true'
+        )
+        watcher.run()
+        sys.exit(0)
     
     orchestrator = VideoProductionOrchestrator(config)
     results = orchestrator.run()
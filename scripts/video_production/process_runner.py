@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Process Runner Module
+Shared subprocess runner that accounts CPU time, peak memory and I/O per child.
+"""
+
+import contextvars
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import logging
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; library children are then left unaccounted
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_scope: contextvars.ContextVar = contextvars.ContextVar("resource_scope", default={})
+
+
+@contextmanager
+def resource_scope(**labels) -> Iterator[None]:
+    """
+    Tag every child started inside the block (e.g. script=..., stage=...).
+
+    Scopes nest; inner labels override outer ones.
+    """
+    token = _scope.set({**_scope.get(), **labels})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class ResourceAccounting:
+    """Collects per-child resource usage and aggregates it by label."""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def record(self, usage: Dict) -> None:
+        """Add the usage of one finished child."""
+        with self._lock:
+            self.records.append(usage)
+
+    def summary(self, group_by: str, **filters) -> Dict:
+        """
+        Totals per value of a label.
+
+        Args:
+            group_by: Record field to group on ("stage", "script", "command")
+            **filters: Only include records whose fields equal these values
+
+        Returns:
+            {group: {"processes", "wall_seconds", "user_cpu_seconds",
+            "sys_cpu_seconds", "cpu_utilization", "peak_rss_mb", "read_mb",
+            "write_mb"}}
+        """
+        with self._lock:
+            records = [
+                r for r in self.records
+                if all(r.get(key) == value for key, value in filters.items())
+            ]
+
+        groups: Dict[str, List[Dict]] = {}
+        for record in records:
+            groups.setdefault(record.get(group_by) or "other", []).append(record)
+
+        summary = {}
+        for name, items in sorted(groups.items()):
+            wall = sum(r["wall_seconds"] for r in items)
+            user = sum(r["user_cpu_seconds"] for r in items)
+            system = sum(r["sys_cpu_seconds"] for r in items)
+            summary[name] = {
+                "processes": len(items),
+                "wall_seconds": round(wall, 3),
+                "user_cpu_seconds": round(user, 3),
+                "sys_cpu_seconds": round(system, 3),
+                # Average cores busy per child; well below 1 means I/O or waiting
+                "cpu_utilization": round((user + system) / wall, 2) if wall > 0 else None,
+                "peak_rss_mb": max(r["max_rss_mb"] for r in items),
+                "read_mb": round(sum(r.get("read_bytes") or 0 for r in items) / 1e6, 2),
+                "write_mb": round(sum(r.get("write_bytes") or 0 for r in items) / 1e6, 2),
+            }
+        return summary
+
+
+_accounting = ResourceAccounting()
+
+
+def get_accounting() -> ResourceAccounting:
+    """Return the process-wide resource accounting."""
+    return _accounting
+
+
+def reset_accounting() -> ResourceAccounting:
+    """Start new accounting (e.g. at the beginning of a run)."""
+    global _accounting
+    _accounting = ResourceAccounting()
+    return _accounting
+
+
+class TrackedProcess:
+    """
+    A Popen whose exit is collected with wait4() for its rusage.
+
+    Waiting blocks in the kernel rather than polling. Where waitid() is
+    available the child's exit is first observed without reaping it, so
+    its /proc/<pid>/io counters can still be read; it is then reaped with
+    wait4(), and the usage is recorded with the current resource scope.
+    """
+
+    def __init__(self, cmd: List[str], label: Optional[str] = None, **popen_kwargs):
+        """
+        Start the child.
+
+        Args:
+            cmd: Command line
+            label: Name for the usage record (defaults to the program name)
+            **popen_kwargs: Passed to subprocess.Popen
+        """
+        self.cmd = cmd
+        self.labels = dict(_scope.get())
+        self.label = label or Path(cmd[0]).name
+        self.start = time.perf_counter()
+        self.usage: Optional[Dict] = None
+        self.killed = False
+        self.popen = subprocess.Popen(cmd, **popen_kwargs)
+        self.pid = self.popen.pid
+        self.stdin = self.popen.stdin
+        self.stdout = self.popen.stdout
+        self.stderr = self.popen.stderr
+        self._reap_lock = threading.Lock()
+        self._timed_out = False
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """
+        Wait for the child like Popen.wait.
+
+        A child still running at the timeout is killed and reaped (so its
+        usage is recorded) before the timeout is raised.
+
+        Raises:
+            subprocess.TimeoutExpired: If the child outlived the timeout
+        """
+        if self.popen.returncode is not None or timeout is None:
+            return self._reap()
+
+        timer = threading.Timer(timeout, self._expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            returncode = self._reap()
+        finally:
+            timer.cancel()
+        if self._timed_out:
+            raise subprocess.TimeoutExpired(self.cmd, timeout)
+        return returncode
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code if the child has exited, else None."""
+        return self._reap(block=False)
+
+    def kill(self) -> None:
+        """Kill the child (it still has to be waited for)."""
+        if self.popen.returncode is None:
+            self.killed = True
+            try:
+                self.popen.kill()
+            except OSError:
+                pass
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.popen.returncode
+
+    def _expire(self) -> None:
+        """Kill the child at its timeout unless it has already exited."""
+        if not self._peek_exit(block=False):
+            self._timed_out = True
+            self.kill()
+
+    def _peek_exit(self, block: bool) -> bool:
+        """Wait for (or check) the child's exit without reaping it."""
+        if not hasattr(os, "waitid"):
+            return False
+        try:
+            flags = os.WEXITED | os.WNOWAIT | (0 if block else os.WNOHANG)
+            return os.waitid(os.P_PID, self.pid, flags) is not None
+        except ChildProcessError:
+            # Already reaped elsewhere; nothing left to account
+            return True
+
+    def _reap(self, block: bool = True) -> Optional[int]:
+        """Read I/O counters, reap with wait4 and record the usage once."""
+        with self._reap_lock:
+            if self.popen.returncode is not None:
+                return self.popen.returncode
+
+            io_counters = {}
+            if hasattr(os, "waitid"):
+                if not self._peek_exit(block):
+                    return None
+                io_counters = self._read_proc_io()
+
+            rusage = None
+            if hasattr(os, "wait4"):
+                try:
+                    pid, status, rusage = os.wait4(self.pid, 0 if block else os.WNOHANG)
+                    if not pid:
+                        return None
+                    returncode = os.waitstatus_to_exitcode(status)
+                except ChildProcessError:
+                    rusage = None
+                    returncode = self.popen.wait()
+            else:
+                returncode = self.popen.wait() if block else self.popen.poll()
+                if returncode is None:
+                    return None
+            self.popen.returncode = returncode
+
+            self.usage = {
+                "command": Path(self.cmd[0]).name,
+                "label": self.label,
+                **self.labels,
+                "returncode": returncode,
+                "killed": self.killed,
+                "wall_seconds": round(time.perf_counter() - self.start, 3),
+                "user_cpu_seconds": round(rusage.ru_utime, 3) if rusage else 0.0,
+                "sys_cpu_seconds": round(rusage.ru_stime, 3) if rusage else 0.0,
+                # ru_maxrss is in kilobytes on Linux
+                "max_rss_mb": round(rusage.ru_maxrss / 1024, 1) if rusage else 0.0,
+                **io_counters,
+            }
+            get_accounting().record(self.usage)
+            return returncode
+
+    def _read_proc_io(self) -> Dict:
+        """Read /proc/<pid>/io (Linux only; empty elsewhere or if not permitted)."""
+        try:
+            with open(f"/proc/{self.pid}/io", 'r') as f:
+                fields = dict(line.split(':', 1) for line in f if ':' in line)
+        except OSError:
+            return {}
+        return {
+            "read_bytes": int(fields.get("read_bytes", 0)),
+            "write_bytes": int(fields.get("write_bytes", 0)),
+            "rchar": int(fields.get("rchar", 0)),
+            "wchar": int(fields.get("wchar", 0)),
+        }
+
+
+def run_process(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    capture_output: bool = False,
+    text: bool = False,
+    stdout=None,
+    stderr=None,
+    label: Optional[str] = None
+) -> subprocess.CompletedProcess:
+    """
+    Drop-in for the subprocess.run calls of this package, with accounting.
+
+    Args:
+        cmd: Command line
+        timeout: Seconds before the child is killed
+        capture_output: Capture stdout and stderr
+        text: Decode captured output as text
+        stdout: Explicit stdout target (ignored with capture_output)
+        stderr: Explicit stderr target (ignored with capture_output)
+        label: Name for the usage record
+
+    Returns:
+        CompletedProcess with an extra `usage` attribute
+
+    Raises:
+        subprocess.TimeoutExpired: If the child outlives its timeout (it is
+            killed and accounted first)
+    """
+    if capture_output:
+        stdout = stderr = subprocess.PIPE
+
+    process = TrackedProcess(
+        cmd, label,
+        stdin=subprocess.DEVNULL, stdout=stdout, stderr=stderr
+    )
+
+    output = {}
+    readers = []
+    for name, stream in (("stdout", process.stdout), ("stderr", process.stderr)):
+        if stream is not None:
+            reader = threading.Thread(target=_drain, args=(stream, output, name), daemon=True)
+            reader.start()
+            readers.append(reader)
+
+    try:
+        returncode = process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        for reader in readers:
+            reader.join(timeout=5)
+        raise subprocess.TimeoutExpired(
+            cmd, timeout, _decode(output.get("stdout"), text), _decode(output.get("stderr"), text)
+        )
+
+    for reader in readers:
+        reader.join()
+
+    result = subprocess.CompletedProcess(
+        cmd, returncode, _decode(output.get("stdout"), text), _decode(output.get("stderr"), text)
+    )
+    result.usage = process.usage
+    return result
+
+
+_command_cache: Dict[tuple, bool] = {}
+
+
+def command_available(command: str) -> bool:
+    """
+    Whether a command is on PATH.
+
+    Each command is probed with `which` once per PATH value and the answer
+    is kept for the life of the process, so long-running modes do not fork
+    a probe for every scene.
+    """
+    key = (command, os.environ.get("PATH", ""))
+    if key not in _command_cache:
+        try:
+            result = run_process(["which", command], capture_output=True, timeout=5)
+            _command_cache[key] = result.returncode == 0
+        except (subprocess.TimeoutExpired, OSError):
+            _command_cache[key] = False
+    return _command_cache[key]
+
+
+@contextmanager
+def account_descendants(label: str) -> Iterator[None]:
+    """
+    Account children started by a library (e.g. Playwright's browser).
+
+    Uses the change in RUSAGE_CHILDREN across the block, so it is only
+    accurate when no other children finish concurrently. Peak RSS is the
+    largest of any child so far, not only those of the block.
+    """
+    if resource is None:
+        yield
+        return
+
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    labels = dict(_scope.get())
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        get_accounting().record({
+            "command": label,
+            "label": label,
+            **labels,
+            "returncode": None,
+            "wall_seconds": round(time.perf_counter() - start, 3),
+            "user_cpu_seconds": round(after.ru_utime - before.ru_utime, 3),
+            "sys_cpu_seconds": round(after.ru_stime - before.ru_stime, 3),
+            "max_rss_mb": round(after.ru_maxrss / 1024, 1),
+        })
+
+
+def _drain(stream, output: Dict, name: str) -> None:
+    """Read a pipe to the end."""
+    output[name] = stream.read()
+    stream.close()
+
+
+def _decode(data: Optional[bytes], text: bool):
+    """Decode captured bytes when text mode was requested."""
+    if data is None or not text:
+        return data
+    return data.decode('utf-8', errors='replace')
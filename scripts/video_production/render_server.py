@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Render Server Module
+Long-lived local HTTP service that renders queued jobs in a warm process.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import re
+import signal
+import socketserver
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Job states; the last three are final
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINAL_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+# Largest request body accepted (inline scripts included)
+MAX_BODY_BYTES = 4 * 1024 * 1024
+
+
+class JobQueue:
+    """
+    Render jobs ordered by priority, then submission order.
+
+    Jobs are plain dicts. Every state change is appended to the job's
+    "events" list and wakes the threads waiting on the queue, which is how
+    status streams follow a job.
+    """
+
+    def __init__(self, history: int = 100):
+        """
+        Initialize the queue.
+
+        Args:
+            history: Finished jobs kept for status queries before the oldest
+                are forgotten
+        """
+        self.history = history
+        self.jobs: Dict[str, Dict] = {}
+        self._heap: List[tuple] = []
+        self._ids = itertools.count(1)
+        self._finished: List[str] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def submit(
+        self,
+        script_path: str,
+        priority: int = 0,
+        name: Optional[str] = None,
+        script_text: Optional[str] = None
+    ) -> Dict:
+        """
+        Queue a script for rendering.
+
+        Args:
+            script_path: Script file to render
+            priority: Higher runs sooner; equal priorities run in submission order
+            name: Display name (defaults to the script's file name)
+            script_text: Inline script text, written to script_path when the
+                job starts (so later submissions cannot change it)
+
+        Returns:
+            Snapshot of the new job
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("render server is shutting down")
+            sequence = next(self._ids)
+            job = {
+                "id": f"job-{sequence}",
+                "name": name or Path(script_path).stem,
+                "script_path": str(script_path),
+                "script_text": script_text,
+                "priority": priority,
+                "status": QUEUED,
+                "submitted": datetime.now().isoformat(),
+                "started": None,
+                "finished": None,
+                "result": None,
+                "events": [],
+            }
+            self.jobs[job["id"]] = job
+            heapq.heappush(self._heap, (-priority, sequence, job["id"]))
+            self._event(job, QUEUED)
+            return self._snapshot(job)
+
+    def next_job(self) -> Optional[Dict]:
+        """
+        Block until a job is due, mark it running and return it.
+
+        Returns:
+            The job, or None once the queue is closed
+        """
+        with self._condition:
+            while True:
+                while self._heap:
+                    _, _, job_id = heapq.heappop(self._heap)
+                    job = self.jobs.get(job_id)
+                    if job and job["status"] == QUEUED:
+                        job["status"] = RUNNING
+                        job["started"] = datetime.now().isoformat()
+                        self._event(job, RUNNING)
+                        return job
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+    def progress(self, job: Dict, **fields) -> None:
+        """Publish an intermediate event (e.g. a pipeline stage) of a running job."""
+        with self._condition:
+            self._event(job, job["status"], **fields)
+
+    def finish(self, job: Dict, result: Optional[Dict], error: Optional[str] = None) -> None:
+        """Record a job's outcome."""
+        with self._condition:
+            succeeded = bool(result and result.get("success"))
+            job["status"] = SUCCEEDED if succeeded else FAILED
+            job["finished"] = datetime.now().isoformat()
+            job["result"] = result
+            fields = {"video_path": result.get("video_path")} if succeeded else {
+                "errors": [error] if error else (result or {}).get("errors", [])
+            }
+            self._event(job, job["status"], **fields)
+            self._retire(job)
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """
+        Cancel a job that has not started.
+
+        Returns:
+            Snapshot of the job (unchanged if it already started), or None
+            if there is no such job
+        """
+        with self._condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if job["status"] == QUEUED:
+                job["status"] = CANCELLED
+                job["finished"] = datetime.now().isoformat()
+                self._event(job, CANCELLED)
+                self._retire(job)
+            return self._snapshot(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Snapshot of a job (None if unknown)."""
+        with self._condition:
+            job = self.jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def list(self) -> List[Dict]:
+        """Snapshots of every known job, newest first, without their events."""
+        with self._condition:
+            jobs = [self._snapshot(job, events=False) for job in self.jobs.values()]
+        return jobs[::-1]
+
+    def position(self, job_id: str) -> Optional[int]:
+        """Number of queued jobs that will run before this one (None if not queued)."""
+        with self._condition:
+            entries = sorted(entry for entry in self._heap if self.jobs.get(entry[2], {}).get("status") == QUEUED)
+            for index, entry in enumerate(entries):
+                if entry[2] == job_id:
+                    return index
+            return None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of known jobs in each state."""
+        with self._condition:
+            counts = {state: 0 for state in (QUEUED, RUNNING) + FINAL_STATES}
+            for job in self.jobs.values():
+                counts[job["status"]] += 1
+            return counts
+
+    def wait_events(self, job_id: str, seen: int, timeout: float) -> tuple:
+        """
+        Wait for events of a job beyond the first `seen`.
+
+        Returns:
+            (new events, whether the job is final); ([], True) for unknown jobs
+        """
+        with self._condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return [], True
+            if len(job["events"]) <= seen and job["status"] not in FINAL_STATES:
+                self._condition.wait(timeout)
+            return list(job["events"][seen:]), job["status"] in FINAL_STATES
+
+    def close(self) -> None:
+        """Stop handing out jobs; queued jobs are cancelled."""
+        with self._condition:
+            self._closed = True
+            for job in self.jobs.values():
+                if job["status"] == QUEUED:
+                    job["status"] = CANCELLED
+                    job["finished"] = datetime.now().isoformat()
+                    self._event(job, CANCELLED)
+            self._condition.notify_all()
+
+    def _event(self, job: Dict, status: str, **fields) -> None:
+        """Append an event to a job and wake waiters (lock held)."""
+        job["events"].append({"time": datetime.now().isoformat(), "job": job["id"], "status": status, **fields})
+        self._condition.notify_all()
+
+    def _retire(self, job: Dict) -> None:
+        """Forget the oldest finished jobs beyond the history limit (lock held)."""
+        self._finished.append(job["id"])
+        while len(self._finished) > self.history:
+            self.jobs.pop(self._finished.pop(0), None)
+
+    @staticmethod
+    def _snapshot(job: Dict, events: bool = True) -> Dict:
+        """Copy of a job safe to serialize outside the lock."""
+        snapshot = {key: value for key, value in job.items() if key not in ("events", "script_text")}
+        if events:
+            snapshot["events"] = list(job["events"])
+        return snapshot
+
+
+class RenderServer:
+    """
+    Serves render jobs over HTTP on localhost or a Unix socket.
+
+    One orchestrator renders every job, one at a time, so its warm state
+    (tool checks, loaded fonts, narration, demo and probe caches, encoder
+    calibration, the run journal) is reused from job to job. Scenes are
+    still encoded in parallel within a job.
+
+    API (JSON):
+        POST   /jobs              {"script_path": ...} or {"script": text,
+                                  "name": ...}, optional "priority"
+        GET    /jobs              All known jobs
+        GET    /jobs/<id>         One job with its events
+        GET    /jobs/<id>/events  Stream of events (JSON lines) until the job ends
+        DELETE /jobs/<id>         Cancel a queued job
+        GET    /health            Queue counts
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[str] = None,
+        history: int = 100
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            orchestrator: VideoProductionOrchestrator used for every job
+            host: Address to listen on (ignored with socket_path)
+            port: TCP port (0 picks a free one)
+            socket_path: Listen on this Unix socket instead of TCP
+            history: Finished jobs kept for status queries
+        """
+        self.orchestrator = orchestrator
+        self.queue = JobQueue(history)
+        self.inline_dir = Path(orchestrator.video_out_dir) / "server_scripts"
+        self.socket_path = socket_path
+
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.httpd = _UnixHTTPServer(socket_path, _RequestHandler)
+            self.address = socket_path
+        else:
+            self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+            self.address = f"http://{host}:{self.httpd.server_address[1]}"
+        self.httpd.daemon_threads = True
+        self.httpd.render_server = self
+        self._worker = threading.Thread(target=self._work, name="render-worker", daemon=True)
+
+    def serve_forever(self) -> None:
+        """Start the worker and handle requests until shut down or interrupted."""
+        if threading.current_thread() is threading.main_thread():
+            # shutdown() waits for the serving loop, so it cannot run in the handler itself
+            signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=self.shutdown).start())
+
+        self._worker.start()
+        logger.info(f"Render server listening on {self.address}")
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Queued jobs are cancelled; the running one finishes first
+            self.queue.close()
+            self._worker.join()
+            self.httpd.server_close()
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            logger.info("Render server stopped")
+
+    def shutdown(self) -> None:
+        """Stop accepting requests; the running job finishes first (call from another thread)."""
+        self.httpd.shutdown()
+
+    def submit(self, request: Dict) -> Dict:
+        """
+        Queue a job from an API request body.
+
+        Raises:
+            ValueError: If the request is malformed or the script is missing
+        """
+        try:
+            priority = int(request.get("priority", 0))
+        except (TypeError, ValueError):
+            raise ValueError("priority must be an integer")
+        name = request.get("name")
+        if name is not None and not isinstance(name, str):
+            raise ValueError("name must be a string")
+
+        text = None
+        if request.get("script") is not None:
+            text = request["script"]
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError("script must be non-empty text")
+            script_path = self._inline_path(name)
+        elif request.get("script_path"):
+            script_path = Path(str(request["script_path"])).expanduser().absolute()
+            if not script_path.is_file():
+                raise ValueError(f"script not found: {script_path}")
+        else:
+            raise ValueError("either script_path or script is required")
+
+        job = self.queue.submit(str(script_path), priority, name, text)
+        logger.info(f"Queued {job['id']} ({job['name']}, priority {priority})")
+        return job
+
+    def _inline_path(self, name: Optional[str]) -> Path:
+        """
+        File an inline script is rendered from; its stem names the outputs.
+
+        Scripts submitted under the same name reuse one file, so the journal
+        recognises unchanged scenes from earlier submissions. The text is
+        kept with the job and only written when the job starts.
+        """
+        stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", name or "").strip("._")
+        if not stem:
+            stem = "inline_" + datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return self.inline_dir / f"{stem}.md"
+
+    def _write_inline(self, path: str, text: str) -> None:
+        """Write a job's inline script text where the pipeline reads it."""
+        self.inline_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = Path(path).with_suffix(".tmp")
+        temp_path.write_text(text, encoding="utf-8")
+        temp_path.replace(path)
+
+    def _work(self) -> None:
+        """Render queued jobs one at a time until the queue closes."""
+        while True:
+            job = self.queue.next_job()
+            if job is None:
+                return
+            logger.info(f"Starting {job['id']} ({job['name']})")
+            self.orchestrator.stage_listener = lambda stage, state: self.queue.progress(job, stage=stage, stage_state=state)
+            start = time.perf_counter()
+            try:
+                if job["script_text"] is not None:
+                    self._write_inline(job["script_path"], job["script_text"])
+                result = self.orchestrator.render_script(job["script_path"])
+                self.queue.finish(job, result)
+            except Exception as e:
+                logger.error(f"{job['id']} failed: {e}", exc_info=True)
+                self.queue.finish(job, None, str(e))
+            finally:
+                self.orchestrator.stage_listener = None
+            logger.info(f"Finished {job['id']} ({job['status']}) in {time.perf_counter() - start:.1f}s")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix socket (HTTPServer's bind assumes a TCP address)."""
+
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Maps the JSON API onto the render server."""
+
+    server_version = "VideoRenderServer/1.0"
+
+    def do_GET(self) -> None:
+        server = self.server.render_server
+        parts = self._path_parts()
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok", "jobs": server.queue.counts()})
+        elif parts == ["jobs"]:
+            self._send_json(200, {"jobs": server.queue.list()})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = server.queue.get(parts[1])
+            if job is None:
+                self._send_json(404, {"error": f"unknown job {parts[1]}"})
+            else:
+                job["queue_position"] = server.queue.position(parts[1])
+                self._send_json(200, job)
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            self._stream_events(parts[1])
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self._path_parts() != ["jobs"]:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self._send_json(413 if length > 0 else 400, {"error": "missing or oversized request body"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+            job = self.server.render_server.submit(request)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except RuntimeError as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        self._send_json(202, job)
+
+    def do_DELETE(self) -> None:
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != "jobs":
+            self._send_json(404, {"error": "not found"})
+            return
+        job = self.server.render_server.queue.cancel(parts[1])
+        if job is None:
+            self._send_json(404, {"error": f"unknown job {parts[1]}"})
+        elif job["status"] != CANCELLED:
+            self._send_json(409, {"error": f"job is {job['status']}", "job": job})
+        else:
+            self._send_json(200, job)
+
+    def _stream_events(self, job_id: str) -> None:
+        """Send a job's events as JSON lines as they happen, ending with the job."""
+        queue = self.server.render_server.queue
+        if queue.get(job_id) is None:
+            self._send_json(404, {"error": f"unknown job {job_id}"})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        seen = 0
+        try:
+            while True:
+                events, final = queue.wait_events(job_id, seen, timeout=15.0)
+                seen += len(events)
+                for event in events:
+                    self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+                if not events:
+                    # Keep-alive so idle proxies and clients do not time out
+                    self.wfile.write(b"\n")
+                self.wfile.flush()
+                if final:
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _path_parts(self) -> List[str]:
+        """Non-empty path segments of the request (query string dropped)."""
+        return [part for part in self.path.split("?", 1)[0].split("/") if part]
+
+    def _send_json(self, status: int, body: Dict) -> None:
+        """Send a complete JSON response."""
+        data = json.dumps(body, indent=2, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
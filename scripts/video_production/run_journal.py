@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Run Journal Module
+Append-only checkpoint journal that lets an interrupted run resume.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(*parts) -> str:
+    """Short digest identifying the inputs of a unit of work."""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:20]
+
+
+def file_signature(path: Optional[str]) -> Optional[List]:
+    """Size and modification time of a file (None if it does not exist)."""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class RunJournal:
+    """
+    Records each finished scene artifact and script as one journal line.
+
+    Every record is a single `<crc32> <json>` line written with one
+    O_APPEND write and fsync'd before the call returns, so a crash leaves
+    at most one torn line at the end. Replay stops at the first line whose
+    checksum does not match and truncates it away before appending again.
+
+    A fresh run replaces the journal; a resumed run replays it and appends.
+    """
+
+    def __init__(self, path: str, resume: bool = False, settings: Optional[Dict] = None):
+        """
+        Open the journal.
+
+        Args:
+            path: Journal file (JSON lines)
+            resume: Replay an existing journal instead of starting a new one
+            settings: Run settings stored in the header for reference
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.scenes: Dict[tuple, Dict] = {}
+        self.scripts: Dict[str, Dict] = {}
+        self.restored_scenes = 0
+        self.skipped_scripts = 0
+        self._lock = threading.Lock()
+
+        if resume and self.path.exists():
+            count = self._replay()
+            logger.info(
+                f"Resuming from {self.path.name}: {len(self.scripts)} finished script(s), "
+                f"{len(self.scenes)} scene artifact(s) in {count} record(s)"
+            )
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+            self._append({"type": "resume"})
+        else:
+            if resume:
+                logger.info(f"No journal at {self.path}, starting a new run")
+            self._create({"type": "run", "settings": settings or {}})
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+
+    def finished_script(self, script_name: str, key: str) -> Optional[Dict]:
+        """
+        Result of a script that already succeeded with the same inputs.
+
+        Returns:
+            The recorded result if its video still exists unchanged, else None
+        """
+        record = self.scripts.get(script_name)
+        if not record or record["key"] != key or not record["result"].get("success"):
+            return None
+        if not self._artifacts_intact(record["artifacts"]):
+            logger.info(f"  Recorded output of {script_name} is gone, rendering again")
+            return None
+        with self._lock:
+            self.skipped_scripts += 1
+        return record["result"]
+
+    def record_script(self, script_name: str, key: str, result: Dict) -> None:
+        """Record a finished script (successful or not) with its outputs."""
+        paths = [result.get("video_path")] + [r.get("path") for r in result.get("renditions", [])]
+        record = {
+            "type": "script",
+            "script": script_name,
+            "key": key,
+            "result": result,
+            "artifacts": {p: file_signature(p) for p in paths if p},
+        }
+        self.scripts[script_name] = record
+        self._append(record)
+
+    def scene_artifact(self, script_name: str, stage: str, scene_num: int, key: str):
+        """
+        Entry of a scene artifact produced earlier from the same inputs.
+
+        Returns:
+            The recorded entry if its files still exist unchanged, else None
+        """
+        record = self.scenes.get((script_name, stage, scene_num))
+        if not record or record["key"] != key or not self._artifacts_intact(record["artifacts"]):
+            return None
+        with self._lock:
+            self.restored_scenes += 1
+        return record["entry"]
+
+    def record_scene(self, script_name: str, stage: str, scene_num: int, key: str, entry) -> None:
+        """Record a completed scene artifact (an entry dict or a file path)."""
+        paths = [entry] if isinstance(entry, str) else [entry.get("path")]
+        record = {
+            "type": "scene",
+            "script": script_name,
+            "stage": stage,
+            "scene_num": scene_num,
+            "key": key,
+            "entry": entry,
+            "artifacts": {p: file_signature(p) for p in paths if p},
+        }
+        with self._lock:
+            self.scenes[(script_name, stage, scene_num)] = record
+        self._append(record)
+
+    def checkpoint(self, script_name: str) -> "SceneCheckpoint":
+        """Per-script view handed to the pipeline stages."""
+        return SceneCheckpoint(self, script_name)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _artifacts_intact(self, artifacts: Dict[str, Optional[List]]) -> bool:
+        """Check that recorded files exist with their recorded size and mtime."""
+        return bool(artifacts) and all(
+            signature is not None and file_signature(path) == signature
+            for path, signature in artifacts.items()
+        )
+
+    def _append(self, record: Dict) -> None:
+        """Durably append one record."""
+        line = self._encode({**record, "time": datetime.now().isoformat()})
+        with self._lock:
+            view = memoryview(line)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            os.fsync(self._fd)
+
+    def _create(self, header: Dict) -> None:
+        """Atomically replace the journal with one holding only the header."""
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(self._encode({**header, "time": datetime.now().isoformat()}))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(self.path)
+        self._fsync_dir()
+
+    def _replay(self) -> int:
+        """Load every intact record and cut off a torn tail."""
+        count, valid_bytes = 0, 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                record = self._decode(line)
+                if record is None:
+                    logger.warning(f"Journal {self.path.name} ends in a torn record, discarding it")
+                    break
+                valid_bytes += len(line)
+                count += 1
+                if record["type"] == "scene":
+                    self.scenes[(record["script"], record["stage"], record["scene_num"])] = record
+                elif record["type"] == "script":
+                    self.scripts[record["script"]] = record
+
+        if valid_bytes < self.path.stat().st_size:
+            os.truncate(self.path, valid_bytes)
+        return count
+
+    @staticmethod
+    def _encode(record: Dict) -> bytes:
+        """Serialize a record as a checksummed line."""
+        payload = json.dumps(record, sort_keys=True, default=str)
+        return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n".encode('utf-8')
+
+    @staticmethod
+    def _decode(line: bytes) -> Optional[Dict]:
+        """Parse a checksummed line (None if torn or corrupt)."""
+        if not line.endswith(b"\n"):
+            return None
+        checksum, _, payload = line.rstrip(b"\n").partition(b" ")
+        try:
+            if int(checksum, 16) != zlib.crc32(payload):
+                return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    def _fsync_dir(self) -> None:
+        """Persist the rename of the journal file."""
+        try:
+            fd = os.open(self.path.parent, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class SceneCheckpoint:
+    """
+    A script's scene-level view of the run journal.
+
+    Without a journal every unit simply runs, so stages can always go
+    through a checkpoint.
+    """
+
+    def __init__(self, journal: Optional[RunJournal] = None, script_name: str = ""):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            journal: Run journal to restore from and record to
+            script_name: Script whose scenes this checkpoint covers
+        """
+        self.journal = journal
+        self.script_name = script_name
+        # Files of every artifact handed out, for the artifact store
+        self.paths: List[str] = []
+
+    def unit(self, stage: str, scene_num: int, key: str, produce: Callable[[], Optional[object]]):
+        """
+        Restore a scene artifact from the journal or produce and record it.
+
+        Args:
+            stage: Stage producing the artifact ("audio", "visual", "clip")
+            scene_num: Scene number
+            key: Fingerprint of the inputs the artifact depends on
+            produce: Creates the artifact; returns its entry (dict with
+                "path", or a path string) or None on failure
+
+        Returns:
+            The artifact entry, or None if it could not be produced
+        """
+        if self.journal is None:
+            return self._used(produce())
+
+        entry = self.journal.scene_artifact(self.script_name, stage, scene_num, key)
+        if entry is not None:
+            logger.info(f"  ✓ Restored {stage} for scene {scene_num} from the run journal")
+            return self._used(entry)
+
+        entry = produce()
+        if entry is not None:
+            self.journal.record_scene(self.script_name, stage, scene_num, key, entry)
+        return self._used(entry)
+
+    def _used(self, entry):
+        """Note the file of an artifact entry (a dict with "path" or a path) and return the entry."""
+        path = entry if isinstance(entry, str) else (entry or {}).get("path")
+        if path:
+            self.paths.append(path)
+        return entry
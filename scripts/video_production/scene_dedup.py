@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Scene Dedup Module
+Finds scenes shared between scripts and encodes each unique scene clip once.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+from run_journal import fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def scene_fingerprint(scene: Dict) -> str:
+    """Identity of what a scene renders: its heading, narration and visual cues."""
+    return fingerprint(scene.get('heading'), scene.get('content', '').strip(), scene.get('visuals') or [])
+
+
+def plan_dedup(script_scenes: Dict[str, List[Dict]]) -> Dict:
+    """
+    Count the distinct scenes in a batch.
+
+    Only narrated scenes count; scenes without narration are never rendered.
+
+    Args:
+        script_scenes: Parsed scenes by script name
+
+    Returns:
+        {"scenes", "unique_scenes", "dedup_ratio" (scenes per unique scene),
+        "shared": scenes that occur in more than one script}
+    """
+    occurrences: Dict[str, List[str]] = defaultdict(list)
+    headings: Dict[str, str] = {}
+    for script_name, scenes in script_scenes.items():
+        for scene in scenes:
+            if not scene.get('content', '').strip():
+                continue
+            key = scene_fingerprint(scene)
+            occurrences[key].append(script_name)
+            headings.setdefault(key, scene.get('heading') or f"Scene {scene['scene_num']}")
+
+    total = sum(len(scripts) for scripts in occurrences.values())
+    shared = [
+        {"heading": headings[key], "scripts": sorted(set(scripts)), "occurrences": len(scripts)}
+        for key, scripts in occurrences.items() if len(set(scripts)) > 1
+    ]
+    return {
+        "scenes": total,
+        "unique_scenes": len(occurrences),
+        "dedup_ratio": round(total / len(occurrences), 2) if occurrences else 1.0,
+        "shared": sorted(shared, key=lambda s: -s["occurrences"]),
+    }
+
+
+class SceneClipCache:
+    """
+    Encoded scene clips shared by every script rendered with the same settings.
+
+    A clip is stored under a key covering the scene fingerprint and
+    everything its encode reads (narration and visual contents, encoder
+    settings), next to a small record of how long the encode took. A
+    later scene with the same key gets the clip hard-linked (or copied)
+    into place instead of being encoded again, and the recorded encode
+    time counts as saved. Concurrent requests for one key wait for a
+    single encode.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the shared clips
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self._lock = threading.Lock()
+        # Per-key lock and the number of callers holding or waiting on it;
+        # dropped once the last one is done so the table stays small
+        self._key_locks: Dict[str, List] = {}
+
+    def clip(self, key: str, target: Path, encode: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Put the clip for a key at target, encoding it only if it is not cached.
+
+        Args:
+            key: Fingerprint of the scene and its encode inputs
+            target: Where the script expects its scene clip
+            encode: Encodes the clip to target; returns its path or None
+
+        Returns:
+            Path to the clip at target, or None if the encode failed
+        """
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                return self._clip_locked(key, target, encode)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def summary(self) -> Dict:
+        """Reuse counts and the encode time they saved."""
+        return {
+            "clips_reused": self.hits,
+            "clips_encoded": self.misses,
+            "encode_seconds_saved": round(self.seconds_saved, 3),
+        }
+
+    def _clip_locked(self, key: str, target: Path, encode: Callable[[], Optional[str]]) -> Optional[str]:
+        """Reuse or encode the clip for a key; the caller holds the key's lock."""
+        cached = self.cache_dir / f"{key}.mp4"
+        if cached.exists() and self._link_or_copy(cached, Path(target)):
+            seconds = self._recorded_seconds(key)
+            with self._lock:
+                self.hits += 1
+                self.seconds_saved += seconds
+            logger.info(f"    ✓ Reused shared scene clip for {Path(target).name} (saved {seconds:.1f}s)")
+            return str(target)
+
+        start = time.perf_counter()
+        path = encode()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.misses += 1
+        if path:
+            self._store(key, Path(path), elapsed)
+        return path
+
+    def _store(self, key: str, clip: Path, seconds: float) -> None:
+        """Add a freshly encoded clip to the cache."""
+        cached = self.cache_dir / f"{key}.mp4"
+        temp_path = self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.mp4"
+        try:
+            if not self._link_or_copy(clip, temp_path):
+                return
+            temp_path.replace(cached)
+            with open(self.cache_dir / f"{key}.json", 'w') as f:
+                json.dump({"encode_seconds": round(seconds, 3), "source": clip.name}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache scene clip {clip.name}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+    def _recorded_seconds(self, key: str) -> float:
+        """How long the cached clip took to encode (0 if unknown)."""
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r') as f:
+                return float(json.load(f).get("encode_seconds", 0.0))
+        except (OSError, ValueError, TypeError):
+            return 0.0
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> bool:
+        """Hard-link source to target, copying if linking is not possible."""
+        try:
+            if target.exists():
+                target.unlink()
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not link scene clip {source.name}: {e}")
+            return False
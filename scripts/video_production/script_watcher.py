@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Script Watcher Module
+Watch mode: re-renders scripts in a long-running process as they change.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import signal
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+import logging
+
+from script_scanner import ScriptScanner
+
+logger = logging.getLogger(__name__)
+
+
+class InotifyWatcher:
+    """Reports changed files under a directory tree using Linux inotify."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: Path):
+        """
+        Start watching a directory and its subdirectories.
+
+        Raises:
+            OSError: If inotify is unavailable (non-Linux, or out of watches)
+        """
+        self.directory = Path(directory)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        try:
+            self._watch_tree(self.directory)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def read(self, timeout: float) -> Set[str]:
+        """
+        Wait up to timeout seconds and return the paths that changed.
+
+        After a queue overflow every file in the tree is reported.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                offset += self.EVENT.size
+                name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    logger.warning("inotify queue overflowed, rescanning scripts")
+                    changed |= _all_files(self.directory)
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None or not name:
+                    continue
+                path = parent / name
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                        self._watch_tree(path)
+                        changed |= _all_files(path)
+                elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_MOVED_FROM | self.IN_DELETE):
+                    changed.add(str(path))
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _watch_tree(self, root: Path) -> None:
+        """Add a watch for root and every directory below it."""
+        for directory, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self._dirs[wd] = Path(directory)
+
+
+class PollingWatcher:
+    """Reports changed files by comparing size and mtime at an interval."""
+
+    def __init__(self, directory: Path, interval: float = 1.0):
+        """
+        Start watching a directory tree.
+
+        Args:
+            directory: Root directory
+            interval: Seconds between scans
+        """
+        self.directory = Path(directory)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def read(self, timeout: float) -> Set[str]:
+        """Wait up to timeout seconds (one scan interval at most) and return changed paths."""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = {
+            path for path in set(snapshot) | set(self._snapshot)
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def _scan(self) -> Dict[str, tuple]:
+        """Size and mtime of every file in the tree."""
+        snapshot = {}
+        for path in _all_files(self.directory):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+
+def _all_files(root: Path) -> Set[str]:
+    """Every file below root."""
+    return {
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(root)
+        for name in names
+    }
+
+
+class ScriptWatcher:
+    """
+    Keeps one orchestrator alive and re-renders scripts when they change.
+
+    The orchestrator's warm state (narration and demo caches, loaded fonts,
+    tool probes, encoder calibration, throughput history) survives between
+    renders. Bursts of editor writes are debounced into one render, only the
+    changed script is parsed again, and the run journal restores every scene
+    whose narration, visual and clip inputs are unchanged.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        debounce: float = 1.0,
+        poll_interval: float = 1.0,
+        polling: bool = False
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            orchestrator: VideoProductionOrchestrator used for every render
+            debounce: Seconds without further changes before rendering
+            poll_interval: Scan interval of the polling fallback
+            polling: Poll even where inotify is available (e.g. network mounts)
+        """
+        self.orchestrator = orchestrator
+        self.script_dir = Path(orchestrator.script_dir)
+        self.script_pattern = orchestrator.script_pattern
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.polling = polling
+        self.renders = 0
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        """Render every script once, then watch until stopped or interrupted."""
+        if not self.script_dir.exists():
+            logger.error(f"Script directory does not exist: {self.script_dir}")
+            return
+
+        if threading.current_thread() is threading.main_thread():
+            # Service managers stop daemons with SIGTERM
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+
+        watcher = self._create_watcher()
+        try:
+            for script in ScriptScanner(self.script_dir, self.script_pattern).scan():
+                self._render(script['path'])
+            logger.info(f"Watching {self.script_dir} for changes to {self.script_pattern} (Ctrl+C to stop)")
+
+            while not self._stop.is_set():
+                for path in sorted(self._collect(watcher)):
+                    self._render(path)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+        logger.info(f"Watch mode stopped after {self.renders} render(s)")
+
+    def stop(self) -> None:
+        """Ask the watch loop to exit after the current wait."""
+        self._stop.set()
+
+    def _create_watcher(self):
+        """Use inotify where possible, otherwise poll."""
+        if not self.polling:
+            try:
+                watcher = InotifyWatcher(self.script_dir)
+                logger.info("Watch mode using inotify")
+                return watcher
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotify unavailable ({e}), polling every {self.poll_interval}s")
+        return PollingWatcher(self.script_dir, self.poll_interval)
+
+    def _collect(self, watcher) -> Set[str]:
+        """Wait for script changes and return them once writes have settled."""
+        changed = {p for p in watcher.read(timeout=1.0) if self._is_script(p)}
+        if not changed:
+            return set()
+        while not self._stop.is_set():
+            more = {p for p in watcher.read(timeout=self.debounce) if self._is_script(p)}
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def _is_script(self, path: str) -> bool:
+        """Whether a path is a script the scanner would pick up."""
+        name = os.path.basename(path)
+        if name.startswith(('.', '#')) or name.endswith('~'):
+            # Editor swap, lock and backup files
+            return False
+        try:
+            relative = os.path.relpath(path, self.script_dir)
+        except ValueError:
+            return False
+        return fnmatch.fnmatch(name, self.script_pattern) or fnmatch.fnmatch(relative, self.script_pattern)
+
+    def _render(self, path: str) -> Optional[dict]:
+        """Render one script and log what was reused."""
+        name = Path(path).stem
+        if not Path(path).exists():
+            logger.info(f"Script removed: {name}")
+            return None
+
+        journal = self.orchestrator.journal
+        restored_before = journal.restored_scenes if journal else 0
+        start = time.perf_counter()
+        try:
+            result = self.orchestrator.render_script(path)
+        except Exception as e:
+            logger.error(f"Render of {name} failed: {e}", exc_info=True)
+            return None
+        elapsed = time.perf_counter() - start
+        self.renders += 1
+
+        restored = self.orchestrator.journal.restored_scenes - restored_before
+        if result.get("resumed"):
+            logger.info(f"= {name} unchanged ({result['video_path']})")
+        elif result["success"]:
+            logger.info(f"✓ {name} rendered in {elapsed:.1f}s, {restored} scene artifact(s) reused: {result['video_path']}")
+        else:
+            logger.error(f"✗ {name} failed after {elapsed:.1f}s: {'; '.join(result['errors'])}")
+        return result
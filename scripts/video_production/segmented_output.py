@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Segmented Output Module
+Publishes scene clips as HLS segments while the rest of the video renders.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+from ffmpeg_progress import ProgressTracker
+
+logger = logging.getLogger(__name__)
+
+
+class HLSPublisher:
+    """
+    Maintains an HLS playlist that grows as scene clips finish encoding.
+
+    Each scene is segmented with stream copy into its own MPEG-TS segments
+    and media playlist. The combined playlist lists the scenes finished so
+    far in order (stopping at the first scene still rendering), so a player
+    can start on early scenes while later ones encode.
+
+    Segment names carry a hash of the scene clip, so they survive across
+    runs: a scene whose clip did not change keeps the segments already on
+    disk, and a changed scene gets new segments before its old ones are
+    removed. Segments of scenes the video no longer has are removed once
+    the playlist is finalized.
+    """
+
+    PLAYLIST_NAME = "index.m3u8"
+
+    def __init__(
+        self,
+        output_dir: str,
+        scene_count: int,
+        segment_seconds: float = 6.0,
+        progress: Optional[ProgressTracker] = None
+    ):
+        """
+        Initialize the publisher.
+
+        Args:
+            output_dir: Directory for the playlist and segments
+            scene_count: Number of scenes the finished video has
+            segment_seconds: Target segment length in seconds
+            progress: Tracker that runs the segmenting jobs
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.scene_count = scene_count
+        self.segment_seconds = segment_seconds
+        self.progress = progress or ProgressTracker()
+        self.playlist_path = self.output_dir / self.PLAYLIST_NAME
+        self._scenes: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._finished = False
+
+    def publish_scene(self, index: int, scene_num: int, clip_path: str) -> bool:
+        """
+        Segment a finished scene clip and update the playlist.
+
+        Args:
+            index: Position of the scene in the video (0-based)
+            scene_num: Scene number used in segment names
+            clip_path: Encoded scene clip
+
+        Returns:
+            True if the scene was published
+        """
+        try:
+            prefix = f"scene{scene_num:02d}_{self._clip_digest(clip_path)}"
+            scene_playlist = self.output_dir / f"{prefix}.m3u8"
+            entries = self._existing_entries(scene_playlist)
+            if entries:
+                logger.info(f"    ✓ Scene {scene_num} unchanged, keeping its {len(entries)} HLS segment(s)")
+            else:
+                entries = self._segment(clip_path, prefix, scene_playlist)
+                if not entries:
+                    return False
+                logger.info(f"    ✓ Published scene {scene_num} ({len(entries)} HLS segment(s))")
+
+            with self._lock:
+                self._scenes[index] = {"prefix": prefix, "entries": entries}
+                self._write_playlist()
+
+            self._remove_stale(f"scene{scene_num:02d}_", {prefix})
+            return True
+
+        except Exception as e:
+            logger.error(f"Error publishing scene {scene_num}: {e}")
+            return False
+
+    def _segment(self, clip_path: str, prefix: str, scene_playlist: Path) -> List[Dict]:
+        """Cut a clip into segments with stream copy; returns its playlist entries."""
+        cmd = [
+            "ffmpeg", "-y",
+            "-i", clip_path,
+            "-c", "copy",
+            "-f", "hls",
+            "-hls_time", str(self.segment_seconds),
+            "-hls_playlist_type", "vod",
+            "-hls_segment_type", "mpegts",
+            "-hls_segment_filename", str(self.output_dir / f"{prefix}_%03d.ts"),
+            str(scene_playlist)
+        ]
+
+        result = self.progress.run(cmd, label=f"hls {prefix}", kind="remux")
+        if result.returncode != 0:
+            logger.error(f"FFmpeg HLS error: {result.stderr}")
+            return []
+        return self._read_scene_playlist(scene_playlist)
+
+    def finalize(self) -> Optional[str]:
+        """
+        Close the playlist once every scene is published.
+
+        Returns:
+            Path to the playlist, or None if scenes are missing
+        """
+        with self._lock:
+            if len(self._scenes) < self.scene_count:
+                logger.warning("HLS playlist left open: not every scene was published")
+                return None
+            self._finished = True
+            self._write_playlist()
+            current = {scene["prefix"] for scene in self._scenes.values()}
+        self._remove_stale("scene", current)
+        return str(self.playlist_path)
+
+    def _existing_entries(self, playlist: Path) -> List[Dict]:
+        """Entries of a scene version already on disk (empty unless complete)."""
+        if not playlist.exists():
+            return []
+        entries = self._read_scene_playlist(playlist)
+        if not all((self.output_dir / entry["uri"]).exists() for entry in entries):
+            return []
+        return entries
+
+    def _read_scene_playlist(self, playlist: Path) -> List[Dict]:
+        """Extract segment durations and names from a scene playlist."""
+        entries = []
+        duration = None
+        with open(playlist, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("#EXTINF:"):
+                    duration = float(line[len("#EXTINF:"):].split(',')[0])
+                elif line and not line.startswith("#") and duration is not None:
+                    entries.append({"duration": duration, "uri": line})
+                    duration = None
+        return entries
+
+    def _write_playlist(self) -> None:
+        """Write the combined playlist atomically (caller holds the lock)."""
+        published = []
+        for index in range(self.scene_count):
+            if index not in self._scenes:
+                break
+            published.append(self._scenes[index])
+
+        all_entries = [entry for scene in published for entry in scene["entries"]]
+        target = max([self.segment_seconds] + [entry["duration"] for entry in all_entries])
+
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{int(target + 0.999)}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:EVENT",
+        ]
+        for i, scene in enumerate(published):
+            if i > 0:
+                lines.append("#EXT-X-DISCONTINUITY")
+            for entry in scene["entries"]:
+                lines.append(f"#EXTINF:{entry['duration']:.6f},")
+                lines.append(entry["uri"])
+        if self._finished:
+            lines.append("#EXT-X-ENDLIST")
+
+        temp_path = self.playlist_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        temp_path.replace(self.playlist_path)
+
+    def _remove_stale(self, pattern: str, keep: set) -> None:
+        """Delete segments and scene playlists matching pattern that no kept version owns."""
+        for path in [*self.output_dir.glob(f"{pattern}*.m3u8"), *self.output_dir.glob(f"{pattern}*.ts")]:
+            # "sceneNN_<hash>.m3u8" and "sceneNN_<hash>_NNN.ts" belong to "sceneNN_<hash>"
+            if "_".join(path.stem.split("_")[:2]) in keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _clip_digest(clip_path: str) -> str:
+        """Short content hash of a scene clip."""
+        digest = hashlib.sha256()
+        with open(clip_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()[:12]
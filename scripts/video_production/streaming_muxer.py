@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Streaming Muxer Module
+Writes the final video progressively while later scenes are still encoding.
+"""
+
+import subprocess
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+from ffmpeg_progress import ProgressTracker
+from process_runner import TrackedProcess
+from tracing import in_current_context
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingMuxer:
+    """
+    Feeds finished scene clips, in order, into one long-running muxer.
+
+    The muxer reads MPEG-TS from a pipe and stream-copies it into the final
+    MP4. Each scene clip is remuxed to MPEG-TS straight into that pipe with
+    its timestamps offset to the scene's position, then deleted (unless
+    clips are kept for reuse), so only clips that are encoded but not yet
+    fed occupy temp disk.
+
+    Clips are fed by a feeder thread, so encode workers handing over a
+    clip never wait for a remux.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        scene_count: int,
+        progress: Optional[ProgressTracker] = None,
+        keep_clips: bool = False
+    ):
+        """
+        Initialize the muxer.
+
+        Args:
+            output_path: Final MP4 path
+            scene_count: Number of scenes expected
+            progress: Tracker that runs the per-clip remux jobs
+            keep_clips: Leave scene clips on disk once fed
+        """
+        self.output_path = output_path
+        self.scene_count = scene_count
+        self.progress = progress or ProgressTracker()
+        self.keep_clips = keep_clips
+        self.position = 0.0
+        self.fed = 0
+        self._next_index = 0
+        self._pending: Dict[int, Optional[Dict]] = {}
+        self._ready = threading.Condition()
+        self._closing = False
+        self._feeder: Optional[threading.Thread] = None
+        self._process: Optional[TrackedProcess] = None
+        self._stderr = deque(maxlen=200)
+        self._stderr_thread: Optional[threading.Thread] = None
+        self.failed = False
+
+    def start(self) -> bool:
+        """Start the muxer process."""
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "mpegts",
+            "-i", "pipe:0",
+            "-c", "copy",
+            "-bsf:a", "aac_adtstoasc",
+            "-movflags", "+faststart",
+            self.output_path
+        ]
+        try:
+            self._process = TrackedProcess(
+                cmd,
+                "stream muxer",
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            logger.error(f"Could not start streaming muxer: {e}")
+            return False
+
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self._feeder = threading.Thread(target=in_current_context(self._feed_in_order), daemon=True)
+        self._feeder.start()
+        return True
+
+    def add(self, index: int, clip_path: Optional[str], duration: Optional[float]) -> None:
+        """
+        Hand over a finished (or failed) scene clip.
+
+        Clips are fed as soon as every earlier scene has been handed over;
+        this only queues the clip for the feeder thread.
+
+        Args:
+            index: Position of the scene (0-based)
+            clip_path: Encoded clip, or None if the scene failed
+            duration: Duration of the encoded clip in seconds; the next clip
+                starts where this one ends (None if it could not be probed)
+        """
+        with self._ready:
+            self._pending[index] = {"path": clip_path, "duration": duration} if clip_path else None
+            self._ready.notify()
+
+    def finish(self, timeout: float = 600) -> bool:
+        """
+        Close the pipe and wait for the muxer to write the file.
+
+        Returns:
+            True if the final video was written
+        """
+        if not self._process:
+            return False
+
+        with self._ready:
+            self._closing = True
+            self._ready.notify()
+        if self._feeder:
+            self._feeder.join()
+
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+
+        try:
+            returncode = self._process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            logger.error("Streaming muxer timed out")
+            return False
+
+        if self._stderr_thread:
+            self._stderr_thread.join(timeout=5)
+
+        if returncode != 0 or self.failed:
+            logger.error(f"FFmpeg muxer error: {''.join(self._stderr)}")
+            return False
+
+        return self.fed > 0 and Path(self.output_path).exists()
+
+    def _feed_in_order(self) -> None:
+        """Feeder thread: feed clips in scene order until finish() is called."""
+        while True:
+            with self._ready:
+                while self._next_index not in self._pending and not self._closing:
+                    self._ready.wait()
+                if self._next_index not in self._pending:
+                    # Closing with no further clip ready; a missing scene
+                    # leaves the clips after it unfed
+                    leftovers = [clip for clip in self._pending.values() if clip]
+                    self._pending.clear()
+                    break
+                clip = self._pending.pop(self._next_index)
+                self._next_index += 1
+            if clip and not self.failed:
+                self._feed(clip["path"], clip["duration"])
+            if clip:
+                self._remove(clip["path"])
+        for clip in leftovers:
+            self._remove(clip["path"])
+
+    def _feed(self, clip_path: str, duration: Optional[float]) -> None:
+        """Remux one clip to MPEG-TS directly into the muxer's stdin."""
+        if not duration:
+            # Without the clip's length the next clip cannot be placed after it
+            logger.error(f"Unknown duration of {Path(clip_path).name}, cannot stream it")
+            self.failed = True
+            return
+        cmd = [
+            "ffmpeg", "-v", "error",
+            "-i", clip_path,
+            "-c", "copy",
+            "-output_ts_offset", f"{self.position:.6f}",
+            "-f", "mpegts",
+            "pipe:1"
+        ]
+        try:
+            result = self.progress.run(
+                cmd,
+                label=f"stream {Path(clip_path).stem}",
+                media_seconds=duration,
+                stdout=self._process.stdin,
+                kind="remux"
+            )
+            if result.returncode != 0:
+                logger.error(f"FFmpeg remux error: {result.stderr}")
+                self.failed = True
+                return
+            self._process.stdin.flush()
+            self.position += duration
+            self.fed += 1
+            logger.info(f"    ✓ Streamed scene {self.fed}/{self.scene_count} into {Path(self.output_path).name}")
+        except Exception as e:
+            logger.error(f"Error streaming scene clip: {e}")
+            self.failed = True
+
+    def _remove(self, clip_path: str) -> None:
+        """Delete a clip once it has been consumed (unless clips are kept)."""
+        if self.keep_clips:
+            return
+        try:
+            Path(clip_path).unlink()
+        except OSError:
+            pass
+
+    def _drain_stderr(self) -> None:
+        """Keep the tail of the muxer's stderr without blocking it."""
+        for line in iter(self._process.stderr.readline, b''):
+            self._stderr.append(line.decode('utf-8', errors='replace'))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Timeout Policy Module
+Derives subprocess deadlines from input size and measured throughput.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TimeoutPolicy:
+    """
+    Sizes each job's timeout from its input and recent throughput.
+
+    Jobs are grouped by kind: "tts" (units are narration characters),
+    "encode" (seconds of media, scaled by output pixels relative to 1080p)
+    and "remux" (seconds of media, stream copy or audio-only work). The
+    wall time per unit of recent runs is kept per kind; a job's deadline is
+    a fixed startup allowance plus its units at the slow end of that history
+    (or a conservative default), times a safety factor. Jobs with unknown
+    size get the kind's fallback timeout.
+    """
+
+    # Wall seconds per unit assumed before any history exists
+    DEFAULT_RATES = {"tts": 0.05, "encode": 1.5, "remux": 0.1}
+    # Startup allowance and lower bound of every deadline
+    MIN_TIMEOUTS = {"tts": 10.0, "encode": 20.0, "remux": 10.0}
+    # Used when a job's size is unknown
+    FALLBACK_TIMEOUTS = {"tts": 60.0, "encode": 300.0, "remux": 300.0}
+    SAFETY_FACTOR = 4.0
+    HISTORY_SIZE = 50
+    MIN_SAMPLES = 3
+
+    def __init__(self, history_file: Optional[str] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            history_file: JSON file keeping throughput across runs (in-memory
+                history only if omitted)
+        """
+        self.history_file = Path(history_file) if history_file else None
+        self.history: Dict[str, List[float]] = {}
+        self.kills: List[Dict] = []
+        self._lock = threading.Lock()
+
+        if self.history_file and self.history_file.exists():
+            try:
+                with open(self.history_file, 'r') as f:
+                    self.history = {k: list(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read throughput history: {e}")
+
+    def deadline(
+        self,
+        kind: str,
+        units: Optional[float] = None,
+        resolution: Optional[str] = None
+    ) -> float:
+        """
+        Timeout in seconds for one job.
+
+        Args:
+            kind: "tts", "encode" or "remux"
+            units: Characters of narration or seconds of media
+            resolution: Output resolution of an encode (e.g. "1280x720")
+
+        Returns:
+            Timeout in seconds
+        """
+        if not units:
+            return self.FALLBACK_TIMEOUTS.get(kind, 300.0)
+        minimum = self.MIN_TIMEOUTS.get(kind, 10.0)
+        work = units * self._scale(kind, resolution)
+        return round(minimum + work * self._rate(kind) * self.SAFETY_FACTOR, 1)
+
+    def observe(
+        self,
+        kind: str,
+        units: Optional[float],
+        wall_seconds: float,
+        resolution: Optional[str] = None
+    ) -> None:
+        """Record the throughput of a successful job."""
+        if not units or units <= 0:
+            return
+        rate = wall_seconds / (units * self._scale(kind, resolution))
+        with self._lock:
+            samples = self.history.setdefault(kind, [])
+            samples.append(round(rate, 6))
+            del samples[:-self.HISTORY_SIZE]
+
+    def record_kill(self, kind: str, label: str, timeout: float, units: Optional[float] = None) -> Dict:
+        """
+        Record a job killed for exceeding its deadline.
+
+        Returns:
+            The recorded entry
+        """
+        entry = {"kind": kind, "label": label, "timeout_seconds": timeout, "units": units}
+        with self._lock:
+            self.kills.append(entry)
+        logger.error(f"  Timed out after {timeout:.0f}s: {label}")
+        return entry
+
+    def save(self) -> None:
+        """Write the throughput history for the next run."""
+        if not self.history_file:
+            return
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.history_file.with_suffix('.tmp')
+            with self._lock:
+                with open(temp_path, 'w') as f:
+                    json.dump(self.history, f, indent=2)
+            temp_path.replace(self.history_file)
+        except OSError as e:
+            logger.warning(f"Could not save throughput history: {e}")
+
+    def _rate(self, kind: str) -> float:
+        """Slow end (90th percentile) of recent wall seconds per unit."""
+        with self._lock:
+            samples = sorted(self.history.get(kind, []))
+        if len(samples) < self.MIN_SAMPLES:
+            return self.DEFAULT_RATES.get(kind, 1.0)
+        return samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+
+    @staticmethod
+    def _scale(kind: str, resolution: Optional[str]) -> float:
+        """Work multiplier of an encode relative to 1080p."""
+        if kind != "encode" or not resolution:
+            return 1.0
+        try:
+            width, height = map(int, resolution.split('x'))
+        except ValueError:
+            return 1.0
+        return max(0.1, width * height / (1920 * 1080))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tracing Module
+Hierarchical timing spans exported as Chrome trace events.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Records nested spans (run → script → stage → scene → subprocess).
+
+    Each finished span becomes a Chrome trace "complete" event on the lane
+    of the thread that ran it, so the file loads in Perfetto or
+    chrome://tracing. Span and parent ids are kept in the event args, which
+    preserves the hierarchy across worker threads.
+    """
+
+    def __init__(self):
+        """Initialize an empty trace starting now."""
+        self._origin = time.perf_counter_ns()
+        self._events: List[Dict] = []
+        self._thread_names: Dict[int, str] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[Dict]:
+        """
+        Time a block as a child of the current span.
+
+        Args:
+            name: Span name (e.g. "audio", "scene 3", "ffmpeg")
+            category: Level in the hierarchy: "run", "script", "stage",
+                "scene" or "subprocess"
+            **args: Extra attributes stored with the span
+
+        Yields:
+            The span's attribute dict, which the block may add to
+        """
+        parent = _current_span.get()
+        span_id = next(self._ids)
+        attributes = dict(args)
+        token = _current_span.set(span_id)
+        start = time.perf_counter_ns()
+        try:
+            yield attributes
+        finally:
+            end = time.perf_counter_ns()
+            _current_span.reset(token)
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": {"span_id": span_id, "parent_id": parent, **attributes},
+            }
+            with self._lock:
+                self._events.append(event)
+                self._thread_names.setdefault(thread.ident, thread.name)
+
+    def export(self, path: str) -> Optional[str]:
+        """
+        Write the trace as Chrome trace-event JSON.
+
+        Returns:
+            Path written, or None if writing failed
+        """
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        pid = os.getpid()
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "video-production"}}]
+        metadata += [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in thread_names.items()
+        ]
+
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            temp_path = Path(path).with_suffix('.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+            temp_path.replace(path)
+            return str(path)
+        except OSError as e:
+            logger.warning(f"Could not write trace: {e}")
+            return None
+
+    def rollup(self, categories: tuple = ("stage", "scene", "subprocess")) -> Dict:
+        """
+        Summarize span durations by category and name.
+
+        Returns:
+            {category: {name: {"count", "total_seconds", "p50_seconds", "p95_seconds"}}}
+        """
+        with self._lock:
+            events = list(self._events)
+
+        grouped: Dict[str, Dict[str, List[float]]] = {}
+        for event in events:
+            if event["cat"] in categories:
+                grouped.setdefault(event["cat"], {}).setdefault(event["name"], []).append(event["dur"] / 1e6)
+
+        return {
+            category: {
+                name: {
+                    "count": len(durations),
+                    "total_seconds": round(sum(durations), 3),
+                    "p50_seconds": round(_percentile(durations, 50), 3),
+                    "p95_seconds": round(_percentile(durations, 95), 3),
+                }
+                for name, durations in sorted(names.items())
+            }
+            for category, names in grouped.items()
+        }
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def in_current_context(fn: Callable) -> Callable:
+    """
+    Bind a callable to the caller's context for use in worker threads.
+
+    Each call runs in a fresh copy of the context captured here, so spans
+    opened in pool threads nest under the span that submitted them.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _tracer
+
+
+def reset_tracer() -> Tracer:
+    """Start a new trace (e.g. at the beginning of a run)."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Transitions Module
+Smart-rendered scene transitions: only the frames around each cut are re-encoded.
+"""
+
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+from encoding_profiles import EncodingProfile, get_profile
+from ffmpeg_progress import ProgressTracker
+from process_runner import run_process
+
+logger = logging.getLogger(__name__)
+
+
+class TransitionRenderer:
+    """
+    Joins scene clips with crossfades without re-encoding whole scenes.
+
+    Every scene clip except the last carries `duration` seconds of padding
+    (held picture, silent audio) after its narration. At each boundary the
+    window from the last keyframe before the padding of one scene to the
+    first keyframe after the fade in the next is re-encoded with `xfade`.
+    The audio in that window is the outgoing narration followed directly
+    by the incoming narration, so the next scene's narration starts exactly
+    when its picture starts fading in. Everything between the windows is
+    stream-copied.
+    """
+
+    def __init__(
+        self,
+        resolution: str = "1920x1080",
+        fps: int = 30,
+        profile: Optional[EncodingProfile] = None,
+        transition: str = "fade",
+        duration: float = 0.5,
+        progress: Optional[ProgressTracker] = None
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            resolution: Video resolution
+            fps: Frames per second
+            profile: Encoding profile of the scene clips (windows must match)
+            transition: FFmpeg xfade transition name (fade, wipeleft, ...)
+            duration: Transition length in seconds (rounded to whole frames)
+            progress: Tracker that runs the FFmpeg jobs
+        """
+        self.resolution = resolution
+        self.fps = fps
+        self.profile = profile or get_profile("standard")
+        self.transition = transition
+        self.duration = max(1, round(duration * fps)) / fps
+        self.progress = progress or ProgressTracker()
+
+    def render(self, clips: List[str], work_dir: Path) -> Optional[List[str]]:
+        """
+        Cut the clips into stream-copied bodies and re-encoded transition windows.
+
+        Args:
+            clips: Scene clips in order (all but the last padded by self.duration)
+            work_dir: Directory for the pieces
+
+        Returns:
+            Ordered list of pieces to concatenate, or None if failed
+        """
+        durations = [self._get_duration(clip) for clip in clips]
+        if not all(durations):
+            logger.error("Cannot determine scene clip durations for transitions")
+            return None
+
+        keyframes = [self._keyframe_times(clip) for clip in clips]
+        count = len(clips)
+        pad = self.duration
+
+        # Start and end of the stream-copied body of each clip
+        heads = [0.0] * count
+        tails = [durations[i] - (pad if i < count - 1 else 0.0) for i in range(count)]
+        soft = [False] * max(0, count - 1)
+
+        for b in range(count - 1):
+            i, j = b, b + 1
+            tail = self._last_keyframe(keyframes[i], heads[i], durations[i] - pad)
+            head = self._first_keyframe(keyframes[j], pad, durations[j])
+            if tail is not None and head is not None:
+                tails[i] = tail
+                heads[j] = head
+                soft[b] = True
+            else:
+                logger.warning(f"  No keyframe room for a transition after clip {i + 1}, using a cut")
+
+        pieces = []
+        for i, clip in enumerate(clips):
+            if tails[i] - heads[i] > 0.5 / self.fps:
+                body = work_dir / f"{Path(clip).stem}_body.mp4"
+                if not self._copy_range(clip, heads[i], tails[i], str(body)):
+                    return None
+                pieces.append(str(body))
+
+            if i < count - 1 and soft[i]:
+                window = work_dir / f"{Path(clip).stem}_transition.mp4"
+                if not self._render_window(
+                    clip, tails[i], durations[i],
+                    clips[i + 1], heads[i + 1],
+                    str(window)
+                ):
+                    return None
+                pieces.append(str(window))
+
+        logger.info(f"  Rendered {sum(soft)} transition(s), {count} scene bodies stream-copied")
+        return pieces
+
+    def _copy_range(self, clip: str, start: float, end: float, output_path: str) -> bool:
+        """Copy the video of a keyframe-aligned range; re-encode its audio for exact length."""
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", f"{start:.6f}",
+            "-i", clip,
+            "-t", f"{end - start:.6f}",
+            "-map", "0:v:0", "-map", "0:a:0",
+            "-c:v", "copy",
+            *self.profile.audio_args(),
+            output_path
+        ]
+        return self._run(cmd, f"body {Path(clip).stem}", end - start, "remux")
+
+    def _render_window(
+        self,
+        outgoing: str,
+        tail_start: float,
+        outgoing_duration: float,
+        incoming: str,
+        head_end: float,
+        output_path: str
+    ) -> bool:
+        """Re-encode the window around one boundary with a crossfade."""
+        tail_length = outgoing_duration - tail_start
+        narration_length = tail_length - self.duration
+        norm = f"settb=AVTB,fps={self.fps},format=yuv420p,setsar=1"
+
+        graph = ";".join([
+            f"[0:v]{norm}[v0]",
+            f"[1:v]{norm}[v1]",
+            f"[v0][v1]xfade=transition={self.transition}:duration={self.duration:.6f}"
+            f":offset={narration_length:.6f}[v]",
+            f"[0:a]atrim=0:{narration_length:.6f},asetpts=PTS-STARTPTS[a0]",
+            f"[1:a]atrim=0:{head_end:.6f},asetpts=PTS-STARTPTS[a1]",
+            "[a0][a1]concat=n=2:v=0:a=1[a]",
+        ])
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", f"{tail_start:.6f}", "-i", outgoing,
+            "-t", f"{head_end:.6f}", "-i", incoming,
+            "-filter_complex", graph,
+            "-map", "[v]", "-map", "[a]",
+            *self.profile.video_args(),
+            "-pix_fmt", "yuv420p",
+            "-r", str(self.fps),
+            *self.profile.audio_args(),
+            output_path
+        ]
+        return self._run(cmd, f"transition {Path(outgoing).stem}", tail_length + head_end - self.duration, "encode")
+
+    def _last_keyframe(self, keyframes: List[float], low: float, high: float) -> Optional[float]:
+        """Latest keyframe in [low, high]."""
+        candidates = [k for k in keyframes if low <= k <= high + 1e-3]
+        return max(candidates) if candidates else None
+
+    def _first_keyframe(self, keyframes: List[float], low: float, high: float) -> Optional[float]:
+        """Earliest keyframe in [low, high)."""
+        candidates = [k for k in keyframes if low - 1e-3 <= k < high]
+        return min(candidates) if candidates else None
+
+    def _keyframe_times(self, clip: str) -> List[float]:
+        """List the presentation times of a clip's video keyframes."""
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-skip_frame", "nokey",
+            "-show_entries", "frame=pts_time",
+            "-of", "csv=p=0",
+            clip
+        ]
+        try:
+            result = run_process(cmd, capture_output=True, text=True, timeout=60)
+            if result.returncode == 0:
+                return sorted(
+                    float(line.strip().rstrip(','))
+                    for line in result.stdout.splitlines()
+                    if line.strip().rstrip(',')
+                )
+        except Exception as e:
+            logger.error(f"Error reading keyframes: {e}")
+        return [0.0]
+
+    def _get_duration(self, media_path: str) -> Optional[float]:
+        """Get duration of media file in seconds."""
+        try:
+            cmd = [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                media_path
+            ]
+            result = run_process(cmd, capture_output=True, text=True, timeout=10)
+            if result.returncode == 0 and result.stdout.strip():
+                return float(result.stdout.strip())
+        except Exception as e:
+            logger.error(f"Error getting duration: {e}")
+        return None
+
+    def _run(self, cmd: List[str], label: str, media_seconds: float, kind: str) -> bool:
+        """Run an FFmpeg command and report failures."""
+        try:
+            result = self.progress.run(
+                cmd,
+                label=label,
+                media_seconds=media_seconds,
+                kind=kind,
+                resolution=self.resolution
+            )
+            if result.returncode != 0:
+                logger.error(f"FFmpeg {label} error: {result.stderr}")
+            return result.returncode == 0 and Path(cmd[-1]).exists()
+        except Exception as e:
+            logger.error(f"Error rendering {label}: {e}")
+            return False
@@ -4,23 +4,53 @@ Video Assembler Module
 Synchronizes audio and visuals and renders final MP4 video.
 """
 
+import hashlib
 import os
-import subprocess
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import logging
 
+from encoder_budget import EncoderBudget
+from encoding_profiles import EncodingProfile, get_profile
+from ffmpeg_progress import ProgressTracker
+from log_routing import log_context
+from process_runner import command_available, run_process
+from run_journal import SceneCheckpoint, file_signature, fingerprint
+from scene_dedup import SceneClipCache, scene_fingerprint
+from segmented_output import HLSPublisher
+from streaming_muxer import StreamingMuxer
+from tracing import get_tracer, in_current_context
+from transitions import TransitionRenderer
+
 logger = logging.getLogger(__name__)
 
 
 class VideoAssembler:
     """Assembles final video from audio and visual components."""
     
+    # Length of the still-image clip that is looped with stream copy
+    STILL_GOP_SECONDS = 1.0
+    
     def __init__(
         self,
         output_dir: str,
         resolution: str = "1920x1080",
-        fps: int = 30
+        fps: int = 30,
+        profile: Optional[EncodingProfile] = None,
+        mode: str = "per_scene",
+        encoder_budget: Optional[EncoderBudget] = None,
+        renditions: Optional[List[str]] = None,
+        hls_segment_seconds: Optional[float] = None,
+        transition: Optional[str] = None,
+        transition_duration: float = 0.5,
+        progress: Optional[ProgressTracker] = None,
+        checkpoint: Optional[SceneCheckpoint] = None,
+        keep_scene_clips: bool = False,
+        scene_cache: Optional[SceneClipCache] = None
     ):
         """
         Initialize the video assembler.
@@ -29,11 +59,48 @@ class VideoAssembler:
             output_dir: Directory for output files
             resolution: Video resolution
             fps: Frames per second
+            profile: Encoding profile for every encode (defaults to "standard")
+            mode: "per_scene" (one clip per scene, then concat),
+                "filtergraph" (whole script in one FFmpeg process) or
+                "streaming" (clips piped into the final file as they finish)
+            encoder_budget: Global encoder thread budget shared by scene encodes
+            renditions: Extra output resolutions (e.g. ["1280x720", "854x480"])
+                derived from the full-resolution video in one FFmpeg run
+            hls_segment_seconds: Also publish an HLS playlist, with segments of
+                about this length, that grows as scene clips finish
+            transition: FFmpeg xfade transition between scenes (e.g. "fade");
+                None for hard cuts. Applies to "per_scene" mode only
+            transition_duration: Transition length in seconds
+            progress: Tracker that runs FFmpeg jobs and collects their metrics
+            checkpoint: Run journal view that records (and on resume restores)
+                each encoded scene clip
+            keep_scene_clips: Leave per-scene clips on disk after
+                concatenation so a later render can reuse unchanged scenes
+            scene_cache: Clips shared across scripts; a scene identical to
+                one already encoded (same narration, visual and settings)
+                reuses its clip. Demo capture scenes are always encoded
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.resolution = resolution
         self.fps = fps
+        self.mode = mode
+        self.checkpoint = checkpoint or SceneCheckpoint()
+        self.keep_scene_clips = keep_scene_clips
+        self.scene_cache = scene_cache
+        self.encoder_budget = encoder_budget or EncoderBudget()
+        self.encode_stats: Dict = {}
+        self.profile = profile or get_profile("standard")
+        self.progress = progress or ProgressTracker()
+        self.renditions = [r for r in (renditions or []) if r != resolution]
+        self.rendition_outputs: List[Dict] = []
+        self.hls_segment_seconds = hls_segment_seconds
+        self.hls_playlist: Optional[str] = None
+        self.transition_renderer: Optional[TransitionRenderer] = None
+        if transition:
+            self.transition_renderer = TransitionRenderer(
+                resolution, fps, self.profile, transition, transition_duration, self.progress
+            )
         
     def assemble(
         self,
@@ -61,7 +128,93 @@ class VideoAssembler:
             logger.error("FFmpeg not available, cannot assemble video")
             return None
         
-        # Match audio and visuals to scenes
+        scene_components = self._match_components(scenes, audio_files, visual_files)
+        
+        if not scene_components:
+            logger.error("No complete scenes to assemble")
+            return None
+        
+        logger.info(f"Assembling video from {len(scene_components)} scene(s)...")
+        
+        if self.mode == "filtergraph":
+            success = self._assemble_filtergraph(scene_components, str(output_file))
+            if success and self.hls_segment_seconds:
+                # No per-scene clips in this mode; publish the finished video
+                self._publish_video_hls(script_name, str(output_file))
+        elif self.mode == "streaming":
+            success = self._assemble_streaming(scene_components, script_name, str(output_file))
+        else:
+            success = self._assemble_per_scene(scene_components, script_name, str(output_file))
+            if success and self.hls_segment_seconds and self.transition_renderer:
+                # Scene clips hold their last frame for the fade; only the
+                # finished video matches what viewers should see
+                self._publish_video_hls(script_name, str(output_file))
+        
+        if success and output_file.exists():
+            file_size = output_file.stat().st_size / (1024 * 1024)  # MB
+            logger.info(f"✓ Video created: {output_file.name} ({file_size:.1f} MB)")
+            self.rendition_outputs = [{
+                "resolution": self.resolution,
+                "path": str(output_file),
+                "size_mb": round(file_size, 2)
+            }]
+            if self.renditions:
+                self.rendition_outputs += self._encode_renditions(str(output_file), script_name)
+            return str(output_file)
+        else:
+            logger.error("✗ Video assembly failed")
+            return None
+    
+    def encode_scene_clip(
+        self,
+        script_name: str,
+        scene: Dict,
+        audio_file: Dict,
+        visual_file: Dict,
+        last: bool = True
+    ) -> Optional[str]:
+        """
+        Encode a single scene's clip ahead of assembly.
+
+        The clip is encoded exactly as assemble() would encode it (including
+        the transition hold on every scene but the last) and goes through the
+        checkpoint, so an assemble() later given the recorded clip reuses it.
+
+        Args:
+            script_name: Base name for output
+            scene: Scene dictionary
+            audio_file: The scene's audio file info dict
+            visual_file: The scene's visual file info dict
+            last: Whether this is the script's last narrated scene
+
+        Returns:
+            Path to the scene clip, or None if failed
+        """
+        scene_components = self._match_components([scene], [audio_file], [visual_file])
+        if not scene_components:
+            return None
+        if self.mode == "per_scene" and self.transition_renderer and not last:
+            scene_components[0]['tail_pad'] = self.transition_renderer.duration
+        scene_videos = self._encode_scenes(scene_components, script_name)
+        return scene_videos[0] if scene_videos else None
+
+    def _match_components(
+        self,
+        scenes: List[Dict],
+        audio_files: List[Dict],
+        visual_files: List[Dict]
+    ) -> List[Dict]:
+        """
+        Match audio and visuals to scenes.
+        
+        Args:
+            scenes: List of scene dictionaries
+            audio_files: List of audio file info dicts
+            visual_files: List of visual file info dicts
+            
+        Returns:
+            List of scene component dicts for scenes that have both
+        """
         scene_components = []
         for scene in scenes:
             scene_num = scene['scene_num']
@@ -78,7 +231,10 @@ class VideoAssembler:
                     "audio_duration": audio.get('duration'),
                     "visual_path": visual['path'],
                     "visual_type": visual.get('type'),
-                    "heading": scene.get('heading', f'Scene {scene_num}')
+                    "visual_duration": visual.get('duration'),
+                    "stream_copy": visual.get('stream_copy', False),
+                    "heading": scene.get('heading', f'Scene {scene_num}'),
+                    "fingerprint": scene_fingerprint(scene)
                 })
             else:
                 logger.warning(f"Missing components for scene {scene_num}")
@@ -87,46 +243,475 @@ class VideoAssembler:
                 if not visual:
                     logger.warning(f"  No visual found")
         
-        if not scene_components:
-            logger.error("No complete scenes to assemble")
-            return None
+        return scene_components
+    
+    def _assemble_per_scene(
+        self,
+        scene_components: List[Dict],
+        script_name: str,
+        output_path: str
+    ) -> bool:
+        """
+        Encode one clip per scene, then concatenate them with stream copy.
         
-        logger.info(f"Assembling video from {len(scene_components)} scene(s)...")
+        Args:
+            scene_components: Matched scene components
+            script_name: Base name
+            output_path: Final video path
+            
+        Returns:
+            True if successful
+        """
+        publisher = None
+        if self.hls_segment_seconds and self.transition_renderer:
+            logger.info("  With transitions, HLS segments are published once the video is complete")
+        elif self.hls_segment_seconds:
+            publisher = self._hls_publisher(script_name, len(scene_components))
         
-        # Create individual scene videos
-        scene_videos = []
-        for component in scene_components:
-            scene_video = self._create_scene_video(component, script_name)
-            if scene_video:
-                scene_videos.append(scene_video)
+        if self.transition_renderer:
+            # Every scene but the last holds its picture through the fade
+            for component in scene_components[:-1]:
+                component['tail_pad'] = self.transition_renderer.duration
+        
+        scene_videos = self._encode_scenes(scene_components, script_name, publisher)
+        
+        if publisher:
+            self.hls_playlist = publisher.finalize()
         
         if not scene_videos:
             logger.error("No scene videos were created")
-            return None
+            return False
+        
+        pieces = scene_videos
+        if self.transition_renderer and len(scene_videos) == len(scene_components) > 1:
+            logger.info(f"Rendering {self.transition_renderer.transition} transitions...")
+            pieces = self.transition_renderer.render(scene_videos, self.output_dir)
+            if not pieces:
+                logger.error("Transition rendering failed")
+                return False
+        elif self.transition_renderer:
+            logger.warning("  Scenes are missing, joining without transitions")
         
         # Concatenate scene videos
         logger.info("Concatenating scenes...")
-        success = self._concatenate_videos(scene_videos, str(output_file))
+        total_duration = sum(c.get('audio_duration') or 0.0 for c in scene_components)
+        success = self._concatenate_videos(pieces, output_path, total_duration)
         
-        # Clean up scene videos
-        for scene_video in scene_videos:
+        # Clean up scene videos (and transition pieces)
+        leftovers = set(pieces) - set(scene_videos) if self.keep_scene_clips else set(scene_videos + pieces)
+        for scene_video in leftovers:
             try:
                 Path(scene_video).unlink()
             except:
                 pass
         
-        if success and output_file.exists():
-            file_size = output_file.stat().st_size / (1024 * 1024)  # MB
-            logger.info(f"✓ Video created: {output_file.name} ({file_size:.1f} MB)")
-            return str(output_file)
+        return success
+    
+    def _assemble_streaming(
+        self,
+        scene_components: List[Dict],
+        script_name: str,
+        output_path: str
+    ) -> bool:
+        """
+        Write the final video while later scenes are still encoding.
+        
+        Finished clips are streamed in scene order into a single muxer over
+        a pipe and deleted right away (unless keep_scene_clips is set), so
+        the file is complete shortly after the last scene encodes and at
+        most the clips still waiting for an earlier scene are held on disk.
+        
+        Args:
+            scene_components: Matched scene components
+            script_name: Base name
+            output_path: Final video path
+            
+        Returns:
+            True if successful
+        """
+        muxer = StreamingMuxer(output_path, len(scene_components), self.progress, self.keep_scene_clips)
+        if not muxer.start():
+            return False
+        
+        publisher = None
+        if self.hls_segment_seconds:
+            publisher = self._hls_publisher(script_name, len(scene_components))
+        
+        def on_complete(index: int, clip_path: Optional[str]) -> None:
+            # The clip runs longer than its narration (AAC priming, frame
+            # rounding), so the next scene starts where the clip really ends
+            muxer.add(index, clip_path, self._get_duration(clip_path) if clip_path else None)
+        
+        scene_videos = self._encode_scenes(scene_components, script_name, publisher, on_complete)
+        
+        if publisher:
+            self.hls_playlist = publisher.finalize()
+        
+        if not scene_videos:
+            logger.error("No scene videos were created")
+        
+        total_duration = sum(c.get('audio_duration') or 0.0 for c in scene_components)
+        return muxer.finish(timeout=max(600, total_duration))
+    
+    def _publish_video_hls(self, script_name: str, video_path: str) -> None:
+        """Publish a finished video as HLS in one piece."""
+        publisher = self._hls_publisher(script_name, 1)
+        publisher.publish_scene(0, 1, video_path)
+        self.hls_playlist = publisher.finalize()
+    
+    def _hls_publisher(self, script_name: str, scene_count: int) -> HLSPublisher:
+        """Create the HLS publisher for a script's segmented output."""
+        hls_dir = self.output_dir / f"{script_name}_hls"
+        logger.info(f"  Publishing HLS segments to {hls_dir}")
+        return HLSPublisher(hls_dir, scene_count, self.hls_segment_seconds, self.progress)
+    
+    def _encode_scenes(
+        self,
+        scene_components: List[Dict],
+        script_name: str,
+        publisher: Optional[HLSPublisher] = None,
+        on_complete: Optional[Callable[[int, Optional[str]], None]] = None
+    ) -> List[str]:
+        """
+        Encode scene clips in parallel under the global encoder thread budget.
+        
+        The budget decides how many FFmpeg processes run at once and how many
+        threads each one gets, sized from scene duration. Longest scenes are
+        started first, unless a publisher or on_complete consumes clips as
+        they finish: then scenes start in scene order, so no more clips wait
+        on an earlier scene than there are parallel jobs. Throughput is stored in
+        self.encode_stats.
+        
+        Args:
+            scene_components: Matched scene components
+            script_name: Base name
+            publisher: Optional HLS publisher notified as each clip finishes
+            on_complete: Optional callback receiving (index, clip path or None)
+                once each scene is done, after it has been published
+            
+        Returns:
+            Scene clip paths in scene order (failed scenes are left out)
+        """
+        # Resolve durations up front so the budget can size each job
+        for component in scene_components:
+            if not component.get('audio_duration'):
+                component['audio_duration'] = self._get_duration(component['audio_path'])
+        
+        durations = [component.get('audio_duration') or 0.0 for component in scene_components]
+        self.progress.expect(sum(durations))
+        plan = self.encoder_budget.plan(durations)
+        scene_videos: List[Optional[str]] = [None] * len(scene_components)
+        jobs = []
+        
+        def encode(index: int) -> None:
+            scene_num = scene_components[index]['scene_num']
+            threads = plan["threads"][index]
+            start = time.perf_counter()
+            elapsed = 0.0
+            try:
+                with self.encoder_budget.reserve(plan["threads"][index]) as threads:
+                    start = time.perf_counter()
+                    with get_tracer().span(
+                        "encode", "scene", scene_num=scene_num, threads=threads
+                    ), log_context(scene=scene_num):
+                        scene_videos[index] = self.checkpoint.unit(
+                            "clip", scene_num,
+                            self._clip_key(scene_components[index]),
+                            lambda: self._produce_scene_clip(scene_components[index], script_name, threads)
+                        )
+                    elapsed = time.perf_counter() - start
+                if publisher and scene_videos[index]:
+                    publisher.publish_scene(index, scene_num, scene_videos[index])
+            except Exception as e:
+                # One bad scene must not take down the rest of the assembly
+                logger.error(f"    Error encoding scene {scene_num}: {e}")
+                scene_videos[index] = None
+                elapsed = elapsed or time.perf_counter() - start
+            finally:
+                jobs.append({
+                    "scene_num": scene_num,
+                    "threads": threads,
+                    "media_seconds": round(durations[index], 3),
+                    "wall_seconds": round(elapsed, 3),
+                    "speed": round(durations[index] / elapsed, 2) if elapsed > 0 else None,
+                    "success": scene_videos[index] is not None
+                })
+                if on_complete:
+                    on_complete(index, scene_videos[index])
+        
+        if publisher or on_complete:
+            order = list(range(len(scene_components)))
         else:
-            logger.error("✗ Video assembly failed")
-            return None
+            order = sorted(range(len(scene_components)), key=lambda i: durations[i], reverse=True)
+        logger.info(
+            f"  Encoding {len(order)} scene(s) with {plan['jobs']} parallel job(s), "
+            f"{self.encoder_budget.cpu_budget} thread budget"
+        )
+        
+        start = time.perf_counter()
+        if plan["jobs"] > 1:
+            with ThreadPoolExecutor(max_workers=plan["jobs"]) as executor:
+                list(executor.map(in_current_context(encode), order))
+        else:
+            for index in order:
+                encode(index)
+        wall_seconds = time.perf_counter() - start
+        
+        media_seconds = sum(durations)
+        self.encode_stats = {
+            "parallel_jobs": plan["jobs"],
+            "cpu_budget": self.encoder_budget.cpu_budget,
+            "media_seconds": round(media_seconds, 3),
+            "wall_seconds": round(wall_seconds, 3),
+            "speed": round(media_seconds / wall_seconds, 2) if wall_seconds > 0 else None,
+            "jobs": sorted(jobs, key=lambda job: job["scene_num"])
+        }
+        logger.info(
+            f"  Encoded {media_seconds:.1f}s of video in {wall_seconds:.1f}s "
+            f"({self.encode_stats['speed']}x realtime)"
+        )
+        
+        return [video for video in scene_videos if video]
+    
+    def _produce_scene_clip(self, component: Dict, script_name: str, threads: int = 0) -> Optional[str]:
+        """Encode a scene clip, or reuse an identical one through the scene cache."""
+        encode = lambda: self._create_scene_video(component, script_name, threads)
+        # Demo clips depend on where the scene falls in its script's capture
+        if not self.scene_cache or component.get('visual_type') == 'demo_capture':
+            return encode()
+        return self.scene_cache.clip(
+            self._shared_clip_key(component),
+            self._scene_clip_path(script_name, component['scene_num']),
+            encode
+        )
+    
+    def _shared_clip_key(self, component: Dict) -> str:
+        """Fingerprint of a scene clip that holds across scripts (contents, not paths)."""
+        return fingerprint(
+            component.get('fingerprint'),
+            self.resolution, self.fps, self.profile.cache_key(),
+            self._content_digest(component['audio_path']),
+            self._content_digest(component['visual_path']),
+            component.get('visual_type'), component.get('stream_copy'),
+            component.get('tail_pad', 0.0)
+        )
+    
+    def _content_digest(self, path: str) -> str:
+        """SHA-256 of a file's contents."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _scene_clip_path(self, script_name: str, scene_num: int) -> Path:
+        """Where a script's scene clip is written."""
+        return self.output_dir / f"{script_name}_scene{scene_num:02d}.mp4"
+    
+    def _clip_key(self, component: Dict) -> str:
+        """Fingerprint of everything a scene clip's encode depends on."""
+        return fingerprint(
+            self.resolution, self.fps, self.profile.cache_key(),
+            component['audio_path'], file_signature(component['audio_path']),
+            component['visual_path'], file_signature(component['visual_path']),
+            component.get('visual_type'), component.get('stream_copy'),
+            component.get('tail_pad', 0.0)
+        )
+    
+    def _keyframe_args(self, keyframe_times: Optional[List[float]]) -> List[str]:
+        """FFmpeg arguments forcing keyframes at the given times."""
+        if not keyframe_times:
+            return []
+        return ["-force_key_frames", ",".join(f"{t:.3f}" for t in keyframe_times)]
+    
+    def _thread_args(self, threads: int) -> List[str]:
+        """FFmpeg arguments limiting encoder threads (0 lets FFmpeg decide)."""
+        return ["-threads", str(threads)] if threads else []
+    
+    def _assemble_filtergraph(self, scene_components: List[Dict], output_path: str) -> bool:
+        """
+        Encode the whole script in a single FFmpeg process.
+        
+        Every scene image/clip and narration track is an input of one
+        filtergraph that normalizes each scene and joins them with the
+        concat filter, so there is one encoder start-up and no
+        intermediate files.
+        
+        Args:
+            scene_components: Matched scene components
+            output_path: Final video path
+            
+        Returns:
+            True if successful
+        """
+        width, height = self.resolution.split('x')
+        inputs = []
+        filters = []
+        concat_pads = []
+        total_duration = 0.0
+        
+        for k, component in enumerate(scene_components):
+            duration = component.get('audio_duration') or self._get_duration(component['audio_path'])
+            if not duration:
+                logger.warning(f"  Cannot determine audio duration for scene {component['scene_num']}, skipping")
+                continue
+            total_duration += duration
+            
+            video_index = len(inputs)
+            if component.get('visual_type') in ['title_card', 'diagram']:
+                inputs.append(["-loop", "1", "-framerate", str(self.fps),
+                               "-t", f"{duration:.3f}", "-i", component['visual_path']])
+            else:
+                visual_duration = component.get('visual_duration') or self._get_duration(component['visual_path'])
+                loop = ["-stream_loop", "-1"] if not visual_duration or visual_duration < duration else []
+                inputs.append(loop + ["-t", f"{duration:.3f}", "-i", component['visual_path']])
+            inputs.append(["-i", component['audio_path']])
+            
+            filters.append(
+                f"[{video_index}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={self.fps},format=yuv420p,"
+                f"trim=duration={duration:.3f},setpts=PTS-STARTPTS[v{k}]"
+            )
+            filters.append(
+                f"[{video_index + 1}:a]aresample=48000,aformat=channel_layouts=stereo,"
+                f"apad,atrim=duration={duration:.3f},asetpts=PTS-STARTPTS[a{k}]"
+            )
+            concat_pads.append(f"[v{k}][a{k}]")
+        
+        if not concat_pads:
+            logger.error("No scenes with known duration to assemble")
+            return False
+        
+        filters.append(f"{''.join(concat_pads)}concat=n={len(concat_pads)}:v=1:a=1[outv][outa]")
+        
+        # Large graphs exceed command-line limits, so pass them as a file
+        graph_file = Path(output_path).with_suffix('.filtergraph.txt')
+        try:
+            with open(graph_file, 'w') as f:
+                f.write(";\n".join(filters))
+            
+            cmd = ["ffmpeg", "-y"]
+            for input_args in inputs:
+                cmd += input_args
+            cmd += [
+                "-filter_complex_script", str(graph_file),
+                "-map", "[outv]",
+                "-map", "[outa]",
+                *self.profile.video_args(),
+                "-pix_fmt", "yuv420p",
+                *self.profile.audio_args(),
+                "-movflags", "+faststart",
+                *self._thread_args(self.encoder_budget.cpu_budget),
+                output_path
+            ]
+            
+            logger.info(f"  Encoding {len(concat_pads)} scene(s) in a single pass...")
+            self.progress.expect(total_duration)
+            result = self.progress.run(
+                cmd,
+                label="filtergraph",
+                media_seconds=total_duration,
+                planned=True,
+                resolution=self.resolution
+            )
+            
+            if result.returncode != 0:
+                logger.error(f"FFmpeg filtergraph error: {result.stderr}")
+            
+            return result.returncode == 0 and Path(output_path).exists()
+            
+        except Exception as e:
+            logger.error(f"Error assembling with filtergraph: {e}")
+            return False
+        finally:
+            if graph_file.exists():
+                graph_file.unlink()
+    
+    def _encode_renditions(self, master_path: str, script_name: str) -> List[Dict]:
+        """
+        Produce the lower renditions of the ladder in a single FFmpeg run.
+        
+        The full-resolution video is decoded once and fanned out with a
+        split/scale filtergraph; the narration track is copied into every
+        rendition rather than re-encoded.
+        
+        Args:
+            master_path: Full-resolution video
+            script_name: Base name
+            
+        Returns:
+            List of rendition dicts ("resolution", "path", "size_mb")
+        """
+        master_width, master_height = map(int, self.resolution.split('x'))
+        ladder = []
+        for rendition in self.renditions:
+            try:
+                width, height = map(int, rendition.split('x'))
+            except ValueError:
+                logger.warning(f"Invalid rendition '{rendition}', skipping")
+                continue
+            if width > master_width or height > master_height:
+                logger.warning(f"Rendition {rendition} exceeds source resolution, skipping")
+                continue
+            ladder.append((width, height))
+        
+        if not ladder:
+            return []
+        
+        split_labels = "".join(f"[s{i}]" for i in range(len(ladder)))
+        filters = [f"[0:v]split={len(ladder)}{split_labels}"]
+        filters += [
+            f"[s{i}]scale={width}:{height}:flags=bicubic,setsar=1[r{i}]"
+            for i, (width, height) in enumerate(ladder)
+        ]
+        
+        cmd = ["ffmpeg", "-y", "-i", master_path, "-filter_complex", ";".join(filters)]
+        outputs = []
+        for i, (width, height) in enumerate(ladder):
+            output_file = self.output_dir / f"{script_name}_{height}p.mp4"
+            cmd += [
+                "-map", f"[r{i}]",
+                "-map", "0:a?",
+                *self.profile.video_args(),
+                "-pix_fmt", "yuv420p",
+                "-c:a", "copy",
+                "-movflags", "+faststart",
+                str(output_file)
+            ]
+            outputs.append((f"{width}x{height}", output_file))
+        
+        logger.info(f"Encoding {len(ladder)} rendition(s) in a single pass...")
+        try:
+            result = self.progress.run(
+                cmd,
+                label="renditions",
+                media_seconds=self._get_duration(master_path),
+                resolution=self.resolution
+            )
+            if result.returncode != 0:
+                logger.error(f"FFmpeg rendition error: {result.stderr}")
+                return []
+        except Exception as e:
+            logger.error(f"Error encoding renditions: {e}")
+            return []
+        
+        renditions = []
+        for resolution, output_file in outputs:
+            if output_file.exists():
+                file_size = output_file.stat().st_size / (1024 * 1024)
+                logger.info(f"  ✓ Rendition {resolution}: {output_file.name} ({file_size:.1f} MB)")
+                renditions.append({
+                    "resolution": resolution,
+                    "path": str(output_file),
+                    "size_mb": round(file_size, 2)
+                })
+        return renditions
     
     def _create_scene_video(
         self,
         component: Dict,
-        script_name: str
+        script_name: str,
+        threads: int = 0
     ) -> Optional[str]:
         """
         Create video for a single scene.
@@ -134,6 +719,7 @@ class VideoAssembler:
         Args:
             component: Scene component dict with audio and visual paths
             script_name: Base name
+            threads: Encoder thread count (0 lets FFmpeg decide)
             
         Returns:
             Path to scene video file
@@ -143,8 +729,12 @@ class VideoAssembler:
         visual_path = component['visual_path']
         visual_type = component.get('visual_type', 'unknown')
         audio_duration = component.get('audio_duration')
+        tail_pad = component.get('tail_pad', 0.0)
         
-        output_file = self.output_dir / f"{script_name}_scene{scene_num:02d}.mp4"
+        output_file = self._scene_clip_path(script_name, scene_num)
+        # Never write through a hard link into the shared scene cache
+        if output_file.exists():
+            output_file.unlink()
         
         logger.info(f"  Creating video for scene {scene_num}...")
         
@@ -157,6 +747,9 @@ class VideoAssembler:
                 logger.error(f"    Cannot determine audio duration")
                 return None
             
+            # Keyframes where a transition window may start or end
+            keyframe_times = [tail_pad, audio_duration] if tail_pad else None
+            
             # Handle different visual types
             if visual_type in ['title_card', 'diagram']:
                 # Static image - create video from image
@@ -164,7 +757,9 @@ class VideoAssembler:
                     visual_path,
                     audio_path,
                     str(output_file),
-                    audio_duration
+                    audio_duration + tail_pad,
+                    threads,
+                    keyframe_times
                 )
             elif visual_type == 'demo_capture':
                 # Video - trim or loop to match audio duration
@@ -172,7 +767,11 @@ class VideoAssembler:
                     visual_path,
                     audio_path,
                     str(output_file),
-                    audio_duration
+                    audio_duration + tail_pad,
+                    video_duration=component.get('visual_duration'),
+                    stream_copy=component.get('stream_copy', False),
+                    threads=threads,
+                    keyframe_times=keyframe_times
                 )
             else:
                 logger.error(f"    Unknown visual type: {visual_type}")
@@ -194,44 +793,160 @@ class VideoAssembler:
         image_path: str,
         audio_path: str,
         output_path: str,
-        duration: float
+        duration: float,
+        threads: int = 0,
+        keyframe_times: Optional[List[float]] = None
     ) -> bool:
         """
         Create video from static image and audio.
         
+        Encodes one short keyframe-aligned clip of the still and reaches the
+        target length by looping it with stream copy, so the encode cost does
+        not grow with narration length. Falls back to a full encode if the
+        fast path fails.
+        
         Args:
             image_path: Path to image file
             audio_path: Path to audio file
             output_path: Output video path
-            duration: Video duration in seconds
+            duration: Video duration in seconds (audio is padded with silence)
+            threads: Encoder thread count (0 lets FFmpeg decide)
+            keyframe_times: Extra keyframe times for the full-encode fallback
+                (the looped clip already has one every STILL_GOP_SECONDS)
             
         Returns:
             True if successful
         """
+        gop_clip = self._encode_still_gop(image_path, threads)
+        if gop_clip:
+            try:
+                cmd = [
+                    "ffmpeg", "-y",
+                    "-stream_loop", "-1",
+                    "-i", gop_clip,
+                    "-i", audio_path,
+                    "-t", f"{duration:.3f}",
+                    "-map", "0:v:0",
+                    "-map", "1:a:0",
+                    "-c:v", "copy",
+                    "-af", "apad",
+                    *self.profile.audio_args(),
+                    output_path
+                ]
+                
+                result = self.progress.run(
+                    cmd,
+                    label=Path(output_path).stem,
+                    media_seconds=duration,
+                    planned=True,
+                    kind="remux"
+                )
+                
+                if result.returncode == 0 and Path(output_path).exists():
+                    return True
+                logger.warning(f"Still-image fast path failed, re-encoding: {result.stderr}")
+                
+            except Exception as e:
+                logger.warning(f"Still-image fast path failed, re-encoding: {e}")
+        
+        return self._encode_image_full(
+            image_path, audio_path, output_path, duration, threads, keyframe_times
+        )
+    
+    def _encode_still_gop(self, image_path: str, threads: int = 0) -> Optional[str]:
+        """
+        Encode a still image once as a single closed GOP.
+        
+        The clip is cached next to the scene clips and keyed by the image
+        contents and encoder settings, so repeated scenes reuse it.
+        
+        Args:
+            image_path: Path to image file
+            threads: Encoder thread count (0 lets FFmpeg decide)
+            
+        Returns:
+            Path to the GOP clip, or None if failed
+        """
         try:
+            digest = hashlib.sha256()
+            with open(image_path, 'rb') as f:
+                digest.update(f.read())
+            digest.update(f"{self.resolution}:{self.fps}:{self.profile.cache_key()}:{self.STILL_GOP_SECONDS}".encode())
+            
+            gop_dir = self.output_dir / ".still_gops"
+            gop_dir.mkdir(parents=True, exist_ok=True)
+            gop_clip = gop_dir / f"{digest.hexdigest()[:16]}.mp4"
+            if gop_clip.exists():
+                return str(gop_clip)
+            
+            gop_frames = max(1, int(round(self.fps * self.STILL_GOP_SECONDS)))
+            # Unique per encoder so parallel scenes sharing an image don't collide
+            temp_clip = gop_dir / f"{gop_clip.stem}.{os.getpid()}.{threading.get_ident()}.tmp.mp4"
             cmd = [
                 "ffmpeg", "-y",
                 "-loop", "1",
+                "-framerate", str(self.fps),
+                "-i", image_path,
+                "-frames:v", str(gop_frames),
+                *self.profile.video_args(tune="stillimage"),
+                "-g", str(gop_frames),
+                "-pix_fmt", "yuv420p",
+                "-an",
+                *self._thread_args(threads),
+                str(temp_clip)
+            ]
+            
+            result = self.progress.run(
+                cmd,
+                label="still GOP",
+                media_seconds=self.STILL_GOP_SECONDS,
+                resolution=self.resolution
+            )
+            
+            if result.returncode != 0 or not temp_clip.exists():
+                logger.warning(f"Could not encode still GOP: {result.stderr}")
+                return None
+            
+            temp_clip.replace(gop_clip)
+            return str(gop_clip)
+            
+        except Exception as e:
+            logger.warning(f"Could not encode still GOP: {e}")
+            return None
+    
+    def _encode_image_full(
+        self,
+        image_path: str,
+        audio_path: str,
+        output_path: str,
+        duration: float,
+        threads: int = 0,
+        keyframe_times: Optional[List[float]] = None
+    ) -> bool:
+        """Encode every frame of a still image for the full clip length."""
+        try:
+            cmd = [
+                "ffmpeg", "-y",
+                "-loop", "1",
+                "-framerate", str(self.fps),
                 "-i", image_path,
                 "-i", audio_path,
-                "-c:v", "libx264",
-                "-preset", "medium",
-                "-tune", "stillimage",
-                "-crf", "23",
-                "-c:a", "aac",
-                "-b:a", "192k",
+                *self.profile.video_args(tune="stillimage"),
+                *self.profile.audio_args(),
                 "-pix_fmt", "yuv420p",
-                "-shortest",
-                "-fflags", "+shortest",
-                "-max_interleave_delta", "100M",
+                "-af", "apad",
+                "-t", f"{duration:.3f}",
+                *self._keyframe_args(keyframe_times),
+                *self._thread_args(threads),
                 output_path
             ]
             
-            result = subprocess.run(
+            result = self.progress.run(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
+                label=Path(output_path).stem,
+                media_seconds=duration,
+                planned=True,
+                resolution=self.resolution
             )
             
             if result.returncode != 0:
@@ -248,7 +963,11 @@ class VideoAssembler:
         video_path: str,
         audio_path: str,
         output_path: str,
-        target_duration: float
+        target_duration: float,
+        video_duration: Optional[float] = None,
+        stream_copy: bool = False,
+        threads: int = 0,
+        keyframe_times: Optional[List[float]] = None
     ) -> bool:
         """
         Synchronize video with audio, trimming or looping as needed.
@@ -258,58 +977,64 @@ class VideoAssembler:
             audio_path: Path to audio file
             output_path: Output video path
             target_duration: Target duration in seconds
+            video_duration: Known video duration (probed if omitted)
+            stream_copy: Video is a pre-encoded scene segment that can be
+                copied instead of re-encoded
+            threads: Encoder thread count (0 lets FFmpeg decide)
+            keyframe_times: Times to force keyframes at when re-encoding
             
         Returns:
             True if successful
         """
         try:
             # Get video duration
-            video_duration = self._get_duration(video_path)
+            if not video_duration:
+                video_duration = self._get_duration(video_path)
             if not video_duration:
                 logger.error("Cannot determine video duration")
                 return False
             
+            cmd = ["ffmpeg", "-y"]
+            
             # Decide whether to trim or loop
-            if video_duration >= target_duration:
-                # Trim video to match audio
-                cmd = [
-                    "ffmpeg", "-y",
-                    "-i", video_path,
-                    "-i", audio_path,
-                    "-t", str(target_duration),
-                    "-c:v", "libx264",
-                    "-preset", "medium",
-                    "-crf", "23",
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-map", "0:v:0",
-                    "-map", "1:a:0",
-                    output_path
-                ]
-            else:
+            if video_duration < target_duration:
                 # Loop video to match audio
                 num_loops = int(target_duration / video_duration) + 1
-                cmd = [
-                    "ffmpeg", "-y",
-                    "-stream_loop", str(num_loops),
-                    "-i", video_path,
-                    "-i", audio_path,
-                    "-t", str(target_duration),
-                    "-c:v", "libx264",
-                    "-preset", "medium",
-                    "-crf", "23",
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-map", "0:v:0",
-                    "-map", "1:a:0",
-                    output_path
+                cmd += ["-stream_loop", str(num_loops)]
+            
+            cmd += [
+                "-i", video_path,
+                "-i", audio_path,
+                "-t", str(target_duration),
+            ]
+            
+            if stream_copy:
+                cmd += ["-c:v", "copy"]
+            else:
+                cmd += [
+                    *self.profile.video_args(),
+                    "-pix_fmt", "yuv420p",
+                    "-s", self.resolution,
+                    "-r", str(self.fps),
+                    *self._keyframe_args(keyframe_times),
+                    *self._thread_args(threads),
                 ]
             
-            result = subprocess.run(
+            cmd += [
+                "-af", "apad",
+                *self.profile.audio_args(),
+                "-map", "0:v:0",
+                "-map", "1:a:0",
+                output_path
+            ]
+            
+            result = self.progress.run(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
+                label=Path(output_path).stem,
+                media_seconds=target_duration,
+                planned=True,
+                kind="remux" if stream_copy else "encode",
+                resolution=self.resolution
             )
             
             if result.returncode != 0:
@@ -321,18 +1046,27 @@ class VideoAssembler:
             logger.error(f"Error syncing video with audio: {e}")
             return False
     
-    def _concatenate_videos(self, video_list: List[str], output_path: str) -> bool:
+    def _concatenate_videos(
+        self,
+        video_list: List[str],
+        output_path: str,
+        media_seconds: Optional[float] = None
+    ) -> bool:
         """
         Concatenate multiple video files.
         
         Args:
             video_list: List of video file paths
             output_path: Output video path
+            media_seconds: Total duration, used to size the job's timeout
             
         Returns:
             True if successful
         """
         if len(video_list) == 1:
+            if self.keep_scene_clips:
+                # The kept clip stays where the journal and queue records point
+                return self._link_or_copy(video_list[0], output_path)
             # Just rename/copy single video
             try:
                 Path(video_list[0]).rename(output_path)
@@ -340,7 +1074,6 @@ class VideoAssembler:
             except (OSError, PermissionError) as e:
                 logger.warning(f"Could not rename {video_list[0]}: {e}, trying copy instead")
                 try:
-                    import shutil
                     shutil.copy2(video_list[0], output_path)
                     return True
                 except Exception as copy_err:
@@ -369,14 +1102,15 @@ class VideoAssembler:
                 "-safe", "0",
                 "-i", str(concat_file),
                 "-c", "copy",
+                "-movflags", "+faststart",
                 output_path
             ]
             
-            result = subprocess.run(
+            result = self.progress.run(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=600
+                label="concat",
+                media_seconds=media_seconds,
+                kind="remux"
             )
             
             concat_file.unlink()
@@ -390,6 +1124,22 @@ class VideoAssembler:
             logger.error(f"Error concatenating videos: {e}")
             return False
     
+    def _link_or_copy(self, source: str, target: str) -> bool:
+        """Put a file at target as a hard link (or a copy), replacing target atomically."""
+        temp_path = Path(target).with_name(Path(target).name + ".tmp")
+        try:
+            temp_path.unlink(missing_ok=True)
+            try:
+                os.link(source, temp_path)
+            except OSError:
+                shutil.copy2(source, temp_path)
+            temp_path.replace(target)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to copy video: {e}")
+            temp_path.unlink(missing_ok=True)
+            return False
+    
     def _get_duration(self, media_path: str) -> Optional[float]:
         """Get duration of media file in seconds."""
         if not self._check_command("ffprobe"):
@@ -402,7 +1152,7 @@ class VideoAssembler:
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 media_path
             ]
-            result = subprocess.run(
+            result = run_process(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -420,12 +1170,4 @@ class VideoAssembler:
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available."""
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+        return command_available(command)
@@ -5,19 +5,73 @@ Generates visual footage for video production.
 """
 
 import os
-import subprocess
-import time
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
 import logging
 
+from demo_cache import DemoCaptureCache
+from demo_capture import DemoCaptureEngine
+from demo_timeline import DemoTimeline
+from demo_segmenter import DemoSegmenter
+from encoding_profiles import EncodingProfile, get_profile
+from ffmpeg_progress import ProgressTracker
+from log_routing import log_context
+from process_runner import account_descendants, command_available
+from run_journal import SceneCheckpoint, fingerprint
+from tracing import get_tracer
+
 logger = logging.getLogger(__name__)
 
+# Font candidates with fallbacks for different systems
+BOLD_FONTS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux (Debian/Ubuntu)
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "C:\\Windows\\Fonts\\arialbd.ttf",  # Windows
+    "/usr/share/fonts/liberation/LiberationSans-Bold.ttf",  # RHEL/CentOS
+)
+REGULAR_FONTS = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "C:\\Windows\\Fonts\\arial.ttf",
+    "/usr/share/fonts/liberation/LiberationSans-Regular.ttf",
+)
+
+
+@lru_cache(maxsize=None)
+def _load_font(candidates: tuple, size: int):
+    """
+    Load the first available font at a size.
+
+    Fonts stay loaded for the life of the process, so watch mode and the
+    render server do not reopen them for every card.
+    """
+    from PIL import ImageFont
+    for path in candidates:
+        try:
+            return ImageFont.truetype(path, size)
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
 
 class VisualGenerator:
     """Generates visual footage for scenes."""
     
-    def __init__(self, output_dir: str, resolution: str = "1920x1080", fps: int = 30):
+    def __init__(
+        self,
+        output_dir: str,
+        resolution: str = "1920x1080",
+        fps: int = 30,
+        demo_cache: Optional[DemoCaptureCache] = None,
+        timeline: Optional[DemoTimeline] = None,
+        capture_resolution: Optional[str] = None,
+        capture_fps: Optional[int] = None,
+        capture_profile: Optional[EncodingProfile] = None,
+        progress: Optional[ProgressTracker] = None,
+        checkpoint: Optional[SceneCheckpoint] = None
+    ):
         """
         Initialize the visual generator.
         
@@ -25,12 +79,35 @@ class VisualGenerator:
             output_dir: Directory to save visual files
             resolution: Video resolution (e.g., "1920x1080")
             fps: Frames per second
+            demo_cache: Shared demo capture cache (one is created if omitted)
+            timeline: Interaction timeline run during demo capture
+            capture_resolution: Demo capture resolution (defaults to resolution);
+                draft renders keep the full-size capture so the cache is shared
+            capture_fps: Demo capture frame rate (defaults to fps)
+            capture_profile: Encoding profile for demo capture conversion
+                (defaults to "standard")
+            progress: Tracker that runs FFmpeg jobs and collects their metrics
+            checkpoint: Run journal view that records (and on resume restores)
+                each scene's diagram or title card
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.resolution = resolution
         self.fps = fps
         self.width, self.height = map(int, resolution.split('x'))
+        # Text layout was designed for 1080p; scale it to the output height
+        self.scale = self.height / 1080
+        self.capture_resolution = capture_resolution or resolution
+        self.capture_fps = capture_fps or fps
+        self.capture_width, self.capture_height = map(int, self.capture_resolution.split('x'))
+        self.capture_profile = capture_profile or get_profile("standard")
+        self.progress = progress or ProgressTracker()
+        self.checkpoint = checkpoint or SceneCheckpoint()
+        self.demo_cache = demo_cache or DemoCaptureCache(self.output_dir / "demo_cache")
+        self.timeline = timeline or DemoTimeline()
+        self.segmenter = DemoSegmenter(
+            self.capture_resolution, self.capture_fps, self.capture_profile, self.progress
+        )
         
     def generate_for_scenes(
         self,
@@ -62,139 +139,170 @@ class VisualGenerator:
         # Try demo capture first
         if demo_url:
             logger.info(f"Attempting demo capture from: {demo_url}")
-            demo_video = self._capture_demo(demo_url, script_name, headless)
+            demo_entry = self.demo_cache.get_or_capture(
+                demo_url,
+                self.capture_width,
+                self.capture_height,
+                self.timeline.fingerprint(),
+                lambda output_file: self._capture_demo(demo_url, output_file, headless)
+            )
+            demo_video = demo_entry["path"] if demo_entry else None
             if demo_video:
-                # Use demo video for all scenes (will be split/edited later)
-                for scene in scenes:
-                    visual_files.append({
-                        "scene_num": scene['scene_num'],
-                        "path": demo_video,
-                        "type": "demo_capture",
-                        "duration": None  # Will be determined during assembly
-                    })
+                capture_metadata = demo_entry.get("metadata", {})
+                segments = None
+                if demo_video.endswith('.mp4'):
+                    segments = self.segmenter.segment_for_scenes(
+                        demo_video,
+                        scenes,
+                        capture_metadata.get("scene_marks"),
+                        capture_metadata.get("keyframe_times")
+                    )
+                
+                # Segments match the output format only when capture settings do
+                same_format = (self.capture_resolution, self.capture_fps) == (self.resolution, self.fps)
+                
+                if segments:
+                    # Each scene gets its own keyframe-aligned slice of the demo
+                    for segment in segments:
+                        visual_files.append({
+                            "scene_num": segment['scene_num'],
+                            "path": segment['path'],
+                            "type": "demo_capture",
+                            "duration": segment['duration'],
+                            "segment_start": segment['start'],
+                            "stream_copy": same_format,
+                            "source": demo_video
+                        })
+                else:
+                    # Use the full demo video for all scenes
+                    for scene in scenes:
+                        visual_files.append({
+                            "scene_num": scene['scene_num'],
+                            "path": demo_video,
+                            "type": "demo_capture",
+                            "duration": None,  # Will be determined during assembly
+                            "stream_copy": False
+                        })
                 return visual_files
         
-        # Generate per-scene visuals
+        # Generate per-scene visuals (demo captures resume through the demo cache)
         for scene in scenes:
-            scene_num = scene['scene_num']
-            heading = scene.get('heading', f'Scene {scene_num}')
-            visuals = scene.get('visuals', [])
-            
-            logger.info(f"Generating visuals for scene {scene_num}: {heading}")
-            
-            # Try to generate appropriate visual
-            visual_path = None
-            visual_type = None
-            
-            # Check if scene has specific visual requirements
-            if visuals:
-                logger.info(f"  Visual cues: {visuals}")
-                visual_path = self._generate_diagram(
-                    heading, visuals, script_name, scene_num
-                )
-                visual_type = "diagram"
-            else:
-                # Generate title card
-                visual_path = self._generate_title_card(
-                    heading, script_name, scene_num
+            visual_type = "diagram" if scene.get('visuals') else "title_card"
+            key = fingerprint(self.resolution, scene.get('heading'), scene.get('visuals'))
+            with get_tracer().span(visual_type, "scene", scene_num=scene['scene_num']), \
+                    log_context(scene=scene['scene_num']):
+                entry = self.checkpoint.unit(
+                    "visual", scene['scene_num'], key,
+                    lambda: self._generate_scene_visual(scene, script_name)
                 )
-                visual_type = "title_card"
-            
-            if visual_path:
-                visual_files.append({
-                    "scene_num": scene_num,
-                    "path": visual_path,
-                    "type": visual_type,
-                    "duration": None
-                })
-                logger.info(f"  ✓ Created {Path(visual_path).name}")
-            else:
-                logger.error(f"  ✗ Failed to generate visual for scene {scene_num}")
+            if entry:
+                visual_files.append(entry)
         
         return visual_files
     
+    def _generate_scene_visual(self, scene: Dict, script_name: str) -> Optional[Dict]:
+        """
+        Render the diagram or title card for one scene.
+        
+        Args:
+            scene: Scene dictionary
+            script_name: Base name for output files
+            
+        Returns:
+            Visual file info dict, or None if failed
+        """
+        scene_num = scene['scene_num']
+        heading = scene.get('heading', f'Scene {scene_num}')
+        visuals = scene.get('visuals', [])
+        
+        logger.info(f"Generating visuals for scene {scene_num}: {heading}")
+        
+        # Try to generate appropriate visual
+        visual_path = None
+        visual_type = None
+        
+        # Check if scene has specific visual requirements
+        if visuals:
+            logger.info(f"  Visual cues: {visuals}")
+            visual_path = self._generate_diagram(
+                heading, visuals, script_name, scene_num
+            )
+            visual_type = "diagram"
+        else:
+            # Generate title card
+            visual_path = self._generate_title_card(
+                heading, script_name, scene_num
+            )
+            visual_type = "title_card"
+        
+        if visual_path:
+            logger.info(f"  ✓ Created {Path(visual_path).name}")
+            return {
+                "scene_num": scene_num,
+                "path": visual_path,
+                "type": visual_type,
+                "duration": None
+            }
+        
+        logger.error(f"  ✗ Failed to generate visual for scene {scene_num}")
+        return None
+    
     def _capture_demo(
         self,
         url: str,
-        script_name: str,
+        output_file: Path,
         headless: bool = True
-    ) -> Optional[str]:
+    ) -> Optional[Dict]:
         """
         Capture demo video from URL using browser automation.
         
         Args:
             url: Demo URL to capture
-            script_name: Base name for output
+            output_file: Target path for the captured MP4
             headless: Run browser in headless mode
             
         Returns:
-            Path to captured video file, or None if failed
+            Dict with the captured video "path", or None if failed
         """
-        output_file = self.output_dir / f"{script_name}_demo.mp4"
+        engine = DemoCaptureEngine(headless=headless)
+        with get_tracer().span("playwright", "subprocess", url=url), account_descendants("playwright"):
+            result = engine.capture(
+                {"url": url, "width": self.capture_width, "height": self.capture_height, "timeline": self.timeline}
+            )
+        return self._finalize_capture(result, Path(output_file))
+    
+    def _finalize_capture(self, result: Optional[Dict], output_file: Path) -> Optional[Dict]:
+        """
+        Move a raw capture to its final location, converting to MP4 if possible.
         
-        try:
-            # Check if playwright is available
-            try:
-                from playwright.sync_api import sync_playwright
-            except ImportError:
-                logger.warning("Playwright not available, skipping demo capture")
-                return None
+        Args:
+            result: Capture result from DemoCaptureEngine
+            output_file: Target MP4 path
             
-            logger.info("  Starting browser automation...")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    viewport={"width": self.width, "height": self.height},
-                    record_video_dir=str(self.output_dir),
-                    record_video_size={"width": self.width, "height": self.height}
-                )
-                page = context.new_page()
-                
-                # Navigate and interact
-                logger.info(f"  Navigating to {url}...")
-                page.goto(url, wait_until="networkidle", timeout=30000)
-                
-                # Wait for page to be interactive
-                time.sleep(2)
-                
-                # Scroll through page slowly
-                logger.info("  Capturing interaction...")
-                viewport_height = self.height
-                total_height = page.evaluate("document.body.scrollHeight")
-                scroll_steps = max(1, int(total_height / viewport_height))
-                
-                for i in range(scroll_steps):
-                    scroll_y = i * viewport_height
-                    page.evaluate(f"window.scrollTo(0, {scroll_y})")
-                    time.sleep(1)
-                
-                # Return to top
-                page.evaluate("window.scrollTo(0, 0)")
-                time.sleep(1)
-                
-                # Close and save video
-                page.close()
-                context.close()
-                browser.close()
-                
-                # Find the recorded video
-                video_files = list(self.output_dir.glob("*.webm"))
-                if video_files:
-                    video_file = video_files[-1]
-                    # Convert to mp4 if ffmpeg available
-                    if self._check_command("ffmpeg"):
-                        self._convert_video(str(video_file), str(output_file))
-                        video_file.unlink()
-                        return str(output_file)
-                    else:
-                        video_file.rename(output_file.with_suffix('.webm'))
-                        return str(output_file.with_suffix('.webm'))
-                
-        except Exception as e:
-            logger.error(f"  Demo capture failed: {e}")
+        Returns:
+            Dict with the final video "path" and the timeline metadata,
+            or None if failed
+        """
+        if not result:
             return None
         
-        return None
+        metadata = {k: result[k] for k in ("marks", "scene_marks", "duration") if k in result}
+        keyframe_times = sorted({m["time"] for m in metadata.get("marks", []) if m["time"] > 0})
+        try:
+            video_file = Path(result["path"])
+            if self._check_command("ffmpeg") and self._convert_video(
+                str(video_file), str(output_file), keyframe_times, metadata.get("duration")
+            ):
+                return {"path": str(output_file), "keyframe_times": keyframe_times, **metadata}
+            
+            webm_file = output_file.with_suffix('.webm')
+            shutil.move(str(video_file), str(webm_file))
+            return {"path": str(webm_file), **metadata}
+        except Exception as e:
+            logger.error(f"  Could not store demo capture: {e}")
+            return None
+        finally:
+            DemoCaptureEngine.cleanup(result)
     
     def _generate_diagram(
         self,
@@ -218,7 +326,7 @@ class VisualGenerator:
         output_file = self.output_dir / f"{script_name}_scene{scene_num:02d}_visual.png"
         
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             logger.warning("Pillow not available, falling back to title card")
             return self._generate_title_card(heading, script_name, scene_num)
@@ -228,57 +336,23 @@ class VisualGenerator:
             img = Image.new('RGB', (self.width, self.height), color='#1f2937')
             draw = ImageDraw.Draw(img)
             
-            # Try to load a font with fallbacks for different systems
-            font_paths_heading = [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux (Debian/Ubuntu)
-                "/System/Library/Fonts/Helvetica.ttc",  # macOS
-                "C:\\Windows\\Fonts\\arialbd.ttf",  # Windows
-                "/usr/share/fonts/liberation/LiberationSans-Bold.ttf",  # RHEL/CentOS
-            ]
-            font_paths_text = [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                "/System/Library/Fonts/Helvetica.ttc",
-                "C:\\Windows\\Fonts\\arial.ttf",
-                "/usr/share/fonts/liberation/LiberationSans-Regular.ttf",
-            ]
-            
-            font_heading = None
-            font_text = None
-            
-            for path in font_paths_heading:
-                try:
-                    font_heading = ImageFont.truetype(path, 60)
-                    break
-                except (OSError, IOError):
-                    continue
-            
-            for path in font_paths_text:
-                try:
-                    font_text = ImageFont.truetype(path, 32)
-                    break
-                except (OSError, IOError):
-                    continue
-            
-            # Fallback to default if no fonts found
-            if not font_heading:
-                font_heading = ImageFont.load_default()
-            if not font_text:
-                font_text = ImageFont.load_default()
+            font_heading = _load_font(BOLD_FONTS, self._px(60))
+            font_text = _load_font(REGULAR_FONTS, self._px(32))
             
             # Draw heading
             heading_bbox = draw.textbbox((0, 0), heading, font=font_heading)
             heading_width = heading_bbox[2] - heading_bbox[0]
             heading_x = (self.width - heading_width) // 2
-            draw.text((heading_x, 100), heading, fill='#f9fafb', font=font_heading)
+            draw.text((heading_x, self._px(100)), heading, fill='#f9fafb', font=font_heading)
             
             # Draw visual cues
-            y_offset = 250
+            y_offset = self._px(250)
             for i, cue in enumerate(visual_cues[:5]):  # Max 5 cues
                 # Wrap text
-                wrapped_text = self._wrap_text(cue, font_text, self.width - 200)
+                wrapped_text = self._wrap_text(cue, font_text, self.width - self._px(200))
                 for line in wrapped_text.split('\n'):
-                    draw.text((100, y_offset), f"• {line}", fill='#10b981', font=font_text)
-                    y_offset += 50
+                    draw.text((self._px(100), y_offset), f"• {line}", fill='#10b981', font=font_text)
+                    y_offset += self._px(50)
             
             # Save image
             img.save(output_file, 'PNG')
@@ -308,12 +382,12 @@ class VisualGenerator:
         output_file = self.output_dir / f"{script_name}_scene{scene_num:02d}_title.png"
         
         # Handle None or empty heading (using ScriptParser constant)
-        from .script_parser import ScriptParser
+        from script_parser import ScriptParser
         if not heading:
             heading = ScriptParser.DEFAULT_HEADING.format(scene_num=scene_num)
         
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
         except ImportError:
             logger.error("Pillow not available, cannot generate title card")
             return None
@@ -323,32 +397,15 @@ class VisualGenerator:
             img = Image.new('RGB', (self.width, self.height), color='#1f2937')
             draw = ImageDraw.Draw(img)
             
-            # Load font with fallbacks for different systems
-            font_paths = [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",  # Linux (Debian/Ubuntu)
-                "/System/Library/Fonts/Helvetica.ttc",  # macOS
-                "C:\\Windows\\Fonts\\arialbd.ttf",  # Windows
-                "/usr/share/fonts/liberation/LiberationSans-Bold.ttf",  # RHEL/CentOS
-            ]
-            
-            font = None
-            for path in font_paths:
-                try:
-                    font = ImageFont.truetype(path, 72)
-                    break
-                except (OSError, IOError):
-                    continue
-            
-            if not font:
-                font = ImageFont.load_default()
+            font = _load_font(BOLD_FONTS, self._px(72))
             
             # Draw centered text
-            wrapped_text = self._wrap_text(heading, font, self.width - 200)
+            wrapped_text = self._wrap_text(heading, font, self.width - self._px(200))
             
             # Calculate total height
             lines = wrapped_text.split('\n')
             line_heights = [draw.textbbox((0, 0), line, font=font)[3] for line in lines]
-            total_height = sum(line_heights) + (len(lines) - 1) * 20
+            total_height = sum(line_heights) + (len(lines) - 1) * self._px(20)
             
             # Draw each line centered
             y_offset = (self.height - total_height) // 2
@@ -357,7 +414,7 @@ class VisualGenerator:
                 text_width = bbox[2] - bbox[0]
                 x = (self.width - text_width) // 2
                 draw.text((x, y_offset), line, fill='#f9fafb', font=font)
-                y_offset += bbox[3] + 20
+                y_offset += bbox[3] + self._px(20)
             
             # Save image
             img.save(output_file, 'PNG')
@@ -367,6 +424,10 @@ class VisualGenerator:
             logger.error(f"Title card generation failed: {e}")
             return None
     
+    def _px(self, value: int) -> int:
+        """Scale a 1080p layout measurement to the output resolution."""
+        return max(1, int(round(value * self.scale)))
+    
     def _wrap_text(self, text: str, font, max_width: int) -> str:
         """Wrap text to fit within max_width."""
         try:
@@ -413,16 +474,39 @@ class VisualGenerator:
             
             return '\n'.join(lines)
     
-    def _convert_video(self, input_path: str, output_path: str) -> bool:
-        """Convert video format using FFmpeg."""
+    def _convert_video(
+        self,
+        input_path: str,
+        output_path: str,
+        keyframe_times: Optional[List[float]] = None,
+        duration: Optional[float] = None
+    ) -> bool:
+        """
+        Convert video format using FFmpeg.
+        
+        The output is normalized to the generator's resolution, frame rate and
+        pixel format so scene segments can later be stream-copied, and gets a
+        keyframe at every capture mark so it can be cut there without re-encoding.
+        """
         try:
             cmd = [
                 "ffmpeg", "-y", "-i", input_path,
-                "-c:v", "libx264", "-preset", "medium",
-                "-crf", "23", "-c:a", "aac",
-                output_path
+                *self.capture_profile.video_args(),
+                "-pix_fmt", "yuv420p",
+                "-s", self.capture_resolution, "-r", str(self.capture_fps),
+                "-an"
             ]
-            result = subprocess.run(cmd, capture_output=True, timeout=300)
+            if keyframe_times:
+                cmd += ["-force_key_frames", ",".join(f"{t:.3f}" for t in keyframe_times)]
+            cmd.append(output_path)
+            result = self.progress.run(
+                cmd,
+                label=f"convert {Path(output_path).stem}",
+                media_seconds=duration,
+                resolution=self.capture_resolution
+            )
+            if result.returncode != 0:
+                logger.error(f"FFmpeg conversion error: {result.stderr}")
             return result.returncode == 0
         except Exception as e:
             logger.error(f"Video conversion failed: {e}")
@@ -430,12 +514,4 @@ class VisualGenerator:
     
     def _check_command(self, command: str) -> bool:
         """Check if a command is available."""
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
-            return False
+        return command_available(command)
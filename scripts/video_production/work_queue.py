@@ -0,0 +1,661 @@
+#!/usr/bin/env python3
+"""
+Work Queue Module
+SQLite-backed queue that spreads scene and assembly jobs over many workers.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import logging
+
+from audio_generator import AudioGenerator
+from ffmpeg_progress import ProgressTracker
+from log_routing import get_log_router, log_context
+from process_runner import reset_accounting, resource_scope
+from run_journal import SceneCheckpoint, fingerprint
+from script_parser import ScriptParser
+from script_scanner import ScriptScanner
+from tracing import reset_tracer
+from video_assembler import VideoAssembler
+from visual_generator import VisualGenerator
+
+logger = logging.getLogger(__name__)
+
+# Job kinds in the order a script's jobs run; a job becomes claimable once
+# every job of an earlier phase of the same script is done
+PHASES = {"capture": 0, "scene": 1, "assembly": 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    script TEXT NOT NULL,
+    script_key TEXT NOT NULL,
+    settings_key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    phase INTEGER NOT NULL,
+    scene_num INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    finished REAL,
+    UNIQUE (script_key, kind, scene_num)
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, settings_key);
+CREATE INDEX IF NOT EXISTS jobs_script ON jobs (script_key, phase);
+"""
+
+
+class WorkQueue:
+    """
+    Scene-level render jobs shared through one SQLite database.
+
+    Job states: queued -> leased -> done, or back to queued when a lease
+    expires or an attempt fails, until max_attempts is reached (failed).
+    A job superseded by a newer version of its script is cancelled.
+
+    Claims run in an immediate transaction, so any number of processes on
+    any number of hosts can share the database file as long as its
+    filesystem supports POSIX locks.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 120.0, max_attempts: int = 3):
+        """
+        Open (and if needed create) the queue.
+
+        Args:
+            path: SQLite database file
+            lease_seconds: How long a claim lasts without a heartbeat
+            max_attempts: Attempts per job before it is marked failed
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        # One connection shared with the heartbeat thread
+        self._db = sqlite3.connect(str(self.path), timeout=60, isolation_level=None, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.executescript(SCHEMA)
+
+    def add_script(
+        self,
+        script_name: str,
+        script_key: str,
+        settings_key: str,
+        scenes: List[Dict],
+        capture: bool = False
+    ) -> int:
+        """
+        Queue the jobs of one script version.
+
+        Queued jobs of older versions of the script are cancelled. Adding a
+        version that is already queued only gives its failed jobs another
+        round of attempts.
+
+        Args:
+            script_name: Script name (base name of its outputs)
+            script_key: Fingerprint of the script name, text and render
+                settings (scripts with identical text still get their own jobs)
+            settings_key: Fingerprint of the render settings; only workers
+                configured the same way claim these jobs
+            scenes: Parsed scenes
+            capture: Add a demo capture job that runs before the scene jobs
+
+        Returns:
+            Number of jobs added
+        """
+        narrated = [s['scene_num'] for s in scenes if s['content'].strip()]
+        jobs = [("scene", scene['scene_num'], {
+            "scene": scene,
+            "last": bool(narrated) and scene['scene_num'] == narrated[-1],
+        }) for scene in scenes]
+        jobs.append(("assembly", 0, {"scenes": scenes}))
+        if capture:
+            jobs.append(("capture", 0, {"scenes": scenes}))
+
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET state = 'cancelled', finished = ? "
+                "WHERE script = ? AND script_key != ? AND state IN ('queued', 'leased')",
+                (now, script_name, script_key)
+            )
+            db.execute(
+                "UPDATE jobs SET state = 'queued', attempts = 0, error = NULL, worker = NULL "
+                "WHERE script_key = ? AND state IN ('failed', 'cancelled')",
+                (script_key,)
+            )
+            added = 0
+            for kind, scene_num, payload in jobs:
+                cursor = db.execute(
+                    "INSERT OR IGNORE INTO jobs "
+                    "(script, script_key, settings_key, kind, phase, scene_num, payload, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (script_name, script_key, settings_key, kind, PHASES[kind], scene_num,
+                     json.dumps(payload), now)
+                )
+                added += cursor.rowcount
+        return added
+
+    def claim(self, worker_id: str, settings_key: str) -> Optional[Dict]:
+        """
+        Lease the next runnable job for a worker.
+
+        Expired leases are re-queued (or failed, if out of attempts) first.
+        Assembly jobs go before new scene jobs so started scripts finish
+        before others begin.
+
+        Returns:
+            The job (payload decoded), or None if nothing is runnable
+        """
+        now = time.time()
+        with self._transaction() as db:
+            self._expire_leases(db, now)
+            row = db.execute(
+                "SELECT * FROM jobs AS j WHERE state = 'queued' AND settings_key = ? "
+                "AND NOT EXISTS (SELECT 1 FROM jobs AS d WHERE d.script_key = j.script_key "
+                "AND d.phase < j.phase AND d.state != 'done') "
+                "ORDER BY phase DESC, id LIMIT 1",
+                (settings_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                (worker_id, now + self.lease_seconds, row["id"])
+            )
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+        return job
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND state = 'leased'",
+                (time.time() + self.lease_seconds, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result: Dict) -> bool:
+        """
+        Record a finished job.
+
+        Returns:
+            False if the lease was lost meanwhile (the result is discarded)
+        """
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET state = 'done', result = ?, error = NULL, finished = ? "
+                "WHERE id = ? AND worker = ? AND state = 'leased'",
+                (json.dumps(result), time.time(), job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> None:
+        """Return a failed job to the queue, or fail it (and its script's later jobs) when out of attempts."""
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT * FROM jobs WHERE id = ? AND worker = ? AND state = 'leased'", (job_id, worker_id)
+            ).fetchone()
+            if row is not None:
+                self._retry_or_fail(db, row, error, time.time())
+
+    def results(self, script_key: str, kind: str) -> Dict[int, Dict]:
+        """Results of a script's finished jobs of one kind, by scene number."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT scene_num, result FROM jobs WHERE script_key = ? AND kind = ? AND state = 'done'",
+                (script_key, kind)
+            ).fetchall()
+        return {row["scene_num"]: json.loads(row["result"]) for row in rows}
+
+    def pending(self, settings_key: str) -> int:
+        """Jobs for these settings that are queued or leased."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE settings_key = ? AND state IN ('queued', 'leased')",
+                (settings_key,)
+            ).fetchone()[0]
+
+    def status(self) -> List[Dict]:
+        """Progress of the newest queued version of every script, newest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT script, script_key, kind, state, result, error FROM jobs ORDER BY id DESC"
+            ).fetchall()
+        scripts: Dict[str, Dict] = {}
+        for row in rows:
+            if row["script"] in scripts and scripts[row["script"]]["script_key"] != row["script_key"]:
+                continue
+            entry = scripts.setdefault(row["script"], {
+                "script": row["script"],
+                "script_key": row["script_key"],
+                "scenes": {"queued": 0, "leased": 0, "done": 0, "failed": 0, "cancelled": 0},
+                "assembly": None,
+                "video_path": None,
+                "errors": [],
+            })
+            if row["kind"] == "scene":
+                entry["scenes"][row["state"]] += 1
+            elif row["kind"] == "assembly":
+                entry["assembly"] = row["state"]
+                if row["result"]:
+                    entry["video_path"] = json.loads(row["result"]).get("video_path")
+            if row["error"]:
+                entry["errors"].append(f"{row['kind']}: {row['error']}")
+        return list(scripts.values())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def _transaction(self):
+        """Serialize with this process's other threads and take the database write lock."""
+        return _ImmediateTransaction(self._db, self._lock)
+
+    def _expire_leases(self, db, now: float) -> None:
+        """Re-queue (or fail) jobs whose worker stopped sending heartbeats."""
+        rows = db.execute(
+            "SELECT * FROM jobs WHERE state = 'leased' AND lease_expires < ?", (now,)
+        ).fetchall()
+        for row in rows:
+            logger.warning(
+                f"Lease of {row['kind']} job {row['id']} ({row['script']}) held by "
+                f"{row['worker']} expired, re-queueing"
+            )
+            self._retry_or_fail(db, row, f"lease held by {row['worker']} expired", now)
+
+    def _retry_or_fail(self, db, row, error: str, now: float) -> None:
+        """Queue another attempt, or fail the job and every later job of its script."""
+        if row["attempts"] < self.max_attempts:
+            db.execute(
+                "UPDATE jobs SET state = 'queued', worker = NULL, lease_expires = NULL, error = ? WHERE id = ?",
+                (error, row["id"])
+            )
+            return
+        db.execute(
+            "UPDATE jobs SET state = 'failed', worker = NULL, lease_expires = NULL, error = ?, finished = ? "
+            "WHERE id = ?",
+            (error, now, row["id"])
+        )
+        db.execute(
+            "UPDATE jobs SET state = 'failed', error = ?, finished = ? "
+            "WHERE script_key = ? AND phase > ? AND state = 'queued'",
+            (f"{row['kind']} job {row['id']} failed", now, row["script_key"], row["phase"])
+        )
+
+
+class _ImmediateTransaction:
+    """Context manager running a BEGIN IMMEDIATE ... COMMIT block."""
+
+    def __init__(self, db: sqlite3.Connection, lock: threading.Lock):
+        self.db = db
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.db.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+
+
+class StoredArtifacts(SceneCheckpoint):
+    """
+    Scene checkpoint backed by artifacts recorded in queue job results.
+
+    Scene jobs start empty and collect what they produce in `records`;
+    the assembly job starts from its scene jobs' records, so clips encoded
+    elsewhere are reused whenever their inputs match.
+    """
+
+    def __init__(self, records: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            records: {"<stage>/<scene_num>": {"key": ..., "entry": ...}}
+        """
+        super().__init__()
+        self.records = dict(records or {})
+
+    def unit(self, stage: str, scene_num: int, key: str, produce: Callable[[], Optional[object]]):
+        """Reuse a recorded artifact whose inputs and file match, else produce and record it."""
+        record = self.records.get(f"{stage}/{scene_num}")
+        if record and record["key"] == key:
+            entry = record["entry"]
+            path = entry if isinstance(entry, str) else entry.get("path")
+            if path and os.path.exists(path):
+                return self._used(entry)
+
+        entry = produce()
+        if entry is not None:
+            self.records[f"{stage}/{scene_num}"] = {"key": key, "entry": entry}
+        return self._used(entry)
+
+
+def enqueue_scripts(orchestrator, queue: WorkQueue) -> Dict:
+    """
+    Parse every script and queue its scene and assembly jobs.
+
+    Args:
+        orchestrator: VideoProductionOrchestrator whose settings the jobs use
+        queue: Work queue
+
+    Returns:
+        {"scripts": scripts queued, "jobs": jobs added, "failed": scripts that did not parse}
+    """
+    settings_key = orchestrator.settings_key()
+    summary = {"scripts": 0, "jobs": 0, "failed": []}
+    for script in ScriptScanner(orchestrator.script_dir, orchestrator.script_pattern).scan():
+        parser = ScriptParser(script['path'])
+        scenes = parser.parse() if parser.load() else []
+        if not scenes:
+            logger.error(f"No scenes found in {script['name']}, not queued")
+            summary["failed"].append(script['name'])
+            continue
+        script_key = fingerprint(script['name'], parser.content, settings_key)
+        added = queue.add_script(script['name'], script_key, settings_key, scenes, bool(orchestrator.demo_url))
+        logger.info(f"Queued {script['name']}: {len(scenes)} scene(s), {added} new job(s)")
+        summary["scripts"] += 1
+        summary["jobs"] += added
+    return summary
+
+
+class QueueWorker:
+    """
+    Claims and runs queue jobs with one orchestrator's settings and output store.
+
+    VIDEO_OUT_DIR must be the same shared directory on every host. Artifact
+    paths are stored relative to it, so hosts may mount it in different places.
+    """
+
+    def __init__(
+        self,
+        orchestrator,
+        queue: WorkQueue,
+        worker_id: Optional[str] = None,
+        poll_interval: float = 2.0
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            orchestrator: VideoProductionOrchestrator providing settings,
+                directories and warm state
+            queue: Work queue
+            worker_id: Name recorded on leases (defaults to host:pid)
+            poll_interval: Seconds between claims while the queue is idle
+        """
+        self.orchestrator = orchestrator
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.settings_key = orchestrator.settings_key()
+        self.store = Path(orchestrator.video_out_dir)
+        self.completed = 0
+        self.failed = 0
+        self._stop = threading.Event()
+
+    def run(self, drain: bool = False) -> None:
+        """
+        Run jobs until stopped.
+
+        Args:
+            drain: Exit once no job for these settings is queued or leased
+        """
+        logger.info(f"Worker {self.worker_id} polling {self.queue.path}")
+        try:
+            while not self._stop.is_set():
+                job = self.queue.claim(self.worker_id, self.settings_key)
+                if job is None:
+                    if drain and self.queue.pending(self.settings_key) == 0:
+                        break
+                    self._stop.wait(self.poll_interval)
+                    continue
+                self._run_job(job)
+        except KeyboardInterrupt:
+            pass
+        self.orchestrator.timeouts.save()
+        logger.info(f"Worker {self.worker_id} stopped: {self.completed} job(s) done, {self.failed} failed")
+
+    def stop(self) -> None:
+        """Exit after the current job."""
+        self._stop.set()
+
+    def _run_job(self, job: Dict) -> None:
+        """Run one leased job while a heartbeat keeps its lease alive."""
+        label = f"{job['kind']} job {job['id']} ({job['script']}"
+        label += f" scene {job['scene_num']})" if job['kind'] == "scene" else ")"
+        logger.info(f"Running {label}, attempt {job['attempts']}")
+
+        stop_heartbeat = threading.Event()
+
+        def beat() -> None:
+            while not stop_heartbeat.wait(self.queue.lease_seconds / 3):
+                if not self.queue.heartbeat(job['id'], self.worker_id):
+                    logger.warning(f"Lost the lease on {label}")
+                    return
+
+        heartbeat = threading.Thread(target=beat, name="lease-heartbeat", daemon=True)
+        heartbeat.start()
+        # Each job gets its own trace and accounting so they do not grow
+        # for the life of the worker
+        reset_tracer()
+        reset_accounting()
+        # The job's records also go to its script's log (shared by every job of the script)
+        get_log_router().open_script(
+            job['script'], self.orchestrator.script_log_path(job['script']), self.orchestrator.log_json
+        )
+        start = time.perf_counter()
+        try:
+            with resource_scope(script=job['script'], stage=job['kind']), \
+                    log_context(script=job['script'], scene=job['scene_num'] if job['kind'] == "scene" else None):
+                run = {"capture": self._run_capture, "scene": self._run_scene, "assembly": self._run_assembly}
+                result, error = run[job['kind']](job)
+        except Exception as e:
+            logger.error(f"{label} raised: {e}", exc_info=True)
+            result, error = None, str(e)
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            get_log_router().close_script(job['script'])
+
+        elapsed = time.perf_counter() - start
+        if result is not None:
+            if self.queue.complete(job['id'], self.worker_id, result):
+                self.completed += 1
+                logger.info(f"✓ {label} done in {elapsed:.1f}s")
+            else:
+                logger.warning(f"{label} finished after its lease expired; result discarded")
+        else:
+            self.failed += 1
+            logger.error(f"✗ {label} failed after {elapsed:.1f}s: {error}")
+            self.queue.fail(job['id'], self.worker_id, error or "failed")
+
+    def _run_capture(self, job: Dict):
+        """Capture and segment the demo for every scene of a script."""
+        scenes = job['payload']['scenes']
+        visual_files = self._visual_generator(job['script']).generate_for_scenes(
+            scenes, job['script'], self.orchestrator.demo_url, self.orchestrator.headless
+        )
+        if not visual_files:
+            return None, "No visual files were generated"
+        return {"visuals": [self._to_store(v) for v in visual_files]}, None
+
+    def _run_scene(self, job: Dict):
+        """Produce one scene's narration, visual and (except in filtergraph mode) clip."""
+        scene = job['payload']['scene']
+        name = job['script']
+        if not scene['content'].strip():
+            # Unnarrated scenes are left out of the video, as in a local run
+            return {"skipped": True}, None
+
+        checkpoint = StoredArtifacts()
+        progress = ProgressTracker(name, self.orchestrator.timeouts)
+        audio_files = AudioGenerator(
+            self.orchestrator.audio_dir, self.orchestrator.voice_mode, progress=progress, checkpoint=checkpoint
+        ).generate_from_scenes([scene], name)
+        if not audio_files:
+            return None, "No audio was generated"
+
+        if self.orchestrator.demo_url:
+            captured = self.queue.results(job['script_key'], "capture").get(0, {})
+            visual_files = [
+                self._from_store(v) for v in captured.get("visuals", []) if v['scene_num'] == scene['scene_num']
+            ]
+        else:
+            visual_files = self._visual_generator(name, progress, checkpoint).generate_for_scenes([scene], name)
+        if not visual_files:
+            return None, "No visual was generated"
+
+        result = {"audio": self._to_store(audio_files[0]), "visual": self._to_store(visual_files[0])}
+        if self.orchestrator.assembly_mode != "filtergraph":
+            clip = self._assembler(progress, checkpoint).encode_scene_clip(
+                name, scene, audio_files[0], visual_files[0], job['payload']['last']
+            )
+            if not clip:
+                return None, "Scene clip encode failed"
+            record = checkpoint.records[f"clip/{scene['scene_num']}"]
+            result["clip"] = {"key": record["key"], "entry": self._relative(clip)}
+        self.orchestrator.artifact_store.touch(checkpoint.paths + [v.get("source") for v in visual_files])
+        return result, None
+
+    def _run_assembly(self, job: Dict):
+        """Join a script's scene clips into its video (and renditions/HLS)."""
+        name = job['script']
+        scenes = job['payload']['scenes']
+        scene_results = self.queue.results(job['script_key'], "scene")
+        audio_files, visual_files, records = [], [], {}
+        for scene_num, scene_result in sorted(scene_results.items()):
+            if scene_result.get("skipped"):
+                continue
+            audio_files.append(self._from_store(scene_result["audio"]))
+            visual_files.append(self._from_store(scene_result["visual"]))
+            if "clip" in scene_result:
+                records[f"clip/{scene_num}"] = {
+                    "key": scene_result["clip"]["key"],
+                    "entry": self._absolute(scene_result["clip"]["entry"]),
+                }
+
+        progress = ProgressTracker(name, self.orchestrator.timeouts)
+        checkpoint = StoredArtifacts(records)
+        assembler = self._assembler(progress, checkpoint)
+        video_path = assembler.assemble(name, scenes, audio_files, visual_files)
+        if not video_path:
+            return None, "Video assembly failed"
+        if not self.orchestrator.keep_scene_clips:
+            for record in records.values():
+                Path(record["entry"]).unlink(missing_ok=True)
+
+        store = self.orchestrator.artifact_store
+        artifacts = [f["path"] for f in audio_files + visual_files] + [v.get("source") for v in visual_files]
+        outputs = [video_path, assembler.hls_playlist] + [r["path"] for r in assembler.rendition_outputs]
+        store.touch(artifacts + checkpoint.paths)
+        store.pin(name, outputs, artifacts + checkpoint.paths)
+        store.enforce_quota()
+
+        result = {
+            "script_name": name,
+            "success": True,
+            "video_path": video_path,
+            "ffmpeg": progress.summary(),
+            "worker": self.worker_id,
+        }
+        if assembler.rendition_outputs:
+            result["renditions"] = assembler.rendition_outputs
+        if assembler.hls_playlist:
+            result["hls_playlist"] = assembler.hls_playlist
+        logger.info(f"✓ Video created: {video_path}")
+        return result, None
+
+    def _visual_generator(
+        self,
+        script_name: str,
+        progress: Optional[ProgressTracker] = None,
+        checkpoint: Optional[SceneCheckpoint] = None
+    ) -> VisualGenerator:
+        """Visual generator configured like the orchestrator's."""
+        o = self.orchestrator
+        return VisualGenerator(
+            o.render_visuals_dir,
+            o.render_resolution,
+            o.render_fps,
+            demo_cache=o.demo_cache,
+            timeline=o.demo_timeline,
+            capture_resolution=o.resolution,
+            capture_fps=o.fps,
+            capture_profile=o.profile,
+            progress=progress or ProgressTracker(script_name, o.timeouts),
+            checkpoint=checkpoint
+        )
+
+    def _assembler(self, progress: ProgressTracker, checkpoint: SceneCheckpoint) -> VideoAssembler:
+        """Video assembler configured like the orchestrator's."""
+        o = self.orchestrator
+        return VideoAssembler(
+            o.render_dir,
+            o.render_resolution,
+            o.render_fps,
+            profile=o.render_profile,
+            mode=o.assembly_mode,
+            encoder_budget=o.encoder_budget,
+            renditions=[] if o.draft else o.renditions,
+            hls_segment_seconds=o.hls_segment_seconds,
+            transition=o.transition,
+            transition_duration=o.transition_duration,
+            progress=progress,
+            checkpoint=checkpoint,
+            # Clips are removed once assembly succeeds; a retried assembly
+            # still needs them
+            keep_scene_clips=True,
+            scene_cache=o.scene_cache
+        )
+
+    def _relative(self, path: str) -> str:
+        """Path inside the output store as stored in the queue."""
+        try:
+            return str(Path(path).absolute().relative_to(self.store))
+        except ValueError:
+            return str(path)
+
+    def _absolute(self, path: str) -> str:
+        """Local path of a path stored in the queue."""
+        return str(self.store / path)
+
+    def _to_store(self, entry: Dict) -> Dict:
+        """Artifact entry with its paths relative to the output store."""
+        return {k: self._relative(v) if k in ("path", "source") and v else v for k, v in entry.items()}
+
+    def _from_store(self, entry: Dict) -> Dict:
+        """Artifact entry with its paths resolved on this host."""
+        return {k: self._absolute(v) if k in ("path", "source") and v else v for k, v in entry.items()}
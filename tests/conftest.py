@@ -0,0 +1,6 @@
+"""Puts the video production modules on the import path."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "video_production"))
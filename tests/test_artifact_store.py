@@ -0,0 +1,78 @@
+"""Tests for the artifact store's pins and quota eviction."""
+
+import os
+import time
+
+from artifact_store import ArtifactStore
+
+
+def make_artifact(root, relative, content, age):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_quota_evicts_least_recently_used(tmp_path):
+    oldest = make_artifact(tmp_path, "audio/a.wav", b"a" * 100, age=300)
+    middle = make_artifact(tmp_path, "audio/b.wav", b"b" * 100, age=200)
+    newest = make_artifact(tmp_path, "visuals/c.png", b"c" * 100, age=100)
+    store = ArtifactStore(str(tmp_path), quota_bytes=200, grace_seconds=0)
+
+    store.touch([str(oldest)])
+    report = store.enforce_quota()
+
+    assert report["evicted_files"] == 1
+    assert report["total_bytes"] == 200
+    assert not report["over_quota"]
+    assert oldest.exists() and newest.exists()
+    assert not middle.exists()
+    store.close()
+
+
+def test_copies_of_one_artifact_are_evicted_together(tmp_path):
+    copy = make_artifact(tmp_path, "audio/a.wav", b"same", age=300)
+    other = make_artifact(tmp_path, "audio/cache/a.wav", b"same", age=100)
+    store = ArtifactStore(str(tmp_path), quota_bytes=0, grace_seconds=0)
+
+    report = store.enforce_quota()
+
+    assert report["artifacts"] == 1
+    assert report["evicted_files"] == 2
+    assert not copy.exists() and not other.exists()
+    store.close()
+
+
+def test_pins_hold_until_outputs_are_gone(tmp_path):
+    artifact = make_artifact(tmp_path, "audio/a.wav", b"a" * 100, age=300)
+    video = tmp_path / "intro.mp4"
+    video.write_bytes(b"video")
+    store = ArtifactStore(str(tmp_path), quota_bytes=0, grace_seconds=0)
+    store.pin("intro", [str(video)], [str(artifact)])
+
+    report = store.enforce_quota()
+    assert report["pinned_bytes"] == 100
+    assert report["over_quota"]
+    assert artifact.exists()
+
+    video.unlink()
+    report = store.enforce_quota()
+    assert report["evicted_files"] == 1
+    assert not artifact.exists()
+    store.close()
+
+
+def test_gc_spares_recent_and_bookkeeping_files(tmp_path):
+    stale = make_artifact(tmp_path, "audio/a.wav", b"a", age=30 * 86400)
+    recent = make_artifact(tmp_path, "audio/b.wav", b"b", age=10)
+    index = make_artifact(tmp_path, "audio/index.json", b"{}", age=30 * 86400)
+    store = ArtifactStore(str(tmp_path), grace_seconds=60)
+
+    report = store.gc(max_age_seconds=86400)
+
+    assert report["evicted_files"] == 1
+    assert not stale.exists()
+    assert recent.exists() and index.exists()
+    store.close()
@@ -0,0 +1,88 @@
+"""Tests for sharing demo captures across scripts."""
+
+import urllib.request
+
+import pytest
+
+from demo_cache import DemoCaptureCache
+
+URL = "https://example.com/demo"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DemoCaptureCache(str(tmp_path / "demos"))
+    cache._versions[URL] = "etag:v1"
+    return cache
+
+
+def capture(calls, ok=True):
+    def run(target):
+        calls.append(target)
+        if not ok:
+            return None
+        target.write_bytes(b"capture")
+        return {"path": str(target), "duration": 12.0}
+    return run
+
+
+def test_key_covers_viewport_interaction_and_content_version(cache):
+    key = cache.make_key(URL, 1920, 1080, "timeline-a")
+
+    assert key == cache.make_key(URL, 1920, 1080, "timeline-a")
+    assert key != cache.make_key(URL, 1280, 720, "timeline-a")
+    assert key != cache.make_key(URL, 1920, 1080, "timeline-b")
+    cache._versions[URL] = "etag:v2"
+    assert key != cache.make_key(URL, 1920, 1080, "timeline-a")
+
+
+def test_unversioned_page_falls_back_to_the_time_window(tmp_path, monkeypatch):
+    def unreachable(*args, **kwargs):
+        raise OSError("offline")
+
+    monkeypatch.setattr(urllib.request, "urlopen", unreachable)
+    cache = DemoCaptureCache(str(tmp_path), time_window=60)
+
+    assert cache._content_version(URL).startswith("window:")
+    assert cache._content_version(URL) is cache._versions[URL]
+
+
+def test_second_request_reuses_the_capture_across_instances(cache, tmp_path):
+    calls = []
+    entry = cache.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls))
+    again = cache.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls))
+
+    assert len(calls) == 1
+    assert again == entry
+    assert entry["metadata"] == {"duration": 12.0, "url": URL, "viewport": "1920x1080", "interaction": "timeline-a"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    reopened = DemoCaptureCache(str(tmp_path / "demos"))
+    reopened._versions[URL] = "etag:v1"
+    assert reopened.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls)) == entry
+    assert len(calls) == 1
+
+
+def test_failed_capture_is_not_retried_this_run(cache):
+    calls = []
+
+    assert cache.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls, ok=False)) is None
+    assert cache.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls)) is None
+
+    assert len(calls) == 1
+    assert cache.misses == 1
+
+
+def test_index_drops_entries_whose_capture_is_gone(cache, tmp_path):
+    calls = []
+    gone = cache.get_or_capture(URL, 1920, 1080, "timeline-a", capture(calls))
+    kept = cache.get_or_capture(URL, 1280, 720, "timeline-a", capture(calls))
+    (tmp_path / "demos" / "other.mp4").write_bytes(b"capture")
+
+    cache.output_path(cache.make_key(URL, 1920, 1080, "timeline-a")).unlink()
+    cache.put("other", str(tmp_path / "demos" / "other.mp4"))
+
+    assert [entry["path"] for entry in DemoCaptureCache(str(tmp_path / "demos")).index.values()] == [
+        kept["path"], str(tmp_path / "demos" / "other.mp4")
+    ]
+    assert gone["path"] not in [entry["path"] for entry in cache.index.values()]
@@ -0,0 +1,79 @@
+"""Tests for planning where a demo capture is cut into scenes."""
+
+from demo_segmenter import DemoSegmenter
+
+SCENES = [
+    {"scene_num": 1, "content": "one", "start_time": "0:00", "end_time": "0:30"},
+    {"scene_num": 2, "content": "two three four", "start_time": "0:30", "end_time": "1:00"},
+]
+
+
+def test_capture_marks_set_the_boundaries():
+    segmenter = DemoSegmenter(fps=30)
+    scenes = SCENES + [{"scene_num": 3, "content": "five"}]
+
+    boundaries = segmenter._scene_boundaries(scenes, {"1": 0.4, "2": 5.0, "3": 5.0}, 20.0)
+
+    # The first scene starts the capture and equal marks are a frame apart
+    assert boundaries == [0.0, 5.0, 5.033]
+
+
+def test_timecodes_are_scaled_onto_the_capture():
+    segmenter = DemoSegmenter(fps=30)
+
+    assert segmenter._scene_boundaries(SCENES, {"1": 0.0}, 30.0) == [0.0, 15.0]
+
+
+def test_word_counts_split_the_capture_without_timecodes():
+    segmenter = DemoSegmenter(fps=30)
+    scenes = [{"scene_num": s["scene_num"], "content": s["content"]} for s in SCENES]
+
+    assert segmenter._scene_boundaries(scenes, {}, 8.0) == [0.0, 2.0]
+
+
+def segment(tmp_path, keyframe_times):
+    segmenter = DemoSegmenter(fps=30)
+    capture = tmp_path / "demo.mp4"
+    capture.write_bytes(b"capture")
+    cuts = []
+
+    def cut(video_path, cut_points, segment_dir, stream_copy, capture_duration=None):
+        cuts.append((cut_points, stream_copy))
+        return [
+            {"path": str(capture), "start": 0.0, "duration": 15.0},
+            {"path": str(capture), "start": 15.0, "duration": 15.0},
+        ]
+
+    segmenter._check_command = lambda command: True
+    segmenter._get_duration = lambda path: 30.0
+    segmenter._cut = cut
+    return segmenter.segment_for_scenes(str(capture), SCENES, keyframe_times=keyframe_times), cuts
+
+
+def test_cut_is_stream_copied_on_existing_keyframes(tmp_path):
+    segments, cuts = segment(tmp_path, [0.0, 15.01])
+
+    assert [(s["scene_num"], s["start"]) for s in segments] == [(1, 0.0), (2, 15.0)]
+    assert cuts == [([15.0], True)]
+
+
+def test_cut_is_re_encoded_between_keyframes(tmp_path):
+    _, cuts = segment(tmp_path, [0.0, 14.0])
+
+    assert cuts == [([15.0], False)]
+
+
+def test_segments_are_reused_for_the_same_boundaries(tmp_path):
+    segment(tmp_path, [0.0, 15.0])
+    segments, cuts = segment(tmp_path, [0.0, 15.0])
+
+    assert len(segments) == 2
+    assert cuts == []
+
+
+def test_merged_cuts_reuse_the_last_segment():
+    segments = [{"path": "segment_000.mp4", "start": 0.0, "duration": 30.0}]
+
+    mapped = DemoSegmenter()._map_to_scenes(segments, SCENES)
+
+    assert [(m["scene_num"], m["path"]) for m in mapped] == [(1, "segment_000.mp4"), (2, "segment_000.mp4")]
@@ -0,0 +1,54 @@
+"""Tests for running demo interaction timelines."""
+
+import asyncio
+import time
+
+import pytest
+
+from demo_timeline import DemoTimeline, PlaywrightTimeoutError
+
+
+class FakePage:
+    """Page that never goes network-idle and has no matching selectors."""
+
+    def __init__(self, height=2000):
+        self.height = height
+        self.calls = []
+
+    async def wait_for_load_state(self, state, timeout):
+        self.calls.append(("wait", state))
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def wait_for_selector(self, selector, state, timeout):
+        raise PlaywrightTimeoutError(f"Timeout waiting for {selector}")
+
+    async def evaluate(self, script, *args):
+        self.calls.append(("evaluate", script))
+        return self.height if "scrollHeight" in script and "scrollTo" not in script else None
+
+
+def run(timeline, page):
+    return asyncio.run(timeline.run(page, viewport_height=1000, recording_start=time.monotonic()))
+
+
+def test_default_timeline_records_a_page_that_keeps_polling():
+    page = FakePage()
+    result = run(DemoTimeline(step_timeout=10), page)
+
+    assert [mark["name"] for mark in result["marks"]] == ["start", "section1", "section2", "end"]
+    assert ("wait", "networkidle") in page.calls
+
+
+def test_missing_selector_fails_the_capture():
+    timeline = DemoTimeline([{"action": "wait_for_selector", "selector": "#chart"}], step_timeout=10)
+    with pytest.raises(PlaywrightTimeoutError):
+        run(timeline, FakePage())
+
+
+def test_scene_marks_and_unknown_actions():
+    result = run(DemoTimeline([{"action": "mark", "scene": 2}]), FakePage())
+    assert list(result["scene_marks"]) == ["2"]
+    assert result["marks"][0]["name"] == "scene02"
+
+    with pytest.raises(ValueError):
+        DemoTimeline([{"action": "sleep"}])
@@ -0,0 +1,50 @@
+"""Tests for sharing the encoder thread budget."""
+
+import threading
+
+import pytest
+
+from encoder_budget import EncoderBudget
+
+
+def test_plan_scales_threads_by_scene_length():
+    budget = EncoderBudget(cpu_budget=8, max_jobs=2)
+
+    plan = budget.plan([10.0, 30.0, 20.0])
+
+    assert plan["jobs"] == 2
+    # Each job's share is 4 threads at the mean duration of 20s
+    assert plan["threads"] == [2, 6, 4]
+    assert EncoderBudget(cpu_budget=8, max_jobs=4).plan([1.0])["jobs"] == 1
+    assert budget.plan([]) == {"jobs": 1, "threads": []}
+
+
+def test_reserve_clamps_to_the_budget_and_releases_on_error():
+    budget = EncoderBudget(cpu_budget=4)
+
+    with budget.reserve(16) as threads:
+        assert threads == 4
+        assert budget._available == 0
+    with pytest.raises(RuntimeError):
+        with budget.reserve(3):
+            raise RuntimeError("encode failed")
+
+    assert budget._available == 4
+
+
+def test_reserve_waits_until_threads_are_released():
+    budget = EncoderBudget(cpu_budget=4)
+    acquired = threading.Event()
+
+    def second_encoder():
+        with budget.reserve(2):
+            acquired.set()
+
+    with budget.reserve(3):
+        waiter = threading.Thread(target=second_encoder)
+        waiter.start()
+        assert not acquired.wait(0.1)
+
+    waiter.join(5)
+    assert acquired.is_set()
+    assert budget._available == 4
@@ -0,0 +1,77 @@
+"""Tests for routing log records to per-script logs."""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+
+import pytest
+
+from log_routing import ContextFilter, ScriptLogRouter, log_context
+from tracing import in_current_context
+
+
+@pytest.fixture
+def routed():
+    log_queue = queue.SimpleQueue()
+    stream = io.StringIO()
+    router = ScriptLogRouter(log_queue, logging.StreamHandler(stream))
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+    logger = logging.getLogger("test_log_routing")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    listener = logging.handlers.QueueListener(log_queue, router)
+    listener.start()
+
+    def stop():
+        listener.stop()
+        router.shutdown()
+
+    yield router, logger, stream, stop
+    logger.removeHandler(handler)
+
+
+def test_records_reach_only_their_scripts_log(tmp_path, routed):
+    router, logger, stream, stop = routed
+    router.open_script("intro", tmp_path / "intro.log")
+    router.open_script("pricing", tmp_path / "pricing.log")
+
+    logger.info("batch starting")
+    with log_context(script="intro"):
+        logger.info("intro audio")
+        with log_context(scene=2):
+            logger.info("intro scene")
+    with log_context(script="pricing"):
+        worker = threading.Thread(target=in_current_context(lambda: logger.info("pricing worker")))
+        worker.start()
+        worker.join()
+    router.close_script("intro")
+    with log_context(script="intro"):
+        logger.info("after close")
+    stop()
+
+    intro = (tmp_path / "intro.log").read_text()
+    assert "intro audio" in intro
+    assert "[scene 2] intro scene" in intro
+    assert "pricing" not in intro and "batch" not in intro and "after close" not in intro
+    assert "pricing worker" in (tmp_path / "pricing.log").read_text()
+    assert stream.getvalue().count("\n") == 5
+
+
+def test_json_lines_carry_the_context(tmp_path, routed):
+    router, logger, _, stop = routed
+    router.open_script("intro", tmp_path / "intro.jsonl", json_lines=True)
+
+    with log_context(script="intro", scene=3):
+        logger.warning("slow encode")
+    stop()
+
+    record = json.loads((tmp_path / "intro.jsonl").read_text())
+    assert record["script"] == "intro"
+    assert record["scene"] == 3
+    assert record["level"] == "WARNING"
+    assert record["message"] == "slow encode"
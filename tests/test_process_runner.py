@@ -0,0 +1,43 @@
+"""Tests for running children with resource accounting."""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from process_runner import TrackedProcess, reset_accounting, run_process
+
+
+def test_run_process_records_usage_and_output():
+    accounting = reset_accounting()
+
+    result = run_process([sys.executable, "-c", "print('hi'); raise SystemExit(3)"], capture_output=True, text=True)
+
+    assert result.returncode == 3
+    assert result.stdout == "hi\n"
+    assert accounting.records == [result.usage]
+    assert result.usage["returncode"] == 3
+    assert not result.usage["killed"]
+
+
+def test_timeout_kills_and_accounts_the_child():
+    accounting = reset_accounting()
+    start = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_process([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5)
+
+    assert time.monotonic() - start < 10
+    assert len(accounting.records) == 1
+    assert accounting.records[0]["killed"]
+
+
+def test_poll_does_not_block_on_a_running_child():
+    reset_accounting()
+    process = TrackedProcess([sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE)
+
+    assert process.poll() is None
+    process.stdin.close()
+    assert process.wait(timeout=10) == 0
+    assert process.poll() == 0
@@ -0,0 +1,56 @@
+"""Tests for the render server's job queue."""
+
+from render_server import CANCELLED, RUNNING, JobQueue
+
+
+def test_jobs_run_by_priority_then_submission():
+    queue = JobQueue()
+    first = queue.submit("a.md")
+    second = queue.submit("b.md")
+    urgent = queue.submit("c.md", priority=5)
+
+    assert queue.position(urgent["id"]) == 0
+    assert queue.position(second["id"]) == 2
+    order = [queue.next_job()["id"] for _ in range(3)]
+    assert order == [urgent["id"], first["id"], second["id"]]
+    assert queue.get(first["id"])["status"] == RUNNING
+
+
+def test_cancelled_job_is_skipped():
+    queue = JobQueue()
+    cancelled = queue.submit("a.md")
+    kept = queue.submit("b.md")
+
+    assert queue.cancel(cancelled["id"])["status"] == CANCELLED
+    assert queue.next_job()["id"] == kept["id"]
+    assert queue.cancel(kept["id"])["status"] == RUNNING
+    assert queue.cancel("job-99") is None
+
+
+def test_close_cancels_queued_jobs():
+    queue = JobQueue()
+    job = queue.submit("a.md")
+    queue.close()
+
+    assert queue.next_job() is None
+    assert queue.get(job["id"])["status"] == CANCELLED
+
+
+def test_inline_text_stays_with_its_job():
+    queue = JobQueue()
+    queue.submit("inline/demo.md", name="demo", script_text="first")
+    queue.submit("inline/demo.md", name="demo", script_text="second")
+
+    assert [queue.next_job()["script_text"] for _ in range(2)] == ["first", "second"]
+    assert all("script_text" not in job for job in queue.list())
+
+
+def test_finished_jobs_beyond_history_are_forgotten():
+    queue = JobQueue(history=1)
+    old = queue.submit("a.md")
+    new = queue.submit("b.md")
+    queue.finish(queue.next_job(), {"success": True, "video_path": "a.mp4"})
+    queue.finish(queue.next_job(), None, error="boom")
+
+    assert queue.get(old["id"]) is None
+    assert queue.get(new["id"])["events"][-1]["errors"] == ["boom"]
@@ -0,0 +1,59 @@
+"""Tests for the crash-safe run journal."""
+
+from run_journal import RunJournal
+
+
+def write_journal(tmp_path, scenes):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(str(path))
+    for scene_num in scenes:
+        clip = tmp_path / f"clip{scene_num}.mp4"
+        clip.write_bytes(b"clip")
+        journal.record_scene("intro", "clip", scene_num, f"key{scene_num}", str(clip))
+    journal.close()
+    return path
+
+
+def test_replay_restores_recorded_scenes(tmp_path):
+    path = write_journal(tmp_path, [1, 2])
+
+    journal = RunJournal(str(path), resume=True)
+    assert journal.scene_artifact("intro", "clip", 1, "key1") == str(tmp_path / "clip1.mp4")
+    assert journal.scene_artifact("intro", "clip", 2, "other key") is None
+    journal.close()
+
+
+def test_replay_discards_torn_last_line(tmp_path):
+    path = write_journal(tmp_path, [1, 2])
+    intact_size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b'0badf00d {"type": "scene", "script": "in')
+
+    journal = RunJournal(str(path), resume=True)
+    assert len(journal.scenes) == 2
+    journal.record_scene("intro", "clip", 3, "key3", str(tmp_path / "clip1.mp4"))
+    journal.close()
+
+    lines = path.read_bytes().splitlines(keepends=True)
+    assert sum(len(line) for line in lines[:3]) == intact_size
+    assert all(RunJournal._decode(line) for line in lines)
+    assert len(RunJournal(str(path), resume=True).scenes) == 3
+
+
+def test_replay_stops_at_corrupt_checksum(tmp_path):
+    path = write_journal(tmp_path, [1, 2])
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(lines[0] + lines[1] + lines[2].replace(b'"clip"', b'"clop"'))
+
+    journal = RunJournal(str(path), resume=True)
+    assert list(journal.scenes) == [("intro", "clip", 1)]
+    journal.close()
+
+
+def test_missing_artifact_is_not_restored(tmp_path):
+    path = write_journal(tmp_path, [1])
+    (tmp_path / "clip1.mp4").unlink()
+
+    journal = RunJournal(str(path), resume=True)
+    assert journal.scene_artifact("intro", "clip", 1, "key1") is None
+    journal.close()
@@ -0,0 +1,87 @@
+"""Tests for sharing encoded scene clips between scripts."""
+
+import threading
+
+from scene_dedup import SceneClipCache, plan_dedup
+
+
+def test_plan_counts_narrated_scenes_shared_between_scripts():
+    outro = {"heading": "Outro", "content": "Thanks for watching."}
+    plan = plan_dedup({
+        "intro": [
+            {"scene_num": 1, "heading": "Welcome", "content": "Hello."},
+            {"scene_num": 2, **outro},
+            {"scene_num": 3, "heading": "Silent", "content": "  "},
+        ],
+        "pricing": [
+            {"scene_num": 1, "heading": "Plans", "content": "Three tiers."},
+            {"scene_num": 2, **outro},
+        ],
+    })
+
+    assert plan["scenes"] == 4
+    assert plan["unique_scenes"] == 3
+    assert plan["dedup_ratio"] == 1.33
+    assert plan["shared"] == [{"heading": "Outro", "scripts": ["intro", "pricing"], "occurrences": 2}]
+
+
+def test_second_script_reuses_the_encoded_clip(tmp_path):
+    cache = SceneClipCache(str(tmp_path / "cache"))
+    encodes = []
+
+    def encode(target):
+        def run():
+            encodes.append(target.name)
+            target.write_bytes(b"clip")
+            return str(target)
+        return run
+
+    first = tmp_path / "intro_scene02.mp4"
+    second = tmp_path / "pricing_scene02.mp4"
+    assert cache.clip("outro", first, encode(first)) == str(first)
+    assert cache.clip("outro", second, encode(second)) == str(second)
+    other = tmp_path / "pricing_scene01.mp4"
+    cache.clip("plans", other, encode(other))
+
+    assert encodes == ["intro_scene02.mp4", "pricing_scene01.mp4"]
+    assert second.read_bytes() == b"clip"
+    assert cache.summary()["clips_reused"] == 1
+    assert cache.summary()["clips_encoded"] == 2
+
+
+def test_failed_encode_is_not_cached(tmp_path):
+    cache = SceneClipCache(str(tmp_path / "cache"))
+    target = tmp_path / "intro_scene01.mp4"
+
+    assert cache.clip("key", target, lambda: None) is None
+    assert not (tmp_path / "cache" / "key.mp4").exists()
+    assert cache.summary() == {"clips_reused": 0, "clips_encoded": 1, "encode_seconds_saved": 0.0}
+
+
+def test_concurrent_requests_encode_once_and_release_the_key_lock(tmp_path):
+    cache = SceneClipCache(str(tmp_path / "cache"))
+    encodes = []
+    release = threading.Event()
+
+    def encode(target):
+        def run():
+            encodes.append(target)
+            release.wait(5)
+            target.write_bytes(b"clip")
+            return str(target)
+        return run
+
+    targets = [tmp_path / f"script{n}_scene01.mp4" for n in range(3)]
+    threads = [
+        threading.Thread(target=cache.clip, args=("key", target, encode(target)))
+        for target in targets
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(encodes) == 1
+    assert all(target.read_bytes() == b"clip" for target in targets)
+    assert cache._key_locks == {}
@@ -0,0 +1,40 @@
+"""Tests for scene parsing, including the benchmark's synthetic scripts."""
+
+import pytest
+
+from benchmarks.synthetic_scripts import FORMS, write_script
+from script_parser import ScriptParser
+
+
+def parse(path):
+    parser = ScriptParser(str(path))
+    assert parser.load()
+    return parser.parse()
+
+
+@pytest.mark.parametrize("form", FORMS)
+@pytest.mark.parametrize("scene_count", [1, 5, 20])
+def test_synthetic_scripts_parse_to_requested_scenes(tmp_path, form, scene_count):
+    scenes = parse(write_script(tmp_path, form, scene_count, words_per_scene=30))
+
+    assert len(scenes) == scene_count
+    assert [scene["scene_num"] for scene in scenes] == list(range(1, scene_count + 1))
+    assert all(len(scene["content"].split()) >= 30 for scene in scenes)
+
+
+def test_text_without_headings_is_one_scene(tmp_path):
+    path = tmp_path / "notes.md"
+    path.write_text("Short intro.\n\nA second paragraph that is long enough to be a scene on its own.\n")
+
+    [scene] = parse(path)
+    assert scene["heading"] is None
+    assert "Short intro." in scene["content"]
+
+
+def test_text_before_first_heading_is_its_own_scene(tmp_path):
+    path = tmp_path / "mixed.md"
+    path.write_text("Opening words.\n\n## Pricing\n\nFunding rates explained.\n")
+
+    scenes = parse(path)
+    assert [scene["heading"] for scene in scenes] == [None, "Pricing"]
+    assert scenes[1]["content"] == "Funding rates explained."
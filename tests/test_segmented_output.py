@@ -0,0 +1,76 @@
+"""Tests for progressive HLS publishing."""
+
+from segmented_output import HLSPublisher
+
+
+def make_publisher(tmp_path, scene_count):
+    publisher = HLSPublisher(str(tmp_path / "hls"), scene_count)
+
+    def segment(clip_path, prefix, scene_playlist):
+        # Stands in for the FFmpeg HLS job: one segment per clip
+        (publisher.output_dir / f"{prefix}_000.ts").write_bytes(b"ts")
+        scene_playlist.write_text(f"#EXTM3U\n#EXTINF:2.000000,\n{prefix}_000.ts\n#EXT-X-ENDLIST\n")
+        return publisher._read_scene_playlist(scene_playlist)
+
+    publisher._segment = segment
+    return publisher
+
+
+def make_clip(tmp_path, scene_num, content=b"clip"):
+    path = tmp_path / f"scene{scene_num}.mp4"
+    path.write_bytes(content + str(scene_num).encode())
+    return str(path)
+
+
+def segments(publisher, scene_num):
+    return sorted(p.name for p in publisher.output_dir.glob(f"scene{scene_num:02d}_*.ts"))
+
+
+def test_playlist_lists_published_scenes_in_order(tmp_path):
+    publisher = make_publisher(tmp_path, 3)
+    publisher.publish_scene(1, 2, make_clip(tmp_path, 2))
+    assert "scene02" not in publisher.playlist_path.read_text()
+
+    publisher.publish_scene(0, 1, make_clip(tmp_path, 1))
+    playlist = publisher.playlist_path.read_text()
+    assert playlist.index("scene01_") < playlist.index("scene02_")
+    assert "#EXT-X-ENDLIST" not in playlist
+    assert publisher.finalize() is None
+
+    publisher.publish_scene(2, 3, make_clip(tmp_path, 3))
+    assert publisher.finalize() == str(publisher.playlist_path)
+    assert publisher.playlist_path.read_text().endswith("#EXT-X-ENDLIST\n")
+
+
+def test_changed_scene_replaces_only_its_own_segments(tmp_path):
+    publisher = make_publisher(tmp_path, 2)
+    publisher.publish_scene(0, 1, make_clip(tmp_path, 1))
+    publisher.publish_scene(1, 2, make_clip(tmp_path, 2))
+    old_scene1, scene2 = segments(publisher, 1), segments(publisher, 2)
+
+    publisher.publish_scene(0, 1, make_clip(tmp_path, 1, b"edited"))
+
+    assert segments(publisher, 1) != old_scene1
+    assert len(segments(publisher, 1)) == 1
+    assert segments(publisher, 2) == scene2
+
+
+def test_publishing_scene_10_keeps_scene_100(tmp_path):
+    publisher = make_publisher(tmp_path, 120)
+    for scene_num in (100, 101, 110, 10, 11, 1):
+        publisher.publish_scene(scene_num - 1, scene_num, make_clip(tmp_path, scene_num))
+
+    for scene_num in (100, 101, 110, 10, 11, 1):
+        [segment] = segments(publisher, scene_num)
+        assert (publisher.output_dir / segment.replace("_000.ts", ".m3u8")).exists()
+
+
+def test_finalize_removes_segments_of_dropped_scenes(tmp_path):
+    publisher = make_publisher(tmp_path, 1)
+    (publisher.output_dir / "scene02_0123456789ab_000.ts").write_bytes(b"old")
+    publisher.publish_scene(0, 1, make_clip(tmp_path, 1))
+
+    publisher.finalize()
+
+    assert segments(publisher, 2) == []
+    assert len(segments(publisher, 1)) == 1
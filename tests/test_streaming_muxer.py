@@ -0,0 +1,118 @@
+"""Tests for feeding scene clips into the streaming muxer."""
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from streaming_muxer import StreamingMuxer
+
+
+class FakeProcess:
+    """Stands in for the long-running muxer FFmpeg."""
+
+    def __init__(self):
+        self.stdin = SimpleNamespace(flush=lambda: None, close=lambda: None)
+
+    def wait(self, timeout=None):
+        return 0
+
+
+def make_muxer(tmp_path, scene_count, remux_gate=None, **kwargs):
+    muxer = StreamingMuxer(str(tmp_path / "final.mp4"), scene_count, **kwargs)
+    (tmp_path / "final.mp4").write_bytes(b"")
+    fed = []
+
+    def run(cmd, label, media_seconds=None, stdout=None, kind=None):
+        if remux_gate:
+            remux_gate.wait(5)
+        fed.append((cmd[cmd.index("-i") + 1], float(cmd[cmd.index("-output_ts_offset") + 1])))
+        return SimpleNamespace(returncode=0, stderr="")
+
+    muxer.progress = SimpleNamespace(run=run)
+    muxer._process = FakeProcess()
+    muxer._feeder = threading.Thread(target=muxer._feed_in_order, daemon=True)
+    muxer._feeder.start()
+    return muxer, fed
+
+
+def make_clip(tmp_path, index):
+    path = tmp_path / f"clip{index}.mp4"
+    path.write_bytes(b"clip")
+    return str(path)
+
+
+def test_clips_are_fed_in_order_at_their_real_offsets(tmp_path):
+    muxer, fed = make_muxer(tmp_path, 3)
+    clips = [make_clip(tmp_path, i) for i in range(3)]
+
+    muxer.add(2, clips[2], 3.0)
+    muxer.add(0, clips[0], 2.021)
+    muxer.add(1, clips[1], 1.5)
+    muxer.finish()
+
+    assert fed == [(clips[0], 0.0), (clips[1], 2.021), (clips[2], 3.521)]
+    assert muxer.position == 6.521
+    assert muxer.fed == 3
+
+
+def test_failed_scene_is_skipped(tmp_path):
+    muxer, fed = make_muxer(tmp_path, 3)
+    clips = [make_clip(tmp_path, i) for i in range(3)]
+
+    muxer.add(0, clips[0], 2.0)
+    muxer.add(1, None, None)
+    muxer.add(2, clips[2], 1.0)
+    muxer.finish()
+
+    assert fed == [(clips[0], 0.0), (clips[2], 2.0)]
+    assert not Path(clips[0]).exists() and not Path(clips[2]).exists()
+
+
+def test_handing_over_a_clip_does_not_wait_for_a_remux(tmp_path):
+    gate = threading.Event()
+    muxer, fed = make_muxer(tmp_path, 2, remux_gate=gate)
+    clips = [make_clip(tmp_path, i) for i in range(2)]
+
+    muxer.add(0, clips[0], 1.0)
+    muxer.add(1, clips[1], 1.0)
+    assert fed == []
+
+    gate.set()
+    assert muxer.finish()
+    assert [path for path, _ in fed] == clips
+
+
+def test_clips_after_a_missing_scene_are_removed(tmp_path):
+    muxer, fed = make_muxer(tmp_path, 3)
+    clips = [make_clip(tmp_path, i) for i in range(3)]
+
+    muxer.add(0, clips[0], 1.0)
+    muxer.add(2, clips[2], 1.0)
+    muxer.finish()
+
+    assert fed == [(clips[0], 0.0)]
+    assert not Path(clips[2]).exists()
+
+
+def test_unknown_duration_stops_streaming(tmp_path):
+    muxer, fed = make_muxer(tmp_path, 2)
+    clips = [make_clip(tmp_path, i) for i in range(2)]
+
+    muxer.add(0, clips[0], None)
+    muxer.add(1, clips[1], 1.0)
+
+    assert not muxer.finish()
+    assert fed == []
+    assert muxer.failed
+
+
+def test_kept_clips_stay_on_disk(tmp_path):
+    muxer, fed = make_muxer(tmp_path, 2, keep_clips=True)
+    clips = [make_clip(tmp_path, i) for i in range(2)]
+
+    muxer.add(0, clips[0], 1.0)
+    muxer.add(1, clips[1], 1.0)
+    muxer.finish()
+
+    assert len(fed) == 2
+    assert all(Path(clip).exists() for clip in clips)
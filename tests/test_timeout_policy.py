@@ -0,0 +1,56 @@
+"""Tests for sizing job timeouts from measured throughput."""
+
+from timeout_policy import TimeoutPolicy
+
+
+def test_default_rate_until_enough_samples():
+    policy = TimeoutPolicy()
+
+    assert policy.deadline("encode", 10.0) == 80.0
+    assert policy.deadline("encode", None) == TimeoutPolicy.FALLBACK_TIMEOUTS["encode"]
+    policy.observe("encode", 10.0, 2.0)
+    policy.observe("encode", 10.0, 2.0)
+    assert policy.deadline("encode", 10.0) == 80.0
+
+    policy.observe("encode", 10.0, 2.0)
+    # 20s startup + 10s of media at 0.2 s/s, four times over
+    assert policy.deadline("encode", 10.0) == 28.0
+
+
+def test_encode_rates_are_normalised_to_1080p():
+    policy = TimeoutPolicy()
+    for _ in range(3):
+        policy.observe("encode", 10.0, 2.0, "960x540")
+
+    # A quarter of the pixels took 2s, so 1080p is expected to take 8s
+    assert policy.deadline("encode", 10.0, "1920x1080") == 20.0 + 8.0 * 4
+    assert policy.deadline("encode", 10.0, "960x540") == 20.0 + 2.0 * 4
+
+
+def test_slow_end_of_history_sets_the_rate():
+    policy = TimeoutPolicy()
+    for wall in [1.0] * 9 + [5.0]:
+        policy.observe("remux", 10.0, wall)
+
+    assert policy.deadline("remux", 10.0) == 10.0 + 5.0 * 4
+    policy.observe("remux", 0, 3.0)
+    assert len(policy.history["remux"]) == 10
+
+
+def test_history_persists_between_runs(tmp_path):
+    history = tmp_path / "logs" / "throughput.json"
+    policy = TimeoutPolicy(str(history))
+    for _ in range(TimeoutPolicy.HISTORY_SIZE + 5):
+        policy.observe("tts", 100, 1.0)
+    policy.save()
+
+    restored = TimeoutPolicy(str(history))
+    assert len(restored.history["tts"]) == TimeoutPolicy.HISTORY_SIZE
+    assert restored.deadline("tts", 100) == policy.deadline("tts", 100) == 14.0
+
+
+def test_unreadable_history_starts_empty(tmp_path):
+    history = tmp_path / "throughput.json"
+    history.write_text("{not json")
+
+    assert TimeoutPolicy(str(history)).history == {}
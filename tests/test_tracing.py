@@ -0,0 +1,59 @@
+"""Tests for recording spans as Chrome trace events."""
+
+import json
+import threading
+
+from tracing import Tracer, in_current_context
+
+
+def test_export_writes_complete_events_with_their_hierarchy(tmp_path):
+    tracer = Tracer()
+    with tracer.span("run", "run"):
+        with tracer.span("intro", "script", scenes=2) as attributes:
+            attributes["success"] = True
+
+    path = tracer.export(str(tmp_path / "trace.json"))
+    trace = json.loads((tmp_path / "trace.json").read_text())
+
+    assert path == str(tmp_path / "trace.json")
+    assert trace["displayTimeUnit"] == "ms"
+    metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    assert {e["name"] for e in metadata} == {"process_name", "thread_name"}
+    script, run = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert (script["name"], script["cat"]) == ("intro", "script")
+    assert script["args"] == {"span_id": 2, "parent_id": 1, "scenes": 2, "success": True}
+    assert run["args"] == {"span_id": 1, "parent_id": None}
+    assert run["ts"] <= script["ts"]
+    assert script["ts"] + script["dur"] <= run["ts"] + run["dur"]
+
+
+def test_worker_thread_spans_nest_under_the_submitting_span():
+    tracer = Tracer()
+
+    def encode():
+        with tracer.span("encode", "scene"):
+            pass
+
+    with tracer.span("video", "stage"):
+        worker = threading.Thread(target=in_current_context(encode), name="encoder-0")
+        worker.start()
+        worker.join()
+
+    scene, stage = tracer._events
+    assert scene["args"]["parent_id"] == stage["args"]["span_id"]
+    assert scene["tid"] != stage["tid"]
+    assert tracer._thread_names[scene["tid"]] == "encoder-0"
+
+
+def test_rollup_groups_durations_by_category_and_name():
+    tracer = Tracer()
+    for _ in range(3):
+        with tracer.span("ffmpeg", "subprocess"):
+            pass
+    with tracer.span("intro", "script"):
+        pass
+
+    rollup = tracer.rollup()
+
+    assert list(rollup) == ["subprocess"]
+    assert rollup["subprocess"]["ffmpeg"]["count"] == 3
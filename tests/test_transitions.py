@@ -0,0 +1,48 @@
+"""Tests for placing crossfade windows between scene clips."""
+
+from transitions import TransitionRenderer
+
+
+def render(tmp_path, durations, keyframes):
+    renderer = TransitionRenderer(fps=30, duration=0.5)
+    clips = [str(tmp_path / f"intro_scene{n + 1:02d}.mp4") for n in range(len(durations))]
+    runs = []
+
+    def run(cmd, label, media_seconds, kind):
+        runs.append({"cmd": cmd, "label": label, "media_seconds": media_seconds, "kind": kind})
+        return True
+
+    renderer._get_duration = lambda clip: durations[clips.index(clip)]
+    renderer._keyframe_times = lambda clip: keyframes[clips.index(clip)]
+    renderer._run = run
+    return renderer.render(clips, tmp_path), runs
+
+
+def test_crossfade_window_spans_keyframes_around_the_padding(tmp_path):
+    # Scene 1 narrates for 10s and carries 0.5s of padding
+    pieces, runs = render(tmp_path, [10.5, 8.0], [[0.0, 4.0, 8.0], [0.0, 2.0, 4.0, 6.0]])
+
+    assert [p.rsplit("/", 1)[1] for p in pieces] == [
+        "intro_scene01_body.mp4", "intro_scene01_transition.mp4", "intro_scene02_body.mp4"
+    ]
+    first_body, window, second_body = runs
+    assert first_body["cmd"][first_body["cmd"].index("-t") + 1] == "8.000000"
+    assert second_body["cmd"][second_body["cmd"].index("-ss") + 1] == "2.000000"
+
+    cmd = window["cmd"]
+    assert cmd[cmd.index("-ss") + 1] == "8.000000"
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    # 2.5s of tail minus the fade leaves 2s of outgoing narration
+    assert "xfade=transition=fade:duration=0.500000:offset=2.000000" in graph
+    assert "[0:a]atrim=0:2.000000" in graph
+    assert "[1:a]atrim=0:2.000000" in graph
+    assert window["media_seconds"] == 4.0
+
+
+def test_boundary_without_keyframe_room_becomes_a_cut(tmp_path):
+    pieces, runs = render(tmp_path, [10.5, 8.0], [[0.0, 4.0, 8.0], [0.0]])
+
+    assert len(pieces) == 2
+    assert all(run["kind"] == "remux" for run in runs)
+    # The padding is still dropped from the outgoing scene
+    assert runs[0]["cmd"][runs[0]["cmd"].index("-t") + 1] == "10.000000"
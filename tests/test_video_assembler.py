@@ -0,0 +1,97 @@
+"""Tests for encoding scene clips and joining them into the video."""
+
+import threading
+
+import pytest
+
+from encoder_budget import EncoderBudget
+from video_assembler import VideoAssembler
+
+DURATIONS = [1.0, 5.0, 3.0, 4.0]
+
+
+def encode_scenes(tmp_path, max_jobs, streamed):
+    assembler = VideoAssembler(str(tmp_path), encoder_budget=EncoderBudget(cpu_budget=4, max_jobs=max_jobs))
+    components = [{
+        "scene_num": index + 1,
+        "audio_path": str(tmp_path / f"scene{index + 1}.wav"),
+        "audio_duration": duration,
+        "visual_path": str(tmp_path / f"scene{index + 1}.png"),
+    } for index, duration in enumerate(DURATIONS)]
+    started, completed = [], []
+    lock = threading.Lock()
+
+    def produce(component, script_name, threads=0):
+        with lock:
+            started.append(component["scene_num"])
+        return str(tmp_path / f"{script_name}_scene{component['scene_num']:02d}.mp4")
+
+    def on_complete(index, clip):
+        with lock:
+            completed.append(index)
+
+    assembler._produce_scene_clip = produce
+    clips = assembler._encode_scenes(components, "intro", on_complete=on_complete if streamed else None)
+    assert len(clips) == len(DURATIONS)
+    return started, completed
+
+
+def test_batch_encode_starts_longest_scene_first(tmp_path):
+    started, _ = encode_scenes(tmp_path, max_jobs=1, streamed=False)
+    assert started == [2, 4, 3, 1]
+
+
+def test_streamed_clips_are_encoded_in_scene_order(tmp_path):
+    started, completed = encode_scenes(tmp_path, max_jobs=1, streamed=True)
+    assert started == [1, 2, 3, 4]
+    assert completed == [0, 1, 2, 3]
+
+
+def test_parallel_streamed_encode_starts_in_scene_order(tmp_path):
+    started, completed = encode_scenes(tmp_path, max_jobs=2, streamed=True)
+    assert sorted(completed) == [0, 1, 2, 3]
+    assert started[:2] in ([1, 2], [2, 1])
+
+
+def test_failed_scene_does_not_stop_the_others(tmp_path):
+    assembler = VideoAssembler(str(tmp_path), encoder_budget=EncoderBudget(cpu_budget=4, max_jobs=2))
+    components = [{
+        "scene_num": index + 1,
+        "audio_path": str(tmp_path / f"scene{index + 1}.wav"),
+        "audio_duration": duration,
+        "visual_path": str(tmp_path / f"scene{index + 1}.png"),
+    } for index, duration in enumerate(DURATIONS)]
+    completed = {}
+
+    def produce(component, script_name, threads=0):
+        if component["scene_num"] == 3:
+            raise OSError("disk full")
+        return str(tmp_path / f"{script_name}_scene{component['scene_num']:02d}.mp4")
+
+    def on_complete(index, clip):
+        completed[index] = clip
+
+    assembler._produce_scene_clip = produce
+    clips = assembler._encode_scenes(components, "intro", on_complete=on_complete)
+
+    assert len(clips) == 3
+    assert completed[2] is None
+    assert sorted(completed) == [0, 1, 2, 3]
+    jobs = {job["scene_num"]: job for job in assembler.encode_stats["jobs"]}
+    assert sorted(jobs) == [1, 2, 3, 4]
+    assert not jobs[3]["success"]
+    assert all(jobs[n]["success"] for n in (1, 2, 4))
+
+
+@pytest.mark.parametrize("keep", [True, False])
+def test_single_clip_becomes_the_video(tmp_path, keep):
+    assembler = VideoAssembler(str(tmp_path), keep_scene_clips=keep)
+    clip = tmp_path / "intro_scene01.mp4"
+    clip.write_bytes(b"clip")
+    output = tmp_path / "intro.mp4"
+    output.write_bytes(b"previous render")
+
+    assert assembler._concatenate_videos([str(clip)], str(output))
+
+    assert output.read_bytes() == b"clip"
+    assert clip.exists() == keep
@@ -0,0 +1,107 @@
+"""Tests for the SQLite work queue."""
+
+import time
+from types import SimpleNamespace
+
+from work_queue import WorkQueue, enqueue_scripts
+
+SETTINGS = "settings"
+SCENES = [
+    {"scene_num": 1, "content": "First scene."},
+    {"scene_num": 2, "content": "Second scene."},
+]
+
+
+def open_queue(tmp_path, **kwargs):
+    return WorkQueue(str(tmp_path / "queue.db"), **kwargs)
+
+
+def test_scene_jobs_run_before_assembly(tmp_path):
+    queue = open_queue(tmp_path)
+    assert queue.add_script("intro", "key", SETTINGS, SCENES) == 3
+
+    first = queue.claim("w1", SETTINGS)
+    second = queue.claim("w2", SETTINGS)
+    assert [first["kind"], second["kind"]] == ["scene", "scene"]
+    assert queue.claim("w3", SETTINGS) is None
+
+    assert queue.complete(first["id"], "w1", {"path": "a"})
+    assert queue.claim("w3", SETTINGS) is None
+    assert queue.complete(second["id"], "w2", {"path": "b"})
+
+    assembly = queue.claim("w3", SETTINGS)
+    assert assembly["kind"] == "assembly"
+    assert assembly["payload"]["scenes"] == SCENES
+    assert queue.results("key", "scene") == {1: {"path": "a"}, 2: {"path": "b"}}
+
+
+def test_claims_only_match_settings(tmp_path):
+    queue = open_queue(tmp_path)
+    queue.add_script("intro", "key", SETTINGS, SCENES)
+    assert queue.claim("w1", "other settings") is None
+    assert queue.pending(SETTINGS) == 3
+
+
+def test_expired_lease_is_requeued(tmp_path):
+    queue = open_queue(tmp_path, lease_seconds=0.01)
+    queue.add_script("intro", "key", SETTINGS, SCENES[:1])
+    job = queue.claim("gone", SETTINGS)
+    time.sleep(0.05)
+
+    retry = queue.claim("w2", SETTINGS)
+    assert retry["id"] == job["id"]
+    assert retry["attempts"] == 2
+    assert not queue.complete(job["id"], "gone", {})
+    assert queue.complete(retry["id"], "w2", {"path": "a"})
+
+
+def test_failure_cascades_to_later_phases(tmp_path):
+    queue = open_queue(tmp_path, max_attempts=2)
+    queue.add_script("intro", "key", SETTINGS, SCENES)
+
+    job = queue.claim("w1", SETTINGS)
+    queue.fail(job["id"], "w1", "encode failed")
+    job = queue.claim("w1", SETTINGS)
+    assert job["attempts"] == 2
+    queue.fail(job["id"], "w1", "encode failed")
+
+    [status] = queue.status()
+    assert status["scenes"]["failed"] == 1
+    assert status["scenes"]["queued"] == 1
+    assert status["assembly"] == "failed"
+
+    other = queue.claim("w1", SETTINGS)
+    assert other["kind"] == "scene" and other["id"] != job["id"]
+    queue.complete(other["id"], "w1", {})
+    assert queue.claim("w1", SETTINGS) is None
+
+
+def test_new_version_cancels_queued_jobs(tmp_path):
+    queue = open_queue(tmp_path)
+    queue.add_script("intro", "old", SETTINGS, SCENES)
+    queue.add_script("intro", "new", SETTINGS, SCENES)
+
+    [status] = queue.status()
+    assert status["script_key"] == "new"
+    assert status["scenes"]["queued"] == 2
+    assert queue.pending(SETTINGS) == 3
+
+
+def test_scripts_with_identical_text_get_their_own_jobs(tmp_path):
+    script_dir = tmp_path / "scripts"
+    script_dir.mkdir()
+    text = "# Demo\n\n## Scene 1\n\nSame words.\n\n## Scene 2\n\nMore words.\n"
+    for name in ("alpha", "delta"):
+        (script_dir / f"{name}.md").write_text(text)
+    orchestrator = SimpleNamespace(
+        settings_key=lambda: SETTINGS, script_dir=str(script_dir), script_pattern="*.md", demo_url=None
+    )
+    queue = open_queue(tmp_path)
+
+    summary = enqueue_scripts(orchestrator, queue)
+
+    assert summary["scripts"] == 2
+    statuses = {status["script"]: status for status in queue.status()}
+    assert set(statuses) == {"alpha", "delta"}
+    assert statuses["alpha"]["script_key"] != statuses["delta"]["script_key"]
+    assert summary["jobs"] == 2 * (sum(statuses["alpha"]["scenes"].values()) + 1)